@@ -0,0 +1,7 @@
+import logging
+
+from app.infrastructure.servidor import executar
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    executar()
@@ -1,6 +1,8 @@
 from pydantic import BaseModel, EmailStr, constr, field_validator
 from typing import Optional
 
+from app.adapters.utils.cpf import normalizar_cpf
+
 class ClienteCreateSchema(BaseModel):
     nome: constr(min_length=3, max_length=100)
     email: EmailStr
@@ -12,6 +14,10 @@ class ClienteCreateSchema(BaseModel):
         if "<" in v or ">" in v:
             raise ValueError("Nome não pode conter caracteres inválidos como '<' ou '>'.")
         return v
+
+    @field_validator("cpf", mode="before")
+    def cpf_somente_digitos(cls, v):
+        return normalizar_cpf(v) if isinstance(v, str) else v
     
 class ClienteUpdateSchema(BaseModel):
     nome: Optional[constr(min_length=3, max_length=100)] = None
@@ -23,4 +29,8 @@ class ClienteUpdateSchema(BaseModel):
     def nome_nao_pode_conter_tags(cls, v):
         if v and ("<" in v or ">" in v):
             raise ValueError("Nome não pode conter caracteres inválidos como '<' ou '>'.")
-        return v
\ No newline at end of file
+        return v
+
+    @field_validator("cpf", mode="before")
+    def cpf_somente_digitos(cls, v):
+        return normalizar_cpf(v) if isinstance(v, str) else v
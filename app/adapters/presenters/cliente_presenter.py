@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from app.adapters.schemas.cliente import ClienteResponseSchema
+from typing import Optional
+from app.adapters.schemas.cliente import ClienteResponseSchema, ClienteImportacaoSchema
 
 class ClienteResponse(BaseModel):
     status: str
@@ -7,4 +8,19 @@ class ClienteResponse(BaseModel):
 
 class ClienteResponseList(BaseModel):
     status: str
-    data: list[ClienteResponseSchema]
\ No newline at end of file
+    data: list[ClienteResponseSchema]
+    next_cursor: Optional[str] = None
+
+class ClienteImportacaoResponse(BaseModel):
+    status: str
+    data: ClienteImportacaoSchema
+
+def serializar_cliente(cliente) -> dict:
+
+    return {
+        "id": cliente.id,
+        "nome": cliente.nome,
+        "email": cliente.email,
+        "telefone": cliente.telefone,
+        "cpf": cliente.cpf
+    }
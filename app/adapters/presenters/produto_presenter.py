@@ -1,6 +1,7 @@
 from pydantic import BaseModel
+from typing import Optional
 
-from app.adapters.schemas.produto import ProdutoResponseSchema
+from app.adapters.schemas.produto import ProdutoResponseSchema, ProdutoLoteErroSchema, ProdutoSugestaoSchema
 
 class ProdutoResponse(BaseModel):
     status: str
@@ -8,4 +9,31 @@ class ProdutoResponse(BaseModel):
 
 class ProdutoResponseList(BaseModel):
     status: str
-    data: list[ProdutoResponseSchema]
\ No newline at end of file
+    data: list[ProdutoResponseSchema]
+    next_cursor: Optional[str] = None
+
+class ProdutoSugestaoResponseList(BaseModel):
+    status: str
+    data: list[ProdutoSugestaoSchema]
+
+class ProdutoLoteResponse(BaseModel):
+    status: str
+    data: list[ProdutoResponseSchema]
+    errors: list[ProdutoLoteErroSchema] = []
+
+def serializar_cardapio(grupos: list[tuple[tuple[int, str], list[dict]]]) -> dict:
+
+    return {
+        "status": "sucess",
+        "data": [{"categoria": {"id": id, "nome": nome}, "produtos": produtos} for (id, nome), produtos in grupos]
+    }
+
+def serializar_produto(produto, categoria_id: int, categoria_nome: str) -> dict:
+    # mesmo formato de ProdutoResponseSchema, montado direto do ORM sem validação
+    return {
+        "id": produto.id,
+        "nome": produto.nome,
+        "descricao": produto.descricao,
+        "preco": format(produto.preco, ".2f"),
+        "categoria": {"id": categoria_id, "nome": categoria_nome}
+    }
@@ -8,4 +8,14 @@ class ClienteResponseSchema(BaseModel):
     telefone: Optional[str]
     cpf: Optional[str]
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ClienteImportacaoErroSchema(BaseModel):
+    line: int
+    message: str
+
+class ClienteImportacaoSchema(BaseModel):
+    inserted: int
+    updated: int
+    rejected: int
+    errors: list[ClienteImportacaoErroSchema] = []
@@ -15,4 +15,12 @@ class ProdutoResponseSchema(BaseModel):
     def formatar_preco(self, preco: Decimal) -> str:
         return format(preco, ".2f")
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ProdutoSugestaoSchema(BaseModel):
+    id: int
+    nome: str
+
+class ProdutoLoteErroSchema(BaseModel):
+    index: int
+    message: str
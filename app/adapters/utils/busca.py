@@ -0,0 +1,31 @@
+import re
+import unicodedata
+
+# mesmas palavras que o dicionário "portuguese" do Postgres descarta e que aparecem em nomes de produto
+STOPWORDS = frozenset({"a", "o", "as", "os", "de", "da", "do", "das", "dos", "e", "em", "com", "sem", "para", "no", "na", "um", "uma"})
+
+def normalizar(texto: str) -> str:
+    # equivalente ao unaccent(lower(...)) usado nos índices do Postgres
+    decomposto = unicodedata.normalize("NFKD", texto.lower())
+
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+def palavras(texto: str) -> list[str]:
+
+    return re.findall(r"\w+", normalizar(texto))
+
+def termos(texto: str) -> list[str]:
+
+    return [termo for termo in palavras(texto) if termo not in STOPWORDS]
+
+def trigramas(termo: str) -> frozenset[str]:
+    # como o pg_trgm: a palavra é completada com dois espaços antes e um depois
+    palavra = f"  {termo} "
+
+    return frozenset(palavra[i:i + 3] for i in range(len(palavra) - 2))
+
+def similaridade(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+
+    return len(a & b) / len(a | b)
@@ -0,0 +1,121 @@
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+IDENTIDADE = "identity"
+
+def comprimir_gzip(dados: bytes, nivel: int) -> bytes:
+    # mtime=0: mesma entrada gera os mesmos bytes, em qualquer worker
+    return gzip.compress(dados, compresslevel=nivel, mtime=0)
+
+def comprimir_brotli(dados: bytes, qualidade: int) -> bytes:
+
+    return brotli.compress(dados, quality=qualidade)
+
+def codificacoes_aceitas(accept_encoding: str | None) -> dict[str, float]:
+    aceitas = {}
+
+    for item in (accept_encoding or "").split(","):
+        nome, _, parametros = item.strip().partition(";")
+        nome = nome.strip().lower()
+
+        if not nome:
+            continue
+
+        q = 1.0
+        parametro = parametros.strip().replace(" ", "")
+
+        if parametro.startswith("q="):
+            try:
+                q = float(parametro[2:])
+            except ValueError:
+                q = 0.0
+
+        aceitas[nome] = q
+
+    return aceitas
+
+# disponiveis em ordem de preferência do servidor; empate de q fica com a preferida
+def escolher_codificacao(accept_encoding: str | None, disponiveis) -> str:
+    aceitas = codificacoes_aceitas(accept_encoding)
+    curinga = aceitas.get("*", 0.0)
+    escolhida, maior = IDENTIDADE, 0.0
+
+    for codificacao in disponiveis:
+        q = aceitas.get(codificacao, curinga)
+
+        if q > maior:
+            escolhida, maior = codificacao, q
+
+    return escolhida
+
+# codificações com o módulo instalado, em ordem de preferência do servidor
+def codificacoes_disponiveis() -> list[str]:
+    disponiveis = []
+
+    if zstandard is not None:
+        disponiveis.append("zstd")
+
+    if brotli is not None:
+        disponiveis.append("br")
+
+    disponiveis.append("gzip")
+
+    return disponiveis
+
+# compressão incremental: cada parte() devolve bytes já decodificáveis pelo cliente (flush de bloco),
+# para que as linhas de um NDJSON não fiquem presas no buffer do compressor
+class CompressorGzip:
+
+    def __init__(self, nivel: int):
+        # wbits 31: cabeçalho gzip com mtime 0
+        self._compressor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+
+    def parte(self, dados: bytes) -> bytes:
+
+        return self._compressor.compress(dados) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def fim(self, dados: bytes = b"") -> bytes:
+
+        return self._compressor.compress(dados) + self._compressor.flush()
+
+class CompressorBrotli:
+
+    def __init__(self, qualidade: int):
+        self._compressor = brotli.Compressor(quality=qualidade)
+
+    def parte(self, dados: bytes) -> bytes:
+
+        return self._compressor.process(dados) + self._compressor.flush()
+
+    def fim(self, dados: bytes = b"") -> bytes:
+
+        return self._compressor.process(dados) + self._compressor.finish()
+
+class CompressorZstd:
+
+    def __init__(self, nivel: int):
+        self._compressor = zstandard.ZstdCompressor(level=nivel).compressobj()
+
+    def parte(self, dados: bytes) -> bytes:
+
+        return self._compressor.compress(dados) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def fim(self, dados: bytes = b"") -> bytes:
+
+        return self._compressor.compress(dados) + self._compressor.flush()
+
+COMPRESSORES = {"gzip": CompressorGzip, "br": CompressorBrotli, "zstd": CompressorZstd}
+
+def compressor(codificacao: str, nivel: int):
+
+    return COMPRESSORES[codificacao](nivel)
@@ -0,0 +1,14 @@
+import re
+
+NAO_DIGITOS = re.compile(r"\D")
+
+def normalizar_cpf(cpf: str | None) -> str | None:
+    # o totem pode enviar o cpf mascarado (123.456.789-01); no banco ele fica só com os dígitos
+    if cpf is None:
+        return None
+
+    return NAO_DIGITOS.sub("", cpf)
+
+def cpf_valido(cpf: str | None) -> bool:
+
+    return cpf is not None and len(cpf) == 11 and cpf.isdigit()
@@ -0,0 +1,19 @@
+from fastapi import Request, Response, status
+
+def etag_confere(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match usa comparação fraca (RFC 9110 13.1.2)
+    candidatos = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+    return etag in candidatos
+
+def nao_modificado(etag: str) -> Response:
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import tempfile
+
+from app.infrastructure import config
+
+FORMATOS = ("csv", "ndjson")
+
+def detectar_formato(content_type: str | None = None, nome_arquivo: str | None = None) -> str:
+    referencia = (content_type or nome_arquivo or "").lower()
+
+    if "ndjson" in referencia or "jsonl" in referencia or referencia.endswith("json"):
+        return "ndjson"
+
+    if "csv" in referencia:
+        return "csv"
+
+    raise ValueError("Formato não suportado, envie CSV ou NDJSON")
+
+async def receber_arquivo(request):
+    # o corpo vai para um arquivo temporário (em memória até IMPORT_SPOOL_MAXIMO) sem ser lido inteiro
+    arquivo = tempfile.SpooledTemporaryFile(max_size=config.IMPORT_SPOOL_MAXIMO)
+
+    async for chunk in request.stream():
+        arquivo.write(chunk)
+
+    arquivo.seek(0)
+
+    return arquivo
+
+def ler_registros(arquivo, formato: str):
+    # gera (linha, registro, erro) sem carregar o arquivo em memória
+    texto = io.TextIOWrapper(arquivo, encoding="utf-8-sig", newline="")
+
+    if formato == "csv":
+        leitor = csv.DictReader(texto)
+
+        for registro in leitor:
+            yield leitor.line_num, {campo: valor or None for campo, valor in registro.items() if campo}, None
+
+        return
+
+    for linha, conteudo in enumerate(texto, start=1):
+        if not conteudo.strip():
+            continue
+
+        try:
+            registro = json.loads(conteudo)
+        except ValueError:
+            yield linha, None, "JSON inválido"
+            continue
+
+        if isinstance(registro, dict):
+            yield linha, registro, None
+        else:
+            yield linha, None, "Cada linha deve ser um objeto JSON"
+
+def em_lotes(registros, tamanho: int):
+    lote = []
+
+    for registro in registros:
+        lote.append(registro)
+
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+
+    if lote:
+        yield lote
+
+class CsvStream:
+    # arquivo somente leitura que produz CSV sob demanda, consumido pelo COPY ... FROM STDIN
+    def __init__(self, registros, colunas: tuple):
+        self._registros = iter(registros)
+        self._colunas = colunas
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pendente = ""
+
+    def read(self, tamanho: int = -1) -> str:
+        while tamanho < 0 or len(self._pendente) < tamanho:
+            registro = next(self._registros, None)
+
+            if registro is None:
+                break
+
+            self._writer.writerow([registro[coluna] for coluna in self._colunas])
+            self._pendente += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+        if tamanho < 0:
+            tamanho = len(self._pendente)
+
+        dados, self._pendente = self._pendente[:tamanho], self._pendente[tamanho:]
+
+        return dados
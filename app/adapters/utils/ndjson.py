@@ -0,0 +1,28 @@
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+def ndjson_chunks(linhas, linhas_por_chunk: int = 500):
+    # agrupa linhas para não gerar um write no socket por registro
+    buffer = []
+
+    for linha in linhas:
+        buffer.append(linha)
+
+        if len(buffer) >= linhas_por_chunk:
+            yield "".join(buffer).encode()
+            buffer.clear()
+
+    if buffer:
+        yield "".join(buffer).encode()
+
+async def ndjson_chunks_async(linhas, linhas_por_chunk: int = 500):
+    buffer = []
+
+    async for linha in linhas:
+        buffer.append(linha)
+
+        if len(buffer) >= linhas_por_chunk:
+            yield "".join(buffer).encode()
+            buffer.clear()
+
+    if buffer:
+        yield "".join(buffer).encode()
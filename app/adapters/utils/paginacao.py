@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+
+from app.infrastructure import config
+
+def encode_cursor(ultimo_id: int) -> str:
+    payload = json.dumps({"id": ultimo_id}, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if not cursor:
+        return None
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ultimo_id = json.loads(payload)["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Cursor inválido")
+
+    if not isinstance(ultimo_id, int) or isinstance(ultimo_id, bool):
+        raise ValueError("Cursor inválido")
+
+    return ultimo_id
+
+# a busca é ordenada por relevância, sem chave estável para keyset: o cursor guarda a posição
+def encode_cursor_posicao(posicao: int) -> str:
+    payload = json.dumps({"pos": posicao}, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+def decode_cursor_posicao(cursor: str | None) -> int:
+    if not cursor:
+        return 0
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        posicao = json.loads(payload)["pos"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Cursor inválido")
+
+    if not isinstance(posicao, int) or isinstance(posicao, bool) or posicao < 0:
+        raise ValueError("Cursor inválido")
+
+    return posicao
+
+def tamanho_pagina(limit: int | None) -> int:
+    if limit is None:
+        return config.PAGINACAO_LIMITE_PADRAO
+
+    return max(1, min(limit, config.PAGINACAO_LIMITE_MAXIMO))
@@ -0,0 +1,46 @@
+from fastapi import Response
+from pydantic_core import to_json
+
+from app.infrastructure import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def resposta_rapida() -> bool:
+
+    return config.RESPONSE_MODE == "fast"
+
+def json_bytes(conteudo) -> bytes:
+    # orjson quando instalado; o serializador do pydantic-core é o fallback, também sem passar por dicts intermediários
+    if orjson is not None:
+        return orjson.dumps(conteudo)
+
+    return to_json(conteudo)
+
+class RespostaJSON(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+
+        return json_bytes(content)
+
+def apresentar(modelo, status_code: int = 200, **campos):
+    # validated: o presenter é validado aqui e de novo pelo response_model do FastAPI
+    # fast: o JSON é escrito uma única vez a partir dos dicts do use case e o response_model é ignorado
+    if not resposta_rapida():
+        return modelo(**campos)
+
+    padroes = {nome: campo.get_default() for nome, campo in modelo.model_fields.items() if not campo.is_required()}
+
+    return RespostaJSON({**padroes, **campos}, status_code=status_code)
+
+def mesclar_headers(response: Response, resultado):
+    # headers definidos no Response injetado não são copiados quando a rota devolve outro Response
+    if isinstance(resultado, Response):
+        for nome, valor in response.headers.items():
+            if nome not in ("content-length", "content-type"):
+                resultado.headers[nome] = valor
+
+    return resultado
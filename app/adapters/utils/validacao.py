@@ -0,0 +1,5 @@
+from pydantic import ValidationError
+
+def mensagem_validacao(erro: ValidationError) -> str:
+
+    return "; ".join(f"{'.'.join(map(str, item['loc'])) or 'item'}: {item['msg']}" for item in erro.errors())
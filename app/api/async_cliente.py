@@ -0,0 +1,314 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.infrastructure.db.database import get_async_db, get_async_db_leitura
+from app.gateways.async_cliente_gateway import AsyncClienteGateway
+from app.adapters.presenters.cliente_presenter import ClienteResponse, ClienteImportacaoResponse
+from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+from app.adapters.utils.paginacao import tamanho_pagina
+from app.adapters.utils.importacao import receber_arquivo
+from app.controllers.async_cliente_controller import AsyncClienteController
+
+router = APIRouter(prefix="/clientes", tags=["clientes"])
+
+async def get_cliente_gateway(database: AsyncSession = Depends(get_async_db), leitura: AsyncSession | None = Depends(get_async_db_leitura)) -> AsyncClienteGateway:
+    
+    return AsyncClienteGateway(db_session=database, leitura_session=leitura)
+
+async def get_cliente_gateway_primario(database: AsyncSession = Depends(get_async_db)) -> AsyncClienteGateway:
+
+    return AsyncClienteGateway(db_session=database)
+
+@router.post("/", response_model=ClienteResponse, status_code=status.HTTP_201_CREATED, responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao criar cliente"
+                }
+            }
+        }
+    },
+    409: {
+        "description": "CPF ou email já cadastrado",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "message": "Já existe cliente cadastrado com este cpf",
+                        "fields": ["cpf"]
+                    }
+                }
+            }
+        }
+    }
+})
+async def criar_cliente(cliente_data: ClienteCreateSchema, gateway: AsyncClienteGateway = Depends(get_cliente_gateway_primario)):
+    try:
+        
+        return await (AsyncClienteController(db_session=gateway)
+                    .criar_cliente(cliente_data))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/import", response_model=ClienteImportacaoResponse, responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao importar clientes"
+                }
+            }
+        }
+    },
+    415: {
+        "description": "Formato não suportado",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Formato não suportado, envie CSV ou NDJSON"
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string"}},
+            "application/x-ndjson": {"schema": {"type": "string"}}
+        }
+    }
+})
+async def importar_clientes(request: Request, gateway: AsyncClienteGateway = Depends(get_cliente_gateway_primario)):
+    arquivo = await receber_arquivo(request)
+
+    try:
+
+        return await AsyncClienteController(db_session=gateway).importar_clientes(arquivo, request.headers.get("content-type"))
+    finally:
+        arquivo.close()
+
+@router.get("/cpf/{cpf}", response_model=ClienteResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": ""
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def buscar_cliente_por_cpf(cpf: str, gateway: AsyncClienteGateway = Depends(get_cliente_gateway)):
+    try:
+
+        return await (AsyncClienteController(db_session=gateway)
+                    .buscar_cliente_por_cpf(cpf))
+    except HTTPException:
+        # o controller já traduziu "não encontrado" em 404; não pode virar 400 no except genérico
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# declarada antes de "/{id}" para não ser capturada por ela
+@router.get("/export", response_class=StreamingResponse, responses={
+    200: {
+        "description": "Um registro JSON por linha (NDJSON)",
+        "content": {
+            "application/x-ndjson": {}
+        }
+    }
+})
+async def exportar_clientes(gateway: AsyncClienteGateway = Depends(get_cliente_gateway)):
+
+    return AsyncClienteController(db_session=gateway).exportar_clientes()
+
+@router.get("/{id}", response_model=ClienteResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": ""
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def buscar_cliente(id: int, gateway: AsyncClienteGateway = Depends(get_cliente_gateway)):
+    try:
+
+        return await (AsyncClienteController(db_session=gateway)
+                    .buscar_cliente(id))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+#! Corrigir swagger
+@router.get("/", responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": ""
+                }
+            }
+        }
+    }
+}, 
+openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def listar_clientes(limit: Optional[int] = Query(None, ge=1), cursor: Optional[str] = None, gateway: AsyncClienteGateway = Depends(get_cliente_gateway)):
+    try:
+
+        return await AsyncClienteController(db_session=gateway).listar_pagina(tamanho_pagina(limit), cursor)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.put("/{id}", response_model=ClienteResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao atualizar o cliente"
+                }
+            }
+        }
+    }
+})
+async def atualizar_cliente(id: int, cliente_data: ClienteUpdateSchema, gateway: AsyncClienteGateway = Depends(get_cliente_gateway_primario)):
+    try:
+
+        return await (AsyncClienteController(db_session=gateway)
+                    .atualizar_cliente(id=id, cliente_data=cliente_data))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.patch("/{id}", response_model=ClienteResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao atualizar cliente"
+                }
+            }
+        }
+    }
+})
+async def atualizar_parcial(id: int, cliente_data: ClienteUpdateSchema, gateway: AsyncClienteGateway = Depends(get_cliente_gateway_primario)):
+    try:
+
+        return await (AsyncClienteController(db_session=gateway)
+                    .atualizar_parcial(id=id, cliente_data=cliente_data))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao deletar o cliente"
+                }
+            }
+        }
+    },
+    204: {
+        "description": "Pedido deletado com sucesso",
+        "content": {
+            "application/json": {
+                "example": {}
+            }
+        }
+    }
+})
+async def deletar_cliente(id: int, gateway: AsyncClienteGateway = Depends(get_cliente_gateway_primario)):
+    try:
+        
+        return await AsyncClienteController(db_session=gateway).deletar_cliente(id=id)       
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,334 @@
+from fastapi import APIRouter, HTTPException, Body, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.database import get_async_db, get_async_db_leitura
+from app.gateways.async_produto_gateway import AsyncProdutoGateway
+from app.adapters.presenters.produto_presenter import ProdutoResponse, ProdutoLoteResponse, ProdutoSugestaoResponseList
+from app.adapters.dto.produto_dto import ProdutoCreateSchema, ProdutoUpdateSchema
+from app.adapters.utils.etag import etag_confere, nao_modificado
+from app.adapters.utils.resposta import mesclar_headers
+from app.adapters.utils.paginacao import tamanho_pagina
+from app.infrastructure import config
+from app.infrastructure.cache import catalogo
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+from app.controllers.async_produto_controller import AsyncProdutoController
+
+router = APIRouter(prefix="/produtos", tags=["produtos"])
+
+async def get_produto_gateway(database: AsyncSession = Depends(get_async_db), leitura: AsyncSession | None = Depends(get_async_db_leitura)) -> AsyncProdutoGateway:
+    
+    return AsyncProdutoGateway(db_session=database, leitura_session=leitura)
+
+async def get_produto_gateway_primario(database: AsyncSession = Depends(get_async_db)) -> AsyncProdutoGateway:
+
+    return AsyncProdutoGateway(db_session=database)
+
+@router.post("/", response_model=ProdutoResponse, status_code=status.HTTP_201_CREATED, responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao criar o produto"
+                }
+            }
+        }
+    }
+})
+async def criar_produto(produto_data: ProdutoCreateSchema, gateway: AsyncProdutoGateway = Depends(get_produto_gateway_primario)):
+    try:
+
+        return await (AsyncProdutoController(db_session=gateway)
+                    .criar_produto(produto_data))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# cada item é validado individualmente para que o modo parcial possa apontar o índice com erro
+@router.post("/batch", response_model=ProdutoLoteResponse, status_code=status.HTTP_201_CREATED, responses={
+    207: {
+        "description": "Lote parcial: produtos válidos criados, erros por item em \"errors\"",
+        "model": ProdutoLoteResponse
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao salvar os produtos"
+                }
+            }
+        }
+    },
+    422: {
+        "description": "Lote com itens inválidos, nenhum produto criado",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "message": "Lote contém produtos inválidos",
+                        "errors": [{"index": 1, "message": "preco: Input should be greater than 0"}]
+                    }
+                }
+            }
+        }
+    }
+})
+async def criar_produtos_em_lote(response: Response, itens: List[Dict[str, Any]] = Body(...), partial: bool = False, gateway: AsyncProdutoGateway = Depends(get_produto_gateway_primario)):
+    result = await AsyncProdutoController(db_session=gateway).criar_lote(itens, partial)
+
+    if result.errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+
+    return result
+
+#! Corrigir swagger
+@router.get("/", responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao buscar os produtos"
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def listar_produtos(request: Request, response: Response, limit: Optional[int] = Query(None, ge=1), cursor: Optional[str] = None, gateway: AsyncProdutoGateway = Depends(get_produto_gateway), leitura: AsyncSession | None = Depends(get_async_db_leitura)):
+    # o ETag é lido antes da consulta: se houver escrita no meio, o cliente só revalida de novo
+    etag = catalogo_versao.etag()
+
+    if etag_confere(request, etag):
+        return nao_modificado(etag)
+
+    # corpo lido da réplica logo após uma escrita pode ser anterior à versão do ETag: sai sem ele
+    if catalogo.etag_confiavel(da_replica=leitura is not None):
+        response.headers["ETag"] = etag
+
+    try:
+        
+        return mesclar_headers(response, await (AsyncProdutoController(db_session=gateway)
+                    .listar_pagina(tamanho_pagina(limit), cursor)))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+#! Corrigir swagger
+@router.get("/categoria/{categoria}", responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao buscar o produto"
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def listar_produtos_por_categoria(categoria: int, request: Request, response: Response, gateway: AsyncProdutoGateway = Depends(get_produto_gateway), leitura: AsyncSession | None = Depends(get_async_db_leitura)):
+    etag = catalogo_versao.etag()
+
+    if etag_confere(request, etag):
+        return nao_modificado(etag)
+
+    if catalogo.etag_confiavel(da_replica=leitura is not None):
+        response.headers["ETag"] = etag
+
+    try:
+        
+        return mesclar_headers(response, await (AsyncProdutoController(db_session=gateway)
+                    .listar_produtos_por_categoria(categoria)))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# cardápio do totem agrupado por categoria: bytes já renderizados e comprimidos, escolhidos pelo Accept-Encoding
+@router.get("/menu", responses={
+    200: {
+        "description": "Produtos agrupados por categoria",
+        "content": {
+            "application/json": {}
+        }
+    }
+})
+async def cardapio(request: Request, gateway: AsyncProdutoGateway = Depends(get_produto_gateway_primario)):
+
+    return await AsyncProdutoController(db_session=gateway).cardapio(request)
+
+# uma request por tecla no totem: servida do índice em memória, sem ETag nem consulta ao banco
+@router.get("/autocomplete", response_model=ProdutoSugestaoResponseList)
+async def autocompletar_produtos(prefix: str = Query(..., min_length=1, max_length=100), limit: Optional[int] = Query(None, ge=1), gateway: AsyncProdutoGateway = Depends(get_produto_gateway)):
+    limite = min(limit or config.AUTOCOMPLETE_LIMITE_PADRAO, config.AUTOCOMPLETE_LIMITE_MAXIMO)
+
+    return await AsyncProdutoController(db_session=gateway).autocompletar(prefix, limite)
+
+# declarada antes de "/{id}" para não ser capturada por ela; ordenada por relevância
+@router.get("/search", responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cursor inválido"
+                }
+            }
+        }
+    }
+})
+async def buscar_produtos(request: Request, response: Response, q: str = Query(..., min_length=1, max_length=100), limit: Optional[int] = Query(None, ge=1), cursor: Optional[str] = None, gateway: AsyncProdutoGateway = Depends(get_produto_gateway), leitura: AsyncSession | None = Depends(get_async_db_leitura)):
+    etag = catalogo_versao.etag()
+
+    if etag_confere(request, etag):
+        return nao_modificado(etag)
+
+    if catalogo.etag_confiavel(da_replica=leitura is not None):
+        response.headers["ETag"] = etag
+
+    try:
+
+        return mesclar_headers(response, await (AsyncProdutoController(db_session=gateway)
+                    .buscar_produtos(q, tamanho_pagina(limit), cursor)))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+# declarada antes de "/{id}" para não ser capturada por ela
+@router.get("/export", response_class=StreamingResponse, responses={
+    200: {
+        "description": "Um registro JSON por linha (NDJSON)",
+        "content": {
+            "application/x-ndjson": {}
+        }
+    }
+})
+async def exportar_produtos(gateway: AsyncProdutoGateway = Depends(get_produto_gateway)):
+
+    return AsyncProdutoController(db_session=gateway).exportar_produtos()
+
+@router.get("/{id}", responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao buscar o produto"
+                }
+            }
+        }
+    },
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Produto não encontrado"
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "responses": {
+        "422": None  
+    }
+})
+async def buscar_produto(id: int, request: Request, response: Response, gateway: AsyncProdutoGateway = Depends(get_produto_gateway), leitura: AsyncSession | None = Depends(get_async_db_leitura)):
+    etag = catalogo_versao.etag()
+
+    if etag_confere(request, etag):
+        return nao_modificado(etag)
+
+    if catalogo.etag_confiavel(da_replica=leitura is not None):
+        response.headers["ETag"] = etag
+
+    try:
+        
+        return mesclar_headers(response, await (AsyncProdutoController(db_session=gateway)
+                    .buscar_produto(id)))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.put("/{id}", response_model=ProdutoResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Produto não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao atualizar o produto"
+                }
+            }
+        }
+    }
+})
+async def atualizar_produto(id: int, produto: ProdutoUpdateSchema, gateway: AsyncProdutoGateway = Depends(get_produto_gateway_primario)):
+    try:
+        
+        return await (AsyncProdutoController(db_session=gateway)
+                    .atualizar_produto(id, produto=produto))
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Produto não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao remover o produto"
+                }
+            }
+        }
+    },
+    204: {
+        "description": "Produto deletado com sucesso",
+        "content": {
+            "application/json": {
+                "example": {}
+            }
+        }
+    }
+})
+async def deletar_produto(id: int, gateway: AsyncProdutoGateway = Depends(get_produto_gateway_primario)):
+    try:
+        await AsyncProdutoController(db_session=gateway).deletar_produto(id)
+
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
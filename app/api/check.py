@@ -1,6 +1,14 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.infrastructure.db.database import get_db
+from app.infrastructure.db.database import get_db, get_pools_status
+from app.infrastructure.metrics import metrics
+from app.infrastructure.cache.catalogo import catalogo_cache
+from app.infrastructure.cache.categorias import registro_categorias
+from app.infrastructure.cache.clientes import clientes_cache
+from app.infrastructure.cache.bloom import filtros_clientes
+from app.infrastructure.cache.busca_produtos import indice_produtos
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.cache.cardapio import cardapio_cache
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -10,4 +18,17 @@ def health_check():
 
 @router.get("/db")
 def health_db_check(db: Session = Depends(get_db)):
-    return {"status": "connected"}
\ No newline at end of file
+    return {"status": "connected"}
+
+@router.get("/pool")
+def health_pool_check():
+    return {"status": "ok", "pools": get_pools_status()}
+
+@router.get("/metrics")
+def health_metrics():
+    return metrics.snapshot()
+
+
+@router.get("/cache")
+def health_cache():
+    return {"status": "ok", "caches": [catalogo_cache.stats(), clientes_cache.stats(), filtros_clientes.stats(), registro_categorias.stats(), indice_produtos.stats(), indice_autocomplete.stats(), cardapio_cache.stats()]}
@@ -1,17 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.infrastructure.db.database import get_db
+from app.infrastructure.db.database import get_db, get_db_leitura
 from app.gateways.cliente_gateway import ClienteGateway
-from app.adapters.presenters.cliente_presenter import ClienteResponse
+from app.adapters.presenters.cliente_presenter import ClienteResponse, ClienteImportacaoResponse
 from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+from app.adapters.utils.paginacao import tamanho_pagina
+from app.adapters.utils.importacao import receber_arquivo
 from app.controllers.cliente_controller import ClienteController
 
 router = APIRouter(prefix="/clientes", tags=["clientes"])
 
-def get_cliente_gateway(database: Session = Depends(get_db)) -> ClienteGateway:
+def get_cliente_gateway(database: Session = Depends(get_db), leitura: Session | None = Depends(get_db_leitura)) -> ClienteGateway:
     
+    return ClienteGateway(db_session=database, leitura_session=leitura)
+
+# escritas (e as leituras que fazem antes de escrever) vão só ao primário: nem abrem conexão com a réplica
+def get_cliente_gateway_primario(database: Session = Depends(get_db)) -> ClienteGateway:
+
     return ClienteGateway(db_session=database)
 
 @router.post("/", response_model=ClienteResponse, status_code=status.HTTP_201_CREATED, responses={
@@ -24,16 +33,71 @@ def get_cliente_gateway(database: Session = Depends(get_db)) -> ClienteGateway:
                 }
             }
         }
+    },
+    409: {
+        "description": "CPF ou email já cadastrado",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": {
+                        "message": "Já existe cliente cadastrado com este cpf",
+                        "fields": ["cpf"]
+                    }
+                }
+            }
+        }
     }
 })
-def criar_cliente(cliente_data: ClienteCreateSchema, gateway: ClienteGateway = Depends(get_cliente_gateway)):
+def criar_cliente(cliente_data: ClienteCreateSchema, gateway: ClienteGateway = Depends(get_cliente_gateway_primario)):
     try:
         
         return (ClienteController(db_session=gateway)
                     .criar_cliente(cliente_data))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+# async para ler o corpo em streaming; a importação em si roda no threadpool com a Session síncrona
+@router.post("/import", response_model=ClienteImportacaoResponse, responses={
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao importar clientes"
+                }
+            }
+        }
+    },
+    415: {
+        "description": "Formato não suportado",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Formato não suportado, envie CSV ou NDJSON"
+                }
+            }
+        }
+    }
+}, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string"}},
+            "application/x-ndjson": {"schema": {"type": "string"}}
+        }
+    }
+})
+async def importar_clientes(request: Request, gateway: ClienteGateway = Depends(get_cliente_gateway_primario)):
+    arquivo = await receber_arquivo(request)
+
+    try:
+
+        return await run_in_threadpool(ClienteController(db_session=gateway).importar_clientes, arquivo, request.headers.get("content-type"))
+    finally:
+        arquivo.close()
+
 @router.get("/cpf/{cpf}", response_model=ClienteResponse, responses={
     404: {
         "description": "Erro de validação",
@@ -65,11 +129,27 @@ def buscar_cliente_por_cpf(cpf: str, gateway: ClienteGateway = Depends(get_clien
 
         return (ClienteController(db_session=gateway)
                     .buscar_cliente_por_cpf(cpf))
+    except HTTPException:
+        # o controller já traduziu "não encontrado" em 404; não pode virar 400 no except genérico
+        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+# declarada antes de "/{id}" para não ser capturada por ela
+@router.get("/export", response_class=StreamingResponse, responses={
+    200: {
+        "description": "Um registro JSON por linha (NDJSON)",
+        "content": {
+            "application/x-ndjson": {}
+        }
+    }
+})
+def exportar_clientes(gateway: ClienteGateway = Depends(get_cliente_gateway)):
+
+    return ClienteController(db_session=gateway).exportar_clientes()
+
 @router.get("/{id}", response_model=ClienteResponse, responses={
     404: {
         "description": "Erro de validação",
@@ -124,10 +204,10 @@ openapi_extra={
         "422": None  
     }
 })
-def listar_clientes(gateway: ClienteGateway = Depends(get_cliente_gateway)):
+def listar_clientes(limit: Optional[int] = Query(None, ge=1), cursor: Optional[str] = None, gateway: ClienteGateway = Depends(get_cliente_gateway)):
     try:
 
-        return ClienteController(db_session=gateway).listar_clientes()
+        return ClienteController(db_session=gateway).listar_pagina(tamanho_pagina(limit), cursor)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -153,7 +233,7 @@ def listar_clientes(gateway: ClienteGateway = Depends(get_cliente_gateway)):
         }
     }
 })
-def atualizar_cliente(id: int, cliente_data: ClienteUpdateSchema, gateway: ClienteGateway = Depends(get_cliente_gateway)):
+def atualizar_cliente(id: int, cliente_data: ClienteUpdateSchema, gateway: ClienteGateway = Depends(get_cliente_gateway_primario)):
     try:
 
         return (ClienteController(db_session=gateway)
@@ -162,7 +242,39 @@ def atualizar_cliente(id: int, cliente_data: ClienteUpdateSchema, gateway: Clien
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    
+
+@router.patch("/{id}", response_model=ClienteResponse, responses={
+    404: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Cliente não encontrado"
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Erro de validação",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Erro de integridade ao atualizar cliente"
+                }
+            }
+        }
+    }
+})
+def atualizar_parcial(id: int, cliente_data: ClienteUpdateSchema, gateway: ClienteGateway = Depends(get_cliente_gateway_primario)):
+    try:
+
+        return (ClienteController(db_session=gateway)
+                    .atualizar_parcial(id=id, cliente_data=cliente_data))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT, responses={
     404: {
         "description": "Erro de validação",
@@ -193,10 +305,12 @@ def atualizar_cliente(id: int, cliente_data: ClienteUpdateSchema, gateway: Clien
         }
     }
 })
-def deletar_cliente(id: int, gateway: ClienteGateway = Depends(get_cliente_gateway)):
+def deletar_cliente(id: int, gateway: ClienteGateway = Depends(get_cliente_gateway_primario)):
     try:
         
         return ClienteController(db_session=gateway).deletar_cliente(id=id)       
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
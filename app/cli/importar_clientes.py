@@ -0,0 +1,33 @@
+import argparse
+import sys
+
+from app.infrastructure.db.database import SessionLocal
+from app.gateways.cliente_gateway import ClienteGateway
+from app.use_cases.cliente_use_case import ClienteUseCase
+from app.adapters.utils.importacao import FORMATOS, detectar_formato, ler_registros
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.importar_clientes",
+        description="Importa clientes de um arquivo CSV ou NDJSON, atualizando os que já existem pelo CPF"
+    )
+    parser.add_argument("arquivo", help="caminho do arquivo, ou - para ler da entrada padrão")
+    parser.add_argument("--formato", choices=FORMATOS, help="padrão: deduzido pela extensão do arquivo")
+    args = parser.parse_args(argv)
+
+    try:
+        formato = args.formato or detectar_formato(nome_arquivo=args.arquivo)
+    except ValueError as e:
+        parser.error(str(e))
+
+    arquivo = sys.stdin.buffer if args.arquivo == "-" else open(args.arquivo, "rb")
+
+    with SessionLocal() as db, arquivo:
+        resultado = ClienteUseCase(ClienteGateway(db)).importar(ler_registros(arquivo, formato))
+
+    print(resultado.model_dump_json(indent=2))
+
+    return 0 if not resultado.rejected else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+from fastapi import status, HTTPException, Response
+from fastapi.responses import StreamingResponse
+
+from app.adapters.utils.importacao import detectar_formato, ler_registros
+from app.adapters.utils.resposta import apresentar
+from app.adapters.utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks_async
+from app.use_cases.async_cliente_use_case import AsyncClienteUseCase
+from app.use_cases.cliente_use_case import ClienteDuplicadoError
+from app.adapters.presenters.cliente_presenter import ClienteResponse, ClienteResponseList, ClienteImportacaoResponse
+from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+
+class AsyncClienteController:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    async def criar_cliente(self, cliente_data : ClienteCreateSchema):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).criar_cliente(cliente_data)
+
+            return apresentar(ClienteResponse, status_code = status.HTTP_201_CREATED, status = 'success', data = result)
+        except ClienteDuplicadoError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail={"message": str(e), "fields": e.campos})
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def buscar_cliente_por_cpf(self, cpf_cliente: str):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).buscar_cliente_por_cpf(cpf_cliente)
+
+            return apresentar(ClienteResponse, status = 'success', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def buscar_cliente(self, id: int):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).buscar_cliente_por_id(id)
+
+            return apresentar(ClienteResponse, status = 'success', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def listar_clientes(self):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).listar_clientes()
+
+            return apresentar(ClienteResponseList, status = 'success', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def listar_pagina(self, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = await AsyncClienteUseCase(self.db_session).listar_pagina(limite, cursor)
+
+            return apresentar(ClienteResponseList, status = 'success', data = result, next_cursor = proximo_cursor)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def exportar_clientes(self):
+        # status e headers já foram enviados quando as linhas começam a sair, não há como virar 400
+        linhas = AsyncClienteUseCase(self.db_session).exportar()
+
+        return StreamingResponse(ndjson_chunks_async(linhas), media_type=NDJSON_MEDIA_TYPE)
+
+    async def importar_clientes(self, arquivo, content_type: str | None):
+        try:
+            formato = detectar_formato(content_type)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+
+        try:
+            result = await AsyncClienteUseCase(self.db_session).importar(ler_registros(arquivo, formato))
+
+            return ClienteImportacaoResponse(status = 'success', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def atualizar_cliente(self, id: int, cliente_data: ClienteUpdateSchema):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).atualizar_cliente(id=id, clienteRequest=cliente_data)
+
+            return apresentar(ClienteResponse, status = 'success', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def atualizar_parcial(self, id: int, cliente_data: ClienteUpdateSchema):
+        try:
+            result = await AsyncClienteUseCase(self.db_session).atualizar_parcial(id=id, clienteRequest=cliente_data)
+
+            return apresentar(ClienteResponse, status = 'success', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def deletar_cliente(self, id: int):
+        try:
+            await AsyncClienteUseCase(self.db_session).deletar_cliente(id=id)
+
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,126 @@
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.adapters.utils.resposta import apresentar
+from app.adapters.utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks_async
+from app.adapters.utils.etag import etag_confere, nao_modificado
+from app.adapters.utils.compressao import IDENTIDADE, escolher_codificacao
+from app.use_cases.async_produto_use_case import AsyncProdutoUseCase
+from app.use_cases.produto_use_case import LoteInvalidoError
+from app.adapters.presenters.produto_presenter import ProdutoResponse, ProdutoResponseList, ProdutoLoteResponse, ProdutoSugestaoResponseList
+
+class AsyncProdutoController:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    async def criar_produto(self, produto):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).criar_produto(produto)
+
+            return apresentar(ProdutoResponse, status_code = status.HTTP_201_CREATED, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def criar_lote(self, itens, parcial: bool = False):
+        try:
+            result, erros = await AsyncProdutoUseCase(self.db_session).criar_lote(itens, parcial)
+
+            return ProdutoLoteResponse(status = 'sucess', data = result, errors = erros)
+        except LoteInvalidoError as e:
+            raise HTTPException(status_code=422, detail={"message": str(e), "errors": e.erros})
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def listar_todos(self):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).listar_todos()
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def listar_pagina(self, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = await AsyncProdutoUseCase(self.db_session).listar_pagina(limite, cursor)
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result, next_cursor = proximo_cursor)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def buscar_produtos(self, termo: str, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = await AsyncProdutoUseCase(self.db_session).buscar(termo, limite, cursor)
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result, next_cursor = proximo_cursor)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def cardapio(self, request: Request):
+        try:
+            snapshot = await AsyncProdutoUseCase(self.db_session).cardapio()
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if etag_confere(request, snapshot.etag):
+            return nao_modificado(snapshot.etag)
+
+        codificacao = escolher_codificacao(request.headers.get("accept-encoding"), snapshot.variantes)
+        headers = {"ETag": snapshot.etag, "Vary": "Accept-Encoding"}
+
+        if codificacao != IDENTIDADE:
+            headers["Content-Encoding"] = codificacao
+
+        return Response(snapshot.variantes[codificacao], media_type="application/json", headers=headers)
+
+    async def autocompletar(self, prefixo: str, limite: int):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).autocompletar(prefixo, limite)
+
+            return apresentar(ProdutoSugestaoResponseList, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def exportar_produtos(self):
+        # status e headers já foram enviados quando as linhas começam a sair, não há como virar 400
+        linhas = AsyncProdutoUseCase(self.db_session).exportar()
+
+        return StreamingResponse(ndjson_chunks_async(linhas), media_type=NDJSON_MEDIA_TYPE)
+
+    async def listar_produtos_por_categoria(self, categoria):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).listar_por_categoria(categoria)
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def buscar_produto(self, id):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).buscar_por_id(id)
+
+            return apresentar(ProdutoResponse, status = 'sucess', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def atualizar_produto(self, id, produto):
+        try:
+            result = await AsyncProdutoUseCase(self.db_session).atualizar_produto(id, produto_data=produto)
+
+            return apresentar(ProdutoResponse, status = 'sucess', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def deletar_produto(self, id):
+        try:
+            await AsyncProdutoUseCase(self.db_session).deletar_produto(id)
+
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,7 +1,11 @@
 from fastapi import status, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
-from app.use_cases.cliente_use_case import ClienteUseCase
-from app.adapters.presenters.cliente_presenter import ClienteResponse, ClienteResponseList
+from app.adapters.utils.importacao import detectar_formato, ler_registros
+from app.adapters.utils.resposta import apresentar
+from app.adapters.utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks
+from app.use_cases.cliente_use_case import ClienteUseCase, ClienteDuplicadoError
+from app.adapters.presenters.cliente_presenter import ClienteResponse, ClienteResponseList, ClienteImportacaoResponse
 from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
 
 class ClienteController:
@@ -13,7 +17,9 @@ class ClienteController:
         try:
             result = ClienteUseCase(self.db_session).criar_cliente(cliente_data)
 
-            return ClienteResponse(status = 'success', data = result)
+            return apresentar(ClienteResponse, status_code = status.HTTP_201_CREATED, status = 'success', data = result)
+        except ClienteDuplicadoError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail={"message": str(e), "fields": e.campos})
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
@@ -21,7 +27,7 @@ class ClienteController:
         try:
             result = ClienteUseCase(self.db_session).buscar_cliente_por_cpf(cpf_cliente)
 
-            return ClienteResponse(status = 'success', data = result)
+            return apresentar(ClienteResponse, status = 'success', data = result)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except Exception as e:
@@ -31,7 +37,7 @@ class ClienteController:
         try:
             result = ClienteUseCase(self.db_session).buscar_cliente_por_id(id)
 
-            return ClienteResponse(status = 'success', data = result)
+            return apresentar(ClienteResponse, status = 'success', data = result)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except Exception as e:
@@ -41,7 +47,34 @@ class ClienteController:
         try:
             result = ClienteUseCase(self.db_session).listar_clientes()
 
-            return ClienteResponseList(status = 'success', data = result)
+            return apresentar(ClienteResponseList, status = 'success', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def listar_pagina(self, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = ClienteUseCase(self.db_session).listar_pagina(limite, cursor)
+
+            return apresentar(ClienteResponseList, status = 'success', data = result, next_cursor = proximo_cursor)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def exportar_clientes(self):
+        # status e headers já foram enviados quando as linhas começam a sair, não há como virar 400
+        linhas = ClienteUseCase(self.db_session).exportar()
+
+        return StreamingResponse(ndjson_chunks(linhas), media_type=NDJSON_MEDIA_TYPE)
+
+    def importar_clientes(self, arquivo, content_type: str | None):
+        try:
+            formato = detectar_formato(content_type)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+
+        try:
+            result = ClienteUseCase(self.db_session).importar(ler_registros(arquivo, formato))
+
+            return ClienteImportacaoResponse(status = 'success', data = result)
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -49,12 +82,22 @@ class ClienteController:
         try:
             result = ClienteUseCase(self.db_session).atualizar_cliente(id=id, clienteRequest=cliente_data)
 
-            return ClienteResponse(status = 'success', data = result)
+            return apresentar(ClienteResponse, status = 'success', data = result)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
+    def atualizar_parcial(self, id: int, cliente_data: ClienteUpdateSchema):
+        try:
+            result = ClienteUseCase(self.db_session).atualizar_parcial(id=id, clienteRequest=cliente_data)
+
+            return apresentar(ClienteResponse, status = 'success', data = result)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     def deletar_cliente(self, id: int):
         try:
             ClienteUseCase(self.db_session).deletar_cliente(id=id)
@@ -1,7 +1,12 @@
-from fastapi import HTTPException, Response, status
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.use_cases.produto_use_case import ProdutoUseCase
-from app.adapters.presenters.produto_presenter import ProdutoResponse, ProdutoResponseList
+from app.adapters.utils.resposta import apresentar
+from app.adapters.utils.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks
+from app.adapters.utils.etag import etag_confere, nao_modificado
+from app.adapters.utils.compressao import IDENTIDADE, escolher_codificacao
+from app.use_cases.produto_use_case import ProdutoUseCase, LoteInvalidoError
+from app.adapters.presenters.produto_presenter import ProdutoResponse, ProdutoResponseList, ProdutoLoteResponse, ProdutoSugestaoResponseList
 
 class ProdutoController:
     
@@ -12,7 +17,17 @@ class ProdutoController:
         try:
             result = ProdutoUseCase(self.db_session).criar_produto(produto)
 
-            return ProdutoResponse(status = 'sucess', data = result)
+            return apresentar(ProdutoResponse, status_code = status.HTTP_201_CREATED, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def criar_lote(self, itens, parcial: bool = False):
+        try:
+            result, erros = ProdutoUseCase(self.db_session).criar_lote(itens, parcial)
+
+            return ProdutoLoteResponse(status = 'sucess', data = result, errors = erros)
+        except LoteInvalidoError as e:
+            raise HTTPException(status_code=422, detail={"message": str(e), "errors": e.erros})
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -20,15 +35,62 @@ class ProdutoController:
         try:
             result = ProdutoUseCase(self.db_session).listar_todos()
             
-            return ProdutoResponseList(status = 'sucess', data = result)
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def listar_pagina(self, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = ProdutoUseCase(self.db_session).listar_pagina(limite, cursor)
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result, next_cursor = proximo_cursor)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def buscar_produtos(self, termo: str, limite: int, cursor: str | None = None):
+        try:
+            result, proximo_cursor = ProdutoUseCase(self.db_session).buscar(termo, limite, cursor)
+
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result, next_cursor = proximo_cursor)
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    def cardapio(self, request: Request):
+        try:
+            snapshot = ProdutoUseCase(self.db_session).cardapio()
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if etag_confere(request, snapshot.etag):
+            return nao_modificado(snapshot.etag)
+
+        codificacao = escolher_codificacao(request.headers.get("accept-encoding"), snapshot.variantes)
+        headers = {"ETag": snapshot.etag, "Vary": "Accept-Encoding"}
+
+        if codificacao != IDENTIDADE:
+            headers["Content-Encoding"] = codificacao
+
+        return Response(snapshot.variantes[codificacao], media_type="application/json", headers=headers)
+
+    def autocompletar(self, prefixo: str, limite: int):
+        try:
+            result = ProdutoUseCase(self.db_session).autocompletar(prefixo, limite)
+
+            return apresentar(ProdutoSugestaoResponseList, status = 'sucess', data = result)
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def exportar_produtos(self):
+        # status e headers já foram enviados quando as linhas começam a sair, não há como virar 400
+        linhas = ProdutoUseCase(self.db_session).exportar()
+
+        return StreamingResponse(ndjson_chunks(linhas), media_type=NDJSON_MEDIA_TYPE)
+
     def listar_produtos_por_categoria(self, categoria):
         try:
             result = ProdutoUseCase(self.db_session).listar_por_categoria(categoria)
             
-            return ProdutoResponseList(status = 'sucess', data = result)
+            return apresentar(ProdutoResponseList, status = 'sucess', data = result)
         except Exception as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -36,7 +98,7 @@ class ProdutoController:
         try:
             result = ProdutoUseCase(self.db_session).buscar_por_id(id)
             
-            return ProdutoResponse(status = 'sucess', data = result)
+            return apresentar(ProdutoResponse, status = 'sucess', data = result)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except Exception as e:
@@ -46,7 +108,7 @@ class ProdutoController:
         try:
             result = ProdutoUseCase(self.db_session).atualizar_produto(id, produto_data=produto)
             
-            return ProdutoResponse(status = 'sucess', data = result)
+            return apresentar(ProdutoResponse, status = 'sucess', data = result)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except Exception as e:
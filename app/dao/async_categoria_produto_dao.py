@@ -0,0 +1,14 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.categoria_produto import CategoriaProduto
+
+class AsyncCategoriaProdutoDAO:
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def listar_todas(self) -> dict[int, str]:
+        result = await self.db_session.execute(select(CategoriaProduto.id, CategoriaProduto.nome))
+
+        return {id: nome for id, nome in result}
@@ -0,0 +1,160 @@
+from sqlalchemy import select, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cliente import Cliente
+from app.models.cliente import Cliente as ClienteModel
+from app.infrastructure.config import EXPORT_YIELD_PER, IMPORT_LOTE
+from app.adapters.utils.importacao import em_lotes
+from app.dao.cliente_dao import query_criacao, query_busca, query_atualizacao_parcial, query_remocao, cliente_de_returning
+from app.dao.cliente_importacao import COLUNAS, staging, regras_rejeicao, contar_staging, contar_atualizacoes, merge
+
+class AsyncClienteDAO:
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def criar_cliente(self, cliente : Cliente):
+        try:
+            row = (await self.db_session.execute(query_criacao(cliente))).one()
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao criar cliente: {e}")
+
+        return cliente_de_returning(row)
+
+    async def buscar_por_cpf(self, cpf_cliente) -> Cliente | None:
+        result = await self.db_session.execute(
+            select(ClienteModel)
+            .filter_by(cpf=cpf_cliente)
+        )
+
+        return result.scalars().first()
+
+    async def buscar_por_id(self, id) -> Cliente | None :
+        result = await self.db_session.execute(
+            select(ClienteModel)
+            .filter_by(id=id)
+        )
+
+        return result.scalars().first()
+
+    async def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Cliente] :
+        query = select(ClienteModel).order_by(ClienteModel.id)
+
+        if apos_id is not None:
+            query = query.filter(ClienteModel.id > apos_id)
+
+        if limite is not None:
+            query = query.limit(limite)
+
+        result = await self.db_session.execute(query)
+
+        return result.scalars().all()
+
+    async def exportar(self):
+        result = await self.db_session.stream(
+            select(ClienteModel)
+            .order_by(ClienteModel.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        async for cliente in result.scalars():
+            yield cliente
+
+    async def conflitos(self, **valores) -> set[str]:
+        colunas = [getattr(ClienteModel, campo) for campo in valores]
+        rows = (await self.db_session.execute(
+            select(*colunas)
+            .where(or_(*(coluna == valores[coluna.key] for coluna in colunas)))
+            .limit(len(colunas))
+        )).all()
+
+        return {campo for row in rows for campo, valor in zip(valores, row) if valor == valores[campo]}
+
+    async def importar(self, clientes) -> dict:
+        conexao = await self.db_session.connection()
+
+        try:
+            await conexao.run_sync(staging.create)
+
+            if conexao.dialect.name == "postgresql":
+                # COPY binário do asyncpg, um lote de registros por vez
+                driver = (await conexao.get_raw_connection()).driver_connection
+
+                for lote in em_lotes(clientes, IMPORT_LOTE):
+                    await driver.copy_records_to_table(
+                        staging.name,
+                        records=[tuple(cliente[coluna] for coluna in COLUNAS) for cliente in lote],
+                        columns=list(COLUNAS)
+                    )
+            else:
+                for lote in em_lotes(clientes, IMPORT_LOTE):
+                    await conexao.execute(staging.insert(), lote)
+
+            rejeitados = []
+
+            for motivo, condicao in regras_rejeicao():
+                linhas = (await conexao.execute(select(staging.c.linha).where(condicao))).scalars().all()
+
+                if linhas:
+                    rejeitados.extend((linha, motivo) for linha in linhas)
+                    await conexao.execute(staging.delete().where(condicao))
+
+            total = (await conexao.execute(contar_staging())).scalar()
+            atualizados = (await conexao.execute(contar_atualizacoes())).scalar()
+
+            await conexao.execute(merge(conexao.dialect.name))
+            await conexao.run_sync(staging.drop)
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao importar clientes: {e}")
+        except Exception:
+            await self.db_session.rollback()
+
+            raise
+
+        return {"inseridos": total - atualizados, "atualizados": atualizados, "rejeitados": rejeitados}
+
+    async def atualizar_cliente(self, id: int, cliente) -> Cliente | None:
+        cliente_busca = await self.buscar_por_id(id)
+
+        if cliente_busca is not None and cliente:
+            for field, value in cliente.model_dump().items():
+                setattr(cliente_busca, field, value)
+
+            await self.db_session.commit()
+            await self.db_session.refresh(cliente_busca)
+
+        return cliente_busca
+
+    async def atualizar_parcial(self, id: int, campos: dict) -> Cliente | None:
+        if campos:
+            try:
+                row = (await self.db_session.execute(query_atualizacao_parcial(id, campos))).first()
+                await self.db_session.commit()
+            except IntegrityError as e:
+                await self.db_session.rollback()
+
+                raise Exception(f"Erro de integridade ao atualizar cliente: {e}")
+
+            if row is not None:
+                return cliente_de_returning(row)
+
+        row = (await self.db_session.execute(query_busca(id))).first()
+
+        return cliente_de_returning(row) if row is not None else None
+
+    async def deletar_cliente(self, id) -> None:
+        rows = (await self.db_session.execute(query_remocao(id))).all()
+
+        if not rows:
+            await self.db_session.rollback()
+
+            raise ValueError("Cliente não encontrado")
+
+        await self.db_session.commit()
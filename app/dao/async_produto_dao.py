@@ -0,0 +1,137 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.produto import Produto
+from app.dao.produto_dao import query_criacao, query_atualizacao, query_remocao, produtos_de_returning
+from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
+from app.dao.produto_busca import busca_no_banco_async, query_busca, query_linhas_indice, query_por_ids, na_ordem
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+from app.infrastructure.cache.busca_produtos import indice_produtos
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.config import EXPORT_YIELD_PER
+
+class AsyncProdutoDAO:
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def criar_produto(self, produto: Produto) :
+        try:
+            rows = (await self.db_session.execute(query_criacao([produto]))).all()
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao salvar o produto: {e}")
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos[0]
+
+    async def criar_produtos(self, produtos: list[Produto]) -> list[Produto]:
+        try:
+            rows = (await self.db_session.execute(query_criacao(produtos))).all()
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao salvar os produtos: {e}")
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos
+
+    async def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Produto] :
+        query = (select(Produto)
+                      .order_by(Produto.id))
+
+        if apos_id is not None:
+            query = query.filter(Produto.id > apos_id)
+
+        if limite is not None:
+            query = query.limit(limite)
+
+        result = await self.db_session.execute(query)
+
+        return result.scalars().all()
+
+    async def exportar(self):
+        result = await self.db_session.stream(
+            select(Produto)
+            .order_by(Produto.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        async for produto in result.scalars():
+            yield produto
+
+    async def listar_por_categoria(self, categoria: CategoriaProdutoEnum) -> list[Produto] :
+        result = await self.db_session.execute(
+            select(Produto)
+            .filter(Produto.categoria == categoria)
+        )
+
+        return result.scalars().all()
+
+    async def buscar_por_id(self, id: int) -> Produto | None:
+        result = await self.db_session.execute(
+            select(Produto)
+            .filter(Produto.id == id)
+        )
+
+        return result.scalars().first()
+
+    async def nomes(self) -> list[tuple[int, str]]:
+
+        return (await self.db_session.execute(select(Produto.id, Produto.nome))).all()
+
+    async def buscar_por_termo(self, termo: str, limite: int, offset: int = 0) -> list[Produto]:
+        if await busca_no_banco_async(self.db_session):
+            return (await self.db_session.execute(query_busca(termo, limite, offset))).scalars().all()
+
+        versao = catalogo_versao.versao
+
+        if indice_produtos.precisa_carregar(versao):
+            indice_produtos.carregar((await self.db_session.execute(query_linhas_indice())).all(), versao)
+
+        ids = indice_produtos.buscar(termo)[offset:offset + limite]
+
+        if not ids:
+            return []
+
+        return na_ordem((await self.db_session.execute(query_por_ids(ids))).scalars().all(), ids)
+
+    async def atualizar_produto(self, id: int, produto_data: Produto) -> Produto | None:
+        try:
+            rows = (await self.db_session.execute(query_atualizacao(id, produto_data))).all()
+            await self.db_session.commit()
+        except IntegrityError as e:
+            await self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao atualizar o produto: {e}")
+
+        if not rows:
+            return None
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos[0]
+
+    async def deletar_produto(self, id: int) -> None :
+        rows = (await self.db_session.execute(query_remocao(id))).all()
+
+        if not rows:
+            await self.db_session.rollback()
+
+            raise ValueError("Produto não encontrado")
+
+        await self.db_session.commit()
+        catalogo_versao.incrementar()
+        indice_autocomplete.remover(id)
@@ -0,0 +1,13 @@
+from sqlalchemy import select
+
+from app.models.categoria_produto import CategoriaProduto
+
+class CategoriaProdutoDAO:
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def listar_todas(self) -> dict[int, str]:
+        result = self.db_session.execute(select(CategoriaProduto.id, CategoriaProduto.nome))
+
+        return {id: nome for id, nome in result}
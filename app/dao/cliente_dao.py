@@ -1,7 +1,11 @@
+from sqlalchemy import select, insert, update, delete, or_
 from sqlalchemy.exc import IntegrityError
 
 from app.models.cliente import Cliente
 from app.models.cliente import Cliente as ClienteModel
+from app.infrastructure.config import EXPORT_YIELD_PER, IMPORT_LOTE
+from app.adapters.utils.importacao import CsvStream, em_lotes
+from app.dao.cliente_importacao import COLUNAS, staging, copy_sql, regras_rejeicao, contar_staging, contar_atualizacoes, merge
 
 class ClienteDAO:
     
@@ -9,23 +13,16 @@ class ClienteDAO:
         self.db_session = db_session
 
     def criar_cliente(self, cliente : Cliente):
+        # INSERT ... RETURNING: id e valores gravados no mesmo statement, sem refresh
         try:
-            cliente_model = ClienteModel(
-                nome=cliente.nome,
-                email=cliente.email,
-                telefone=cliente.telefone,
-                cpf=cliente.cpf
-            )
-            self.db_session.add(cliente_model)
+            row = self.db_session.execute(query_criacao(cliente)).one()
             self.db_session.commit()
         except IntegrityError as e:
             self.db_session.rollback()
             
             raise Exception(f"Erro de integridade ao criar cliente: {e}")
-        
-        self.db_session.refresh(cliente_model)
 
-        return cliente_model
+        return cliente_de_returning(row)
 
     def buscar_por_cpf(self, cpf_cliente) -> Cliente | None:
         
@@ -41,16 +38,93 @@ class ClienteDAO:
                 .filter_by(id=id)
                 .first())
 
-    def listar_todos(self) -> Cliente | None : 
-        
-        return (self.db_session
+    def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Cliente] :
+        # keyset: "id > :apos_id ORDER BY id LIMIT n" percorre o índice da PK, sem OFFSET
+        query = (self.db_session
                 .query(Cliente)
-                .all())
+                .order_by(Cliente.id))
+
+        if apos_id is not None:
+            query = query.filter(Cliente.id > apos_id)
+
+        if limite is not None:
+            query = query.limit(limite)
+
+        return query.all()
+
+    def exportar(self):
+        # yield_per usa cursor do lado do servidor: a memória fica limitada a um lote
+        result = self.db_session.execute(
+            select(ClienteModel)
+            .order_by(ClienteModel.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        yield from result.scalars()
+
+    def chaves(self):
+        result = self.db_session.execute(
+            select(ClienteModel.cpf, ClienteModel.email)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        yield from result.tuples()
+
+    def conflitos(self, **valores) -> set[str]:
+        # cada campo tem índice único: no máximo uma linha por campo
+        colunas = [getattr(ClienteModel, campo) for campo in valores]
+        rows = self.db_session.execute(
+            select(*colunas)
+            .where(or_(*(coluna == valores[coluna.key] for coluna in colunas)))
+            .limit(len(colunas))
+        ).all()
+
+        return {campo for row in rows for campo, valor in zip(valores, row) if valor == valores[campo]}
+
+    def importar(self, clientes) -> dict:
+        # staging + merge numa única transação: ou o arquivo inteiro entra, ou nada muda
+        conexao = self.db_session.connection()
+
+        try:
+            staging.create(conexao)
+
+            if conexao.dialect.name == "postgresql":
+                with conexao.connection.dbapi_connection.cursor() as cursor:
+                    cursor.copy_expert(copy_sql(), CsvStream(clientes, COLUNAS))
+            else:
+                for lote in em_lotes(clientes, IMPORT_LOTE):
+                    conexao.execute(staging.insert(), lote)
+
+            rejeitados = []
+
+            for motivo, condicao in regras_rejeicao():
+                linhas = conexao.execute(select(staging.c.linha).where(condicao)).scalars().all()
+
+                if linhas:
+                    rejeitados.extend((linha, motivo) for linha in linhas)
+                    conexao.execute(staging.delete().where(condicao))
+
+            total = conexao.execute(contar_staging()).scalar()
+            atualizados = conexao.execute(contar_atualizacoes()).scalar()
+
+            conexao.execute(merge(conexao.dialect.name))
+            staging.drop(conexao)
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao importar clientes: {e}")
+        except Exception:
+            self.db_session.rollback()
+
+            raise
+
+        return {"inseridos": total - atualizados, "atualizados": atualizados, "rejeitados": rejeitados}
 
     def atualizar_cliente(self, id: int, cliente) -> Cliente | None:
         cliente_busca = self.buscar_por_id(id)
 
-        if cliente : 
+        if cliente_busca is not None and cliente:
             for field, value in cliente.model_dump().items():
                 setattr(cliente_busca, field, value)
 
@@ -59,11 +133,68 @@ class ClienteDAO:
         
         return cliente_busca
 
+    def atualizar_parcial(self, id: int, campos: dict) -> Cliente | None:
+        # só os campos enviados, num único UPDATE ... RETURNING
+        if campos:
+            try:
+                row = self.db_session.execute(query_atualizacao_parcial(id, campos)).first()
+                self.db_session.commit()
+            except IntegrityError as e:
+                self.db_session.rollback()
+
+                raise Exception(f"Erro de integridade ao atualizar cliente: {e}")
+
+            if row is not None:
+                return cliente_de_returning(row)
+
+        # corpo vazio ou valores iguais aos gravados: nenhuma escrita, a leitura decide entre o atual e o 404
+        row = self.db_session.execute(query_busca(id)).first()
+
+        return cliente_de_returning(row) if row is not None else None
+
     def deletar_cliente(self, id) -> None:
-        cliente_busca = self.buscar_por_id(id)
+        # DELETE ... RETURNING id: nenhuma linha afetada é o "não encontrado", sem SELECT antes
+        rows = self.db_session.execute(query_remocao(id)).all()
+
+        if not rows:
+            self.db_session.rollback()
 
-        if not cliente_busca:
             raise ValueError("Cliente não encontrado")
-        
-        self.db_session.delete(cliente_busca)
+
         self.db_session.commit()
+
+COLUNAS_RETURNING = (ClienteModel.id, ClienteModel.nome, ClienteModel.email, ClienteModel.telefone, ClienteModel.cpf)
+
+def query_criacao(cliente: Cliente):
+
+    return (insert(ClienteModel)
+            .values(nome=cliente.nome, email=cliente.email, telefone=cliente.telefone, cpf=cliente.cpf)
+            .returning(*COLUNAS_RETURNING))
+
+def query_busca(id: int):
+
+    return select(*COLUNAS_RETURNING).where(ClienteModel.id == id)
+
+def query_atualizacao_parcial(id: int, campos: dict):
+    colunas = {campo: getattr(ClienteModel, campo) for campo in campos}
+
+    # a linha só casa se algum valor realmente mudar: sem mudança não há nova versão da linha
+    return (update(ClienteModel)
+            .where(ClienteModel.id == id, or_(*(coluna.is_distinct_from(campos[campo]) for campo, coluna in colunas.items())))
+            .values(**campos)
+            .returning(*COLUNAS_RETURNING)
+            .execution_options(synchronize_session=False))
+
+def query_remocao(id: int):
+
+    return (delete(ClienteModel)
+            .where(ClienteModel.id == id)
+            .returning(ClienteModel.id)
+            .execution_options(synchronize_session=False))
+
+def cliente_de_returning(row) -> Cliente:
+    # objeto transiente: não expira no commit nem volta ao banco
+    cliente = ClienteModel(nome=row.nome, email=row.email, telefone=row.telefone, cpf=row.cpf)
+    cliente.id = row.id
+
+    return cliente
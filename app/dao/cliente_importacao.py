@@ -0,0 +1,76 @@
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, exists, func, or_, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.cliente import Cliente
+
+COLUNAS = ("linha", "nome", "email", "telefone", "cpf")
+
+# tabela temporária por conexão: recebe o arquivo via COPY antes do merge em "cliente"
+staging = Table(
+    "cliente_importacao",
+    MetaData(),
+    Column("linha", Integer, primary_key=True, autoincrement=False),
+    Column("nome", String(255)),
+    Column("email", String(255)),
+    Column("telefone", String(11)),
+    Column("cpf", String(11)),
+    Index("ix_cliente_importacao_cpf", "cpf"),
+    Index("ix_cliente_importacao_email", "email"),
+    prefixes=["TEMPORARY"],
+)
+
+INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def copy_sql() -> str:
+
+    return f"COPY {staging.name} ({', '.join(COLUNAS)}) FROM STDIN WITH (FORMAT csv)"
+
+def regras_rejeicao():
+    # aplicadas em ordem: cada regra remove as linhas da staging antes da próxima
+    outra = staging.alias("outra")
+
+    yield "cpf repetido em linha posterior do arquivo", exists().where(
+        outra.c.cpf == staging.c.cpf,
+        outra.c.linha > staging.c.linha
+    )
+    yield "email repetido no arquivo para outro cpf", exists().where(
+        outra.c.email == staging.c.email,
+        outra.c.cpf != staging.c.cpf,
+        outra.c.linha < staging.c.linha
+    )
+    yield "email já cadastrado para outro cliente", exists().where(
+        Cliente.email == staging.c.email,
+        or_(Cliente.cpf.is_(None), Cliente.cpf != staging.c.cpf)
+    )
+
+def contar_staging():
+
+    return select(func.count()).select_from(staging)
+
+def contar_atualizacoes():
+
+    return select(func.count()).select_from(staging.join(Cliente, Cliente.cpf == staging.c.cpf))
+
+def merge(dialeto: str):
+    insert = INSERTS.get(dialeto)
+
+    if insert is None:
+        raise Exception(f"Importação de clientes não suportada no banco {dialeto}")
+
+    # "WHERE true" desfaz a ambiguidade do SQLite entre "ON CONFLICT" e a cláusula ON de um join
+    origem = (select(staging.c.nome, staging.c.email, staging.c.telefone, staging.c.cpf)
+              .where(true())
+              .order_by(staging.c.linha))
+    query = insert(Cliente.__table__).from_select(["nome", "email", "telefone", "cpf"], origem)
+
+    return query.on_conflict_do_update(
+        index_elements=[Cliente.cpf],
+        set_={
+            "nome": query.excluded.nome,
+            "email": query.excluded.email,
+            "telefone": query.excluded.telefone
+        }
+    )
@@ -0,0 +1,153 @@
+import threading
+import time
+
+from sqlalchemy import select, func, or_, literal_column, text
+
+from app.models.produto import Produto
+from app.infrastructure import config
+
+# portuguese com unaccent antes do stemmer: "pão" e "pao" geram o mesmo lexema
+CONFIG_BUSCA = "portuguese_unaccent"
+
+# unaccent() não é IMMUTABLE e por isso não entra em índice; o wrapper com o dicionário explícito pode.
+# Aplicado pelo comando único "python -m app.infrastructure.db.preparar_busca" (deploy), nunca pelos workers
+DDL_BUSCA = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+    "AS $$ SELECT public.unaccent('public.unaccent', $1) $$",
+    f"""DO $$ BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{CONFIG_BUSCA}') THEN
+            CREATE TEXT SEARCH CONFIGURATION {CONFIG_BUSCA} (COPY = portuguese);
+            ALTER TEXT SEARCH CONFIGURATION {CONFIG_BUSCA}
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+        END IF;
+    END $$""",
+]
+
+INDICES_BUSCA = {
+    # a expressão precisa ser a mesma de vetor_busca() para o planner usar o índice
+    "ix_produto_busca_tsv": f"""CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_produto_busca_tsv ON produto USING gin ((
+        setweight(to_tsvector('{CONFIG_BUSCA}'::regconfig, nome), 'A') ||
+        setweight(to_tsvector('{CONFIG_BUSCA}'::regconfig, descricao), 'B')
+    ))""",
+    "ix_produto_nome_trgm": "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_produto_nome_trgm ON produto USING gin (f_unaccent(lower(nome)) gin_trgm_ops)",
+}
+
+# chave do pg_advisory_lock: duas execuções do comando (ex.: dois deploys) não disputam o mesmo DDL
+TRAVA_DDL_BUSCA = 7_261_022
+
+# um CREATE INDEX CONCURRENTLY que falhou deixa o índice INVALID: existe para o to_regclass e para o
+# IF NOT EXISTS, mas o planner não o usa
+CONSULTA_INDICE_INVALIDO = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relname = :nome AND NOT (i.indisvalid AND i.indisready))"
+)
+
+CONSULTA_INDICES = text(
+    "SELECT (SELECT count(*) FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relname IN ('ix_produto_busca_tsv', 'ix_produto_nome_trgm') AND i.indisvalid AND i.indisready) = 2 "
+    f"AND to_regprocedure('f_unaccent(text)') IS NOT NULL AND EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{CONFIG_BUSCA}')"
+)
+
+# se os índices estão prontos é reconferido no banco a cada BUSCA_VERIFICACAO_INDICES: criados depois do
+# boot (ou perdidos) eles passam a valer sem restart; até lá a busca usa o índice em memória
+class IndicesBusca:
+
+    def __init__(self, intervalo: float, clock=time.monotonic):
+        self.intervalo = intervalo
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.limpar()
+
+    def limpar(self):
+        self.prontos = False
+        self._proxima_verificacao = float("-inf")
+
+    def precisa_verificar(self) -> bool:
+        agora = self._clock()
+
+        with self._lock:
+            if agora < self._proxima_verificacao:
+                return False
+
+            # só uma request por intervalo consulta o catálogo do Postgres
+            self._proxima_verificacao = agora + self.intervalo
+
+            return True
+
+    def registrar(self, prontos: bool):
+        self.prontos = bool(prontos)
+
+indices_busca = IndicesBusca(intervalo=config.BUSCA_VERIFICACAO_INDICES)
+
+def busca_no_banco(db_session) -> bool:
+    if db_session.get_bind().dialect.name != "postgresql":
+        return False
+
+    if indices_busca.precisa_verificar():
+        indices_busca.registrar(db_session.execute(CONSULTA_INDICES).scalar())
+
+    return indices_busca.prontos
+
+async def busca_no_banco_async(db_session) -> bool:
+    if db_session.sync_session.get_bind().dialect.name != "postgresql":
+        return False
+
+    if indices_busca.precisa_verificar():
+        indices_busca.registrar(await db_session.scalar(CONSULTA_INDICES))
+
+    return indices_busca.prontos
+
+def preparar(engine) -> bool:
+    # CREATE INDEX CONCURRENTLY não roda dentro de transação e não bloqueia escritas em produto
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conexao:
+        conexao.execute(text("SELECT pg_advisory_lock(:chave)"), {"chave": TRAVA_DDL_BUSCA})
+
+        try:
+            for ddl in DDL_BUSCA:
+                conexao.exec_driver_sql(ddl)
+
+            for nome, ddl in INDICES_BUSCA.items():
+                if conexao.execute(CONSULTA_INDICE_INVALIDO, {"nome": nome}).scalar():
+                    conexao.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {nome}")
+
+                conexao.exec_driver_sql(ddl)
+
+            return bool(conexao.execute(CONSULTA_INDICES).scalar())
+        finally:
+            conexao.execute(text("SELECT pg_advisory_unlock(:chave)"), {"chave": TRAVA_DDL_BUSCA})
+
+def vetor_busca():
+    # literais (e não parâmetros) para a expressão casar com a do índice também no asyncpg
+    config = literal_column(f"'{CONFIG_BUSCA}'::regconfig")
+
+    return (func.setweight(func.to_tsvector(config, Produto.nome), literal_column("'A'"))
+            .op("||")(func.setweight(func.to_tsvector(config, Produto.descricao), literal_column("'B'"))))
+
+def query_busca(termo: str, limite: int, offset: int):
+    vetor = vetor_busca()
+    consulta = func.websearch_to_tsquery(literal_column(f"'{CONFIG_BUSCA}'::regconfig"), termo)
+    nome = func.f_unaccent(func.lower(Produto.nome))
+    termo_normalizado = func.f_unaccent(func.lower(termo))
+    # lexemas (nome pesa mais que descrição) + semelhança de palavra para erros de digitação
+    pontos = func.ts_rank_cd(vetor, consulta) + func.word_similarity(termo_normalizado, nome)
+
+    return (select(Produto)
+            .where(or_(vetor.op("@@")(consulta), termo_normalizado.op("<%")(nome)))
+            .order_by(pontos.desc(), Produto.id)
+            .limit(limite)
+            .offset(offset))
+
+def query_linhas_indice():
+
+    return select(Produto.id, Produto.nome, Produto.descricao)
+
+def query_por_ids(ids: list[int]):
+
+    return select(Produto).where(Produto.id.in_(ids))
+
+def na_ordem(produtos, ids: list[int]) -> list:
+    por_id = {produto.id: produto for produto in produtos}
+
+    return [por_id[id] for id in ids if id in por_id]
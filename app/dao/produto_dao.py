@@ -1,8 +1,14 @@
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.exc import IntegrityError
 from decimal import Decimal
 
 from app.models.produto import Produto
 from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
+from app.dao.produto_busca import busca_no_banco, query_busca, query_linhas_indice, query_por_ids, na_ordem
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+from app.infrastructure.cache.busca_produtos import indice_produtos
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.config import EXPORT_YIELD_PER
 
 class ProdutoDAO:
     
@@ -10,30 +16,61 @@ class ProdutoDAO:
         self.db_session = db_session
 
     def criar_produto(self, produto: Produto) :
-        db_produto = Produto(
-            nome=produto.nome,
-            descricao=produto.descricao,
-            preco=Decimal(produto.preco),
-            categoria=produto.categoria
-        )
-
+        # INSERT ... RETURNING: o id e os valores gravados voltam no mesmo statement, sem refresh
         try:
-            self.db_session.add(db_produto)
+            rows = self.db_session.execute(query_criacao([produto])).all()
             self.db_session.commit()
         except IntegrityError as e:
             self.db_session.rollback()
             
             raise Exception(f"Erro de integridade ao salvar o produto: {e}")
-        
-        self.db_session.refresh(db_produto)
-        
-        return db_produto
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos[0]
     
-    def listar_todos(self) -> Produto | None :
-        
-        return (self.db_session
+    def criar_produtos(self, produtos: list[Produto]) -> list[Produto]:
+        # um único INSERT ... VALUES (...), (...) RETURNING em vez de um commit + refresh por produto
+        try:
+            rows = self.db_session.execute(query_criacao(produtos)).all()
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao salvar os produtos: {e}")
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos
+
+    def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Produto] :
+        # a categoria vem do registro em memória, sem join com categoria_produto
+        # keyset: "id > :apos_id ORDER BY id LIMIT n" percorre o índice da PK, sem OFFSET
+        query = (self.db_session
                 .query(Produto)
-                .all())
+                .order_by(Produto.id))
+
+        if apos_id is not None:
+            query = query.filter(Produto.id > apos_id)
+
+        if limite is not None:
+            query = query.limit(limite)
+
+        return query.all()
+
+    def exportar(self):
+        # yield_per usa cursor do lado do servidor: a memória fica limitada a um lote
+        result = self.db_session.execute(
+            select(Produto)
+            .order_by(Produto.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+
+        yield from result.scalars()
 
     def listar_por_categoria(self, categoria: CategoriaProdutoEnum) -> Produto | None :
         
@@ -48,31 +85,100 @@ class ProdutoDAO:
                 .filter(Produto.id == id)
                 .first())
 
-    def atualizar_produto(self, id: int, produto_data: Produto) -> Produto:
-        produto = self.buscar_por_id(id)
-        
-        if produto:
-            produto.nome = produto_data.nome
-            produto.descricao = produto_data.descricao
-            produto.preco = Decimal(produto_data.preco)
-            produto.categoria = produto_data.categoria
-
-            try:
-                self.db_session.commit()
-            except IntegrityError as e:
-                self.db_session.rollback()
-
-                raise Exception(f"Erro de integridade ao atualizar o produto: {e}")
-            
-            self.db_session.refresh(produto)
+    def nomes(self) -> list[tuple[int, str]]:
+
+        return self.db_session.execute(select(Produto.id, Produto.nome)).all()
+
+    def buscar_por_termo(self, termo: str, limite: int, offset: int = 0) -> list[Produto]:
+        if busca_no_banco(self.db_session):
+            return self.db_session.execute(query_busca(termo, limite, offset)).scalars().all()
+
+        versao = catalogo_versao.versao
 
-        return produto
+        if indice_produtos.precisa_carregar(versao):
+            indice_produtos.carregar(self.db_session.execute(query_linhas_indice()).all(), versao)
+
+        ids = indice_produtos.buscar(termo)[offset:offset + limite]
+
+        if not ids:
+            return []
+
+        return na_ordem(self.db_session.execute(query_por_ids(ids)).scalars().all(), ids)
+
+    def atualizar_produto(self, id: int, produto_data: Produto) -> Produto | None:
+        # um único UPDATE ... RETURNING: sem SELECT antes nem refresh depois; o nome da categoria vem do registro
+        try:
+            rows = self.db_session.execute(query_atualizacao(id, produto_data)).all()
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+
+            raise Exception(f"Erro de integridade ao atualizar o produto: {e}")
+
+        if not rows:
+            return None
+
+        catalogo_versao.incrementar()
+        produtos = produtos_de_returning(rows)
+        indice_autocomplete.registrar_produtos(produtos)
+
+        return produtos[0]
 
     def deletar_produto(self, id: int) -> None :
-        produto = self.buscar_por_id(id)
-        
-        if not produto:
+        # DELETE ... RETURNING id: a ausência de linha afetada é o "não encontrado", sem SELECT antes
+        rows = self.db_session.execute(query_remocao(id)).all()
+
+        if not rows:
+            self.db_session.rollback()
+
             raise ValueError("Produto não encontrado")
-        
-        self.db_session.delete(produto)
-        self.db_session.commit()
\ No newline at end of file
+
+        self.db_session.commit()
+        catalogo_versao.incrementar()
+        indice_autocomplete.remover(id)
+
+COLUNAS_RETURNING = (Produto.id, Produto.nome, Produto.descricao, Produto.preco, Produto.categoria)
+
+def query_criacao(produtos: list[Produto]):
+
+    return (insert(Produto)
+            .values([{
+                "nome": produto.nome,
+                "descricao": produto.descricao,
+                "preco": Decimal(produto.preco),
+                "categoria": produto.categoria
+            } for produto in produtos])
+            .returning(*COLUNAS_RETURNING))
+
+def query_atualizacao(id: int, produto_data: Produto):
+
+    return (update(Produto)
+            .where(Produto.id == id)
+            .values(
+                nome=produto_data.nome,
+                descricao=produto_data.descricao,
+                preco=Decimal(produto_data.preco),
+                categoria=produto_data.categoria
+            )
+            .returning(*COLUNAS_RETURNING)
+            .execution_options(synchronize_session=False))
+
+def query_remocao(id: int):
+
+    return (delete(Produto)
+            .where(Produto.id == id)
+            .returning(Produto.id)
+            .execution_options(synchronize_session=False))
+
+def produtos_de_returning(rows) -> list[Produto]:
+    # objetos transientes montados a partir do RETURNING: não expiram no commit nem voltam ao banco
+    return [
+        Produto(
+            id=row.id,
+            nome=row.nome,
+            descricao=row.descricao,
+            preco=row.preco,
+            categoria=row.categoria
+        )
+        for row in sorted(rows, key=lambda row: row.id)
+    ]
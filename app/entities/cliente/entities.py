@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from app.entities.cliente.models import Cliente
 
@@ -8,6 +8,10 @@ class ClienteEntities(ABC):
     def criar_cliente(self, cliente: Cliente) -> Cliente:
         pass
 
+    @abstractmethod
+    def conflitos(self, cpf: Optional[str] = None, email: Optional[str] = None) -> set[str]:
+        pass
+
     @abstractmethod
     def buscar_por_cpf(self, cpf_cliente: str) -> Optional[Cliente]:
         pass
@@ -17,13 +21,25 @@ class ClienteEntities(ABC):
         pass
 
     @abstractmethod
-    def listar_todos(self) -> List[Cliente]:
+    def listar_todos(self, limite: Optional[int] = None, apos_id: Optional[int] = None) -> List[Cliente]:
+        pass
+
+    @abstractmethod
+    def exportar(self) -> Iterator[Cliente]:
+        pass
+
+    @abstractmethod
+    def importar(self, clientes: Iterable[dict]) -> dict:
         pass
 
     @abstractmethod
     def atualizar_cliente(self, cliente: Cliente) -> Cliente:
         pass
 
+    @abstractmethod
+    def atualizar_parcial(self, id: int, campos: dict) -> Optional[Cliente]:
+        pass
+
     @abstractmethod
     def deletar_cliente(self, id: int) -> None:
         pass
\ No newline at end of file
@@ -8,11 +8,29 @@ class ProdutoEntities(ABC):
     def criar_produto(self, produto: Produto): pass
     
     @abstractmethod
-    def listar_todos(self): pass
+    def criar_produtos(self, produtos: list[Produto]): pass
+
+    @abstractmethod
+    def categorias(self, ids): pass
+
+    @abstractmethod
+    def listar_todos(self, limite: int | None = None, apos_id: int | None = None): pass
+
+    @abstractmethod
+    def listar_cardapio(self): pass
     
+    @abstractmethod
+    def exportar(self): pass
+
     @abstractmethod
     def buscar_por_id(self, id: int): pass
+
+    @abstractmethod
+    def buscar_por_termo(self, termo: str, limite: int, offset: int = 0): pass
     
+    @abstractmethod
+    def autocompletar(self, prefixo: str, limite: int): pass
+
     @abstractmethod
     def atualizar_produto(self, id: int, produto_data: Produto): pass
     
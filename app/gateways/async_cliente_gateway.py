@@ -0,0 +1,101 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.entities.cliente.models import Cliente
+from app.entities.cliente.entities import ClienteEntities
+from app.infrastructure.cache import clientes
+from app.infrastructure.cache.bloom import filtros_clientes
+from app.infrastructure.metrics import metrics
+from app.infrastructure.cache.ttl_cache import MISSING
+from app.dao.async_cliente_dao import AsyncClienteDAO
+from app.infrastructure.db import replica
+
+class AsyncClienteGateway(ClienteEntities):
+    def __init__(self, db_session: AsyncSession, leitura_session: AsyncSession | None = None):
+        self.dao = AsyncClienteDAO(db_session)
+        self.leitura_dao = AsyncClienteDAO(leitura_session) if leitura_session is not None else None
+
+    async def criar_cliente(self, cliente: Cliente) -> Cliente:
+        criado = await self.dao.criar_cliente(cliente)
+        # o cpf pode estar no cache negativo de uma consulta anterior ao cadastro
+        clientes.invalidar_cpf(criado.cpf)
+        filtros_clientes.adicionar(cpf=criado.cpf, email=criado.email)
+
+        return criado
+
+    async def conflitos(self, cpf: str | None = None, email: str | None = None) -> set[str]:
+        suspeitos = filtros_clientes.suspeitos(cpf=cpf, email=email)
+
+        # filtros ainda não carregados: a unicidade fica só por conta do IntegrityError no INSERT
+        if suspeitos is None:
+            return set()
+
+        # nenhum filtro acusou: com certeza não existe, dispensa a consulta
+        if not suspeitos:
+            metrics.incr("clientes.bloom", resultado="ausente")
+
+            return set()
+
+        existentes = await self.dao.conflitos(**{campo: valor for campo, valor in (("cpf", cpf), ("email", email)) if campo in suspeitos})
+        metrics.incr("clientes.bloom", resultado="confirmado" if existentes else "falso_positivo")
+
+        return existentes
+
+    async def buscar_por_cpf(self, cpf_cliente: str) -> Optional[Cliente]:
+        cliente = clientes.buscar_por_cpf(cpf_cliente)
+
+        if cliente is MISSING:
+            geracao = clientes.geracao()
+            cliente = await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_cpf(cpf_cliente))
+            clientes.guardar(cpf_cliente, cliente, geracao, da_replica=self.leitura_dao is not None)
+
+        return cliente
+
+    async def buscar_por_id(self, id: int) -> Optional[Cliente]:
+
+        return await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_id(id))
+
+    async def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> List[Cliente]:
+
+        return await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.listar_todos(limite=limite, apos_id=apos_id))
+
+    def exportar(self):
+
+        return self.dao.exportar()
+
+    async def importar(self, registros) -> dict:
+        resultado = await self.dao.importar(self._registrar_chaves(registros))
+        clientes.limpar()
+
+        return resultado
+
+    async def atualizar_cliente(self, id:int, cliente: Cliente) -> Cliente:
+        atualizado = await self.dao.atualizar_cliente(id, cliente)
+        self._invalidar_atualizacao(id, atualizado)
+
+        return atualizado
+
+    async def atualizar_parcial(self, id: int, campos: dict) -> Optional[Cliente]:
+        atualizado = await self.dao.atualizar_parcial(id, campos)
+        self._invalidar_atualizacao(id, atualizado)
+
+        return atualizado
+
+    async def deletar_cliente(self, id: int) -> None:
+        await self.dao.deletar_cliente(id)
+        clientes.invalidar_cliente(id)
+
+    def _invalidar_atualizacao(self, id: int, atualizado):
+        # a tag do id remove a entrada do cpf antigo; o novo cpf pode estar no cache negativo
+        clientes.invalidar_cliente(id)
+
+        if atualizado is not None:
+            clientes.invalidar_cpf(atualizado.cpf)
+            filtros_clientes.adicionar(cpf=atualizado.cpf, email=atualizado.email)
+
+    def _registrar_chaves(self, registros):
+        # linhas rejeitadas pelo banco também entram: viram só falsos positivos
+        for registro in registros:
+            filtros_clientes.adicionar(cpf=registro.get("cpf"), email=registro.get("email"))
+
+            yield registro
@@ -0,0 +1,126 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.entities.produto.entities import ProdutoEntities
+from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
+from app.models.produto import Produto
+from app.dao.async_produto_dao import AsyncProdutoDAO
+from app.dao.async_categoria_produto_dao import AsyncCategoriaProdutoDAO
+from app.infrastructure.cache import catalogo
+from app.infrastructure.cache.categorias import registro_categorias
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.cache.ttl_cache import MISSING
+from app.infrastructure.db import replica
+from app.dao.produto_busca import busca_no_banco_async
+
+class AsyncProdutoGateway(ProdutoEntities):
+    def __init__(self, db_session: AsyncSession, leitura_session: AsyncSession | None = None):
+        self.dao = AsyncProdutoDAO(db_session)
+        self.leitura_dao = AsyncProdutoDAO(leitura_session) if leitura_session is not None else None
+        self.categorias_dao = AsyncCategoriaProdutoDAO(db_session)
+
+    async def criar_produto(self, produto: Produto) -> Produto:
+        await self._validar_categoria(produto.categoria)
+        produto_criado = await self.dao.criar_produto(produto)
+        catalogo.invalidar_criacao(produto_criado)
+
+        return produto_criado
+
+    async def criar_produtos(self, produtos: list[Produto]) -> list[Produto]:
+        produtos_criados = await self.dao.criar_produtos(produtos)
+
+        for produto in produtos_criados:
+            catalogo.invalidar_criacao(produto)
+
+        return produtos_criados
+
+    async def categorias(self, ids) -> dict[int, str]:
+        ids = {int(id) for id in ids}
+
+        if registro_categorias.precisa_carregar(ids):
+            registro_categorias.substituir(await self.categorias_dao.listar_todas())
+
+        return registro_categorias.buscar(ids)
+
+    async def _validar_categoria(self, categoria):
+        # id inexistente é recusado aqui, sem o INSERT/UPDATE e o IntegrityError
+        if categoria is not None and not await self.categorias({categoria}):
+            raise Exception(f"Categoria {int(categoria)} não encontrada")
+
+    async def _garantir_categorias(self, produtos):
+        # o use case lê as categorias do registro; produtos com categoria desconhecida forçam a recarga
+        await self.categorias({produto.categoria for produto in produtos if produto is not None and produto.categoria is not None})
+
+        return produtos
+
+    async def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Produto]:
+        pagina = (limite, apos_id)
+        produtos = catalogo.buscar_lista(catalogo.LISTA_TODOS, pagina)
+
+        if produtos is MISSING:
+            geracao = catalogo.geracao()
+            produtos = await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.listar_todos(limite=limite, apos_id=apos_id))
+            catalogo.guardar_lista(catalogo.LISTA_TODOS, produtos, geracao, pagina, da_replica=self.leitura_dao is not None)
+
+        return await self._garantir_categorias(produtos)
+
+    async def listar_cardapio(self) -> list[Produto]:
+
+        return await self._garantir_categorias(await self.dao.listar_todos())
+
+    async def exportar(self):
+        # export passa direto pelo cache: é uma leitura completa e única
+        async for produto in self.dao.exportar():
+            if registro_categorias.nome(produto.categoria) is None:
+                await self.categorias({produto.categoria})
+
+            yield produto
+
+    async def listar_por_categoria(self, categoria: CategoriaProdutoEnum) -> list[Produto]:
+        lista = catalogo.lista_categoria(categoria)
+        produtos = catalogo.buscar_lista(lista)
+
+        if produtos is MISSING:
+            geracao = catalogo.geracao()
+            produtos = await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.listar_por_categoria(categoria))
+            catalogo.guardar_lista(lista, produtos, geracao, da_replica=self.leitura_dao is not None)
+
+        return await self._garantir_categorias(produtos)
+
+    async def buscar_por_id(self, id: int) -> Produto:
+        produto = catalogo.buscar_produto(id)
+
+        if produto is MISSING:
+            geracao = catalogo.geracao()
+            produto = await replica.ler_async(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_id(id))
+            catalogo.guardar_produto(id, produto, geracao, da_replica=self.leitura_dao is not None)
+
+        await self._garantir_categorias([produto])
+
+        return produto
+
+    async def buscar_por_termo(self, termo: str, limite: int, offset: int = 0) -> list[Produto]:
+        # o índice em memória (fora do Postgres com os índices prontos) é do processo inteiro: vem do primário
+        leitura = self.leitura_dao if self.leitura_dao is not None and await busca_no_banco_async(self.leitura_dao.db_session) else None
+        produtos = await replica.ler_async(self.dao, leitura, lambda dao: dao.buscar_por_termo(termo, limite, offset))
+
+        return await self._garantir_categorias(produtos)
+
+    async def autocompletar(self, prefixo: str, limite: int) -> list[tuple[int, str]]:
+        if indice_autocomplete.precisa_carregar():
+            geracao = indice_autocomplete.geracao
+            # índice do processo inteiro, com as escritas deste processo já aplicadas: uma réplica atrasada
+            # as desfaria, então a recarga (uma consulta por AUTOCOMPLETE_TTL) é feita no primário
+            indice_autocomplete.carregar(await self.dao.nomes(), geracao)
+
+        return indice_autocomplete.sugerir(prefixo, limite)
+
+    async def atualizar_produto(self, id: int, produto_data: Produto) -> Produto:
+        await self._validar_categoria(produto_data.categoria)
+        produto = await self.dao.atualizar_produto(id, produto_data)
+        catalogo.invalidar_atualizacao(id, produto_data.categoria)
+
+        return produto
+
+    async def deletar_produto(self, id: int) -> None :
+        await self.dao.deletar_produto(id)
+        catalogo.invalidar_remocao(id)
@@ -4,16 +4,22 @@ from typing import Optional
 from app.entities.categoria_produto.entities import CategoriaProdutoRepositoryPort
 from app.entities.categoria_produto.models import CategoriaProduto
 from app.models.categoria_produto import CategoriaProduto as CategoriaProdutoORM
-from app.adapters.utils.debug import var_dump_die
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
 
 class CategoriaProdutoRepository(CategoriaProdutoRepositoryPort):
     def __init__(self, db_session: Session):
-        self.db_session = db_session
+        self.dao = CategoriaProdutoDAO(db_session)
 
     def buscar_por_id(self, id: int) -> Optional[CategoriaProduto]:
-        orm = self.db_session.query(CategoriaProdutoORM).filter_by(id=id).first()
-        
-        if not orm:
+        id = int(id)
+
+        if registro_categorias.precisa_carregar({id}):
+            registro_categorias.substituir(self.dao.listar_todas())
+
+        nome = registro_categorias.nome(id)
+
+        if nome is None:
             raise ValueError("Categoria de produto não encontrada")
         
-        return orm
\ No newline at end of file
+        return CategoriaProdutoORM(id=id, nome=nome)
@@ -5,32 +5,99 @@ from app.entities.cliente.models import Cliente
 from app.entities.cliente.entities import ClienteEntities
 from app.models.cliente import Cliente as ClienteORM
 from app.adapters.presenters.cliente_presenter import ClienteResponseSchema
+from app.infrastructure.cache import clientes
+from app.infrastructure.cache.bloom import filtros_clientes
+from app.infrastructure.metrics import metrics
+from app.infrastructure.cache.ttl_cache import MISSING
 from app.dao.cliente_dao import ClienteDAO
+from app.infrastructure.db import replica
 
 class ClienteGateway(ClienteEntities):
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, leitura_session: Session | None = None):
         self.dao = ClienteDAO(db_session)
+        self.leitura_dao = ClienteDAO(leitura_session) if leitura_session is not None else None
 
     def criar_cliente(self, cliente: Cliente) -> Cliente:
-        
-        return self.dao.criar_cliente(cliente)
+        criado = self.dao.criar_cliente(cliente)
+        # o cpf pode estar no cache negativo de uma consulta anterior ao cadastro
+        clientes.invalidar_cpf(criado.cpf)
+        filtros_clientes.adicionar(cpf=criado.cpf, email=criado.email)
+
+        return criado
+
+    def conflitos(self, cpf: str | None = None, email: str | None = None) -> set[str]:
+        suspeitos = filtros_clientes.suspeitos(cpf=cpf, email=email)
+
+        # filtros ainda não carregados: a unicidade fica só por conta do IntegrityError no INSERT
+        if suspeitos is None:
+            return set()
+
+        # nenhum filtro acusou: com certeza não existe, dispensa a consulta
+        if not suspeitos:
+            metrics.incr("clientes.bloom", resultado="ausente")
+
+            return set()
+
+        existentes = self.dao.conflitos(**{campo: valor for campo, valor in (("cpf", cpf), ("email", email)) if campo in suspeitos})
+        metrics.incr("clientes.bloom", resultado="confirmado" if existentes else "falso_positivo")
+
+        return existentes
 
     def buscar_por_cpf(self, cpf_cliente: str) -> Optional[Cliente]:
+        cliente = clientes.buscar_por_cpf(cpf_cliente)
+
+        if cliente is MISSING:
+            geracao = clientes.geracao()
+            cliente = replica.ler(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_cpf(cpf_cliente))
+            clientes.guardar(cpf_cliente, cliente, geracao, da_replica=self.leitura_dao is not None)
 
-        return self.dao.buscar_por_cpf(cpf_cliente)
+        return cliente
 
     def buscar_por_id(self, id: int) -> Optional[Cliente]:
         
-        return self.dao.buscar_por_id(id)
+        return replica.ler(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_id(id))
 
-    def listar_todos(self) -> List[Cliente]:
-        
-        return self.dao.listar_todos()
+    def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> List[Cliente]:
+
+        return replica.ler(self.dao, self.leitura_dao, lambda dao: dao.listar_todos(limite=limite, apos_id=apos_id))
+
+    def exportar(self):
+
+        return self.dao.exportar()
+
+    def importar(self, registros) -> dict:
+        resultado = self.dao.importar(self._registrar_chaves(registros))
+        clientes.limpar()
+
+        return resultado
 
     def atualizar_cliente(self, id:int, cliente: Cliente) -> Cliente:
+        atualizado = self.dao.atualizar_cliente(id, cliente)
+        self._invalidar_atualizacao(id, atualizado)
+
+        return atualizado
+
+    def atualizar_parcial(self, id: int, campos: dict) -> Optional[Cliente]:
+        atualizado = self.dao.atualizar_parcial(id, campos)
+        self._invalidar_atualizacao(id, atualizado)
 
-        return self.dao.atualizar_cliente(id, cliente)
+        return atualizado
 
     def deletar_cliente(self, id: int) -> None:
-        
-        return self.dao.deletar_cliente(id)
\ No newline at end of file
+        self.dao.deletar_cliente(id)
+        clientes.invalidar_cliente(id)
+
+    def _invalidar_atualizacao(self, id: int, atualizado):
+        # a tag do id remove a entrada do cpf antigo; o novo cpf pode estar no cache negativo
+        clientes.invalidar_cliente(id)
+
+        if atualizado is not None:
+            clientes.invalidar_cpf(atualizado.cpf)
+            filtros_clientes.adicionar(cpf=atualizado.cpf, email=atualizado.email)
+
+    def _registrar_chaves(self, registros):
+        # linhas rejeitadas pelo banco também entram: viram só falsos positivos
+        for registro in registros:
+            filtros_clientes.adicionar(cpf=registro.get("cpf"), email=registro.get("email"))
+
+            yield registro
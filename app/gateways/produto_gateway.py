@@ -7,32 +7,126 @@ from app.entities.produto.models import Produto
 from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
 from app.models.produto import Produto
 from app.dao.produto_dao import ProdutoDAO
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache import catalogo
+from app.infrastructure.cache.categorias import registro_categorias
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.cache.ttl_cache import MISSING
+from app.infrastructure.db import replica
+from app.dao.produto_busca import busca_no_banco
 
 class ProdutoGateway(ProdutoEntities):
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, leitura_session: Session | None = None):
         self.dao = ProdutoDAO(db_session)
+        self.leitura_dao = ProdutoDAO(leitura_session) if leitura_session is not None else None
+        self.categorias_dao = CategoriaProdutoDAO(db_session)
 
     def criar_produto(self, produto: Produto) -> Produto:
-        
-        return self.dao.criar_produto(produto)
+        self._validar_categoria(produto.categoria)
+        produto_criado = self.dao.criar_produto(produto)
+        catalogo.invalidar_criacao(produto_criado)
 
-    def listar_todos(self) -> list[Produto]:
-        
-        return self.dao.listar_todos()
+        return produto_criado
+
+    def criar_produtos(self, produtos: list[Produto]) -> list[Produto]:
+        produtos_criados = self.dao.criar_produtos(produtos)
+
+        for produto in produtos_criados:
+            catalogo.invalidar_criacao(produto)
+
+        return produtos_criados
+
+    def categorias(self, ids) -> dict[int, str]:
+        ids = {int(id) for id in ids}
+
+        if registro_categorias.precisa_carregar(ids):
+            registro_categorias.substituir(self.categorias_dao.listar_todas())
+
+        return registro_categorias.buscar(ids)
+
+    def _validar_categoria(self, categoria):
+        # id inexistente é recusado aqui, sem o INSERT/UPDATE e o IntegrityError
+        if categoria is not None and not self.categorias({categoria}):
+            raise Exception(f"Categoria {int(categoria)} não encontrada")
+
+    def _garantir_categorias(self, produtos):
+        # o use case lê as categorias do registro; produtos com categoria desconhecida forçam a recarga
+        self.categorias({produto.categoria for produto in produtos if produto is not None and produto.categoria is not None})
+
+        return produtos
+
+    def listar_todos(self, limite: int | None = None, apos_id: int | None = None) -> list[Produto]:
+        pagina = (limite, apos_id)
+        produtos = catalogo.buscar_lista(catalogo.LISTA_TODOS, pagina)
+
+        if produtos is MISSING:
+            geracao = catalogo.geracao()
+            produtos = replica.ler(self.dao, self.leitura_dao, lambda dao: dao.listar_todos(limite=limite, apos_id=apos_id))
+            catalogo.guardar_lista(catalogo.LISTA_TODOS, produtos, geracao, pagina, da_replica=self.leitura_dao is not None)
+
+        return self._garantir_categorias(produtos)
+
+    def listar_cardapio(self) -> list[Produto]:
+        # o snapshot do cardápio é do processo inteiro e sai com a versão atual do catálogo: nem a
+        # réplica atrasada nem o cache (que pode ter guardado uma leitura dela) entram nele
+        return self._garantir_categorias(self.dao.listar_todos())
     
+    def exportar(self):
+        # export passa direto pelo cache: é uma leitura completa e única
+        for produto in self.dao.exportar():
+            if registro_categorias.nome(produto.categoria) is None:
+                self.categorias({produto.categoria})
+
+            yield produto
+
     def listar_por_categoria(self, categoria: CategoriaProdutoEnum) -> list[Produto]:
-        
-        return self.dao.listar_por_categoria(categoria)
+        lista = catalogo.lista_categoria(categoria)
+        produtos = catalogo.buscar_lista(lista)
+
+        if produtos is MISSING:
+            geracao = catalogo.geracao()
+            produtos = replica.ler(self.dao, self.leitura_dao, lambda dao: dao.listar_por_categoria(categoria))
+            catalogo.guardar_lista(lista, produtos, geracao, da_replica=self.leitura_dao is not None)
+
+        return self._garantir_categorias(produtos)
     
     def buscar_por_id(self, id: int) -> Produto:
-       
-       return self.dao.buscar_por_id(id)
+        produto = catalogo.buscar_produto(id)
+
+        if produto is MISSING:
+            geracao = catalogo.geracao()
+            produto = replica.ler(self.dao, self.leitura_dao, lambda dao: dao.buscar_por_id(id))
+            catalogo.guardar_produto(id, produto, geracao, da_replica=self.leitura_dao is not None)
+
+        self._garantir_categorias([produto])
+
+        return produto
+
+    def buscar_por_termo(self, termo: str, limite: int, offset: int = 0) -> list[Produto]:
+        # o índice em memória (fora do Postgres com os índices prontos) é do processo inteiro: vem do primário
+        leitura = self.leitura_dao if self.leitura_dao is not None and busca_no_banco(self.leitura_dao.db_session) else None
+        produtos = replica.ler(self.dao, leitura, lambda dao: dao.buscar_por_termo(termo, limite, offset))
+
+        return self._garantir_categorias(produtos)
+
+    def autocompletar(self, prefixo: str, limite: int) -> list[tuple[int, str]]:
+        # o banco só é consultado para (re)carregar o índice, nunca por tecla digitada
+        if indice_autocomplete.precisa_carregar():
+            geracao = indice_autocomplete.geracao
+            # índice do processo inteiro, com as escritas deste processo já aplicadas: uma réplica atrasada
+            # as desfaria, então a recarga (uma consulta por AUTOCOMPLETE_TTL) é feita no primário
+            indice_autocomplete.carregar(self.dao.nomes(), geracao)
+
+        return indice_autocomplete.sugerir(prefixo, limite)
 
     def atualizar_produto(self, id: int, produto_data: Produto) -> Produto:
-        
-        return self.dao.atualizar_produto(id, produto_data)
+        self._validar_categoria(produto_data.categoria)
+        produto = self.dao.atualizar_produto(id, produto_data)
+        catalogo.invalidar_atualizacao(id, produto_data.categoria)
+
+        return produto
     
     def deletar_produto(self, id: int) -> None :
-        
-        return self.dao.deletar_produto(id)
+        self.dao.deletar_produto(id)
+        catalogo.invalidar_remocao(id)
     
\ No newline at end of file
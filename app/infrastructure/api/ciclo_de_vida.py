@@ -0,0 +1,63 @@
+import logging
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi.concurrency import run_in_threadpool
+
+from app.infrastructure import config
+
+logger = logging.getLogger(__name__)
+
+def carregar_categorias():
+    from app.infrastructure.db.database import SessionLocal
+    from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+    from app.infrastructure.cache.categorias import registro_categorias
+
+    with SessionLocal() as db:
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+def carregar_filtros_clientes():
+    from app.infrastructure.db.database import SessionLocal
+    from app.dao.cliente_dao import ClienteDAO
+    from app.infrastructure.cache.bloom import filtros_clientes
+
+    if not filtros_clientes.enabled:
+        return
+
+    with SessionLocal() as db:
+        filtros_clientes.carregar(ClienteDAO(db).chaves())
+
+def carregar_autocomplete():
+    from app.infrastructure.db.database import SessionLocal
+    from app.dao.produto_dao import ProdutoDAO
+    from app.infrastructure.cache.autocomplete import indice_autocomplete
+
+    geracao = indice_autocomplete.geracao
+
+    with SessionLocal() as db:
+        indice_autocomplete.carregar(ProdutoDAO(db).nomes(), geracao)
+
+def montar_cardapio():
+    from app.infrastructure.db.database import SessionLocal
+    from app.gateways.produto_gateway import ProdutoGateway
+    from app.use_cases.produto_use_case import ProdutoUseCase
+
+    with SessionLocal() as db:
+        ProdutoUseCase(ProdutoGateway(db)).cardapio()
+
+# executadas antes da primeira request; cada uma também se recupera sob demanda se falhar aqui
+# (sem os filtros de clientes a criação apenas não faz a pré-checagem de duplicidade)
+TAREFAS_DE_INICIO = [carregar_categorias, carregar_filtros_clientes, carregar_autocomplete, montar_cardapio]
+
+@asynccontextmanager
+async def lifespan(app):
+    # o limitador é do event loop de cada worker, então precisa ser ajustado aqui e não no import
+    anyio.to_thread.current_default_thread_limiter().total_tokens = config.THREADPOOL_TAMANHO
+
+    for tarefa in TAREFAS_DE_INICIO:
+        try:
+            await run_in_threadpool(tarefa)
+        except Exception:
+            logger.exception("Falha na tarefa de inicialização %s", tarefa.__name__)
+
+    yield
@@ -0,0 +1,202 @@
+import re
+import time
+from functools import lru_cache
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.adapters.utils.compressao import IDENTIDADE, codificacoes_disponiveis, compressor, escolher_codificacao
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+SEM_CORPO = {204, 304}
+
+def niveis_padrao() -> dict[str, int]:
+
+    return {
+        "gzip": config.COMPRESSAO_GZIP_NIVEL,
+        "br": config.COMPRESSAO_BROTLI_QUALIDADE,
+        "zstd": config.COMPRESSAO_ZSTD_NIVEL,
+    }
+
+# "METODO regex=nivel" separados por ";" (ex.: "GET /export$=1;GET ^/clientes/=4")
+@lru_cache(maxsize=8)
+def ler_regras(texto: str) -> tuple[tuple[str, re.Pattern, int], ...]:
+    regras = []
+
+    for item in texto.split(";"):
+        item = item.strip()
+
+        if not item:
+            continue
+
+        rota, _, nivel_regra = item.rpartition("=")
+        metodo, _, padrao = rota.strip().partition(" ")
+
+        if not padrao.strip() or not nivel_regra.strip():
+            raise ValueError(f"Regra de compressão inválida: {item!r}")
+
+        regras.append((metodo.upper(), re.compile(padrao.strip()), int(nivel_regra)))
+
+    return tuple(regras)
+
+# primeira regra que casar define o nível (em todas as codificações); o resto usa niveis_padrao()
+def regras_compressao() -> tuple[tuple[str, re.Pattern, int], ...]:
+
+    return ler_regras(config.COMPRESSAO_NIVEIS_ROTAS)
+
+def nivel(metodo: str, caminho: str, codificacao: str) -> int:
+    for metodo_regra, padrao, nivel_regra in regras_compressao():
+        if metodo == metodo_regra and padrao.search(caminho):
+            return nivel_regra
+
+    return niveis_padrao()[codificacao]
+
+def tipo_compressivel(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+
+    tipos = {tipo.strip().lower() for tipo in config.COMPRESSAO_TIPOS.split(",")}
+
+    return content_type.split(";")[0].strip().lower() in tipos
+
+def adicionar_vary(headers: MutableHeaders):
+    vary = headers.get("vary", "")
+
+    if "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+
+class RespostaComprimida:
+
+    def __init__(self, scope, send, codificacao: str):
+        self.scope = scope
+        self.send = send
+        self.codificacao = codificacao
+        self.inicio = None
+        self.compressor = None
+        self.direto = False
+        self.inicio_enviado = False
+        self.originais = 0
+        self.enviados = 0
+        self.cpu = 0.0
+
+    async def enviar(self, message):
+        if self.direto:
+            return await self.send(message)
+
+        if message["type"] == "http.response.start":
+            return await self._iniciar(message)
+
+        if message["type"] != "http.response.body":
+            return await self.send(message)
+
+        corpo = message.get("body", b"")
+        mais = message.get("more_body", False)
+
+        if self.compressor is None:
+            # corpo inteiro numa mensagem abaixo do mínimo: comprimir custaria mais do que economiza
+            if not mais and len(corpo) < config.COMPRESSAO_MINIMO:
+                return await self._ignorar("tamanho", message)
+
+            await self._comecar(streaming=mais)
+
+        dados = self._comprimir(corpo, mais)
+
+        if not self.inicio_enviado:
+            MutableHeaders(scope=self.inicio)["Content-Length"] = str(len(dados))
+            await self.send(self.inicio)
+            self.inicio_enviado = True
+
+        await self.send({"type": "http.response.body", "body": dados, "more_body": mais})
+
+        if not mais:
+            self._registrar()
+
+    async def _iniciar(self, message):
+        self.inicio = message
+        headers = MutableHeaders(scope=message)
+
+        if message["status"] < 200 or message["status"] in SEM_CORPO:
+            return await self._ignorar(None, message)
+
+        # corpo já codificado pela rota (ex.: variantes pré-comprimidas do cardápio)
+        if "content-encoding" in headers:
+            return await self._ignorar("codificada", message)
+
+        if not tipo_compressivel(headers.get("content-type")):
+            return await self._ignorar("tipo", message)
+
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return await self._ignorar("no-transform", message)
+
+        adicionar_vary(headers)
+
+        if self.codificacao == IDENTIDADE:
+            return await self._ignorar("cliente", message)
+
+        tamanho = headers.get("content-length")
+
+        if tamanho is not None and int(tamanho) < config.COMPRESSAO_MINIMO:
+            return await self._ignorar("tamanho", message)
+
+    async def _ignorar(self, motivo: str | None, message):
+        self.direto = True
+
+        if motivo:
+            metrics.incr("compressao.ignoradas", motivo=motivo)
+
+        if message is not self.inicio:
+            await self.send(self.inicio)
+
+        await self.send(message)
+
+    async def _comecar(self, streaming: bool):
+        self.compressor = compressor(
+            self.codificacao,
+            nivel(self.scope["method"], self.scope["path"], self.codificacao)
+        )
+        headers = MutableHeaders(scope=self.inicio)
+        headers["Content-Encoding"] = self.codificacao
+
+        # outra representação: o ETag forte da rota vira fraco (If-None-Match já compara fraco)
+        etag = headers.get("etag")
+
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+
+        if streaming:
+            # o tamanho final só é conhecido no fim; sem Content-Length o servidor usa chunked
+            if "content-length" in headers:
+                del headers["content-length"]
+
+            await self.send(self.inicio)
+            self.inicio_enviado = True
+
+    def _comprimir(self, corpo: bytes, mais: bool) -> bytes:
+        inicio = time.thread_time()
+        dados = self.compressor.parte(corpo) if mais else self.compressor.fim(corpo)
+        self.cpu += time.thread_time() - inicio
+        self.originais += len(corpo)
+        self.enviados += len(dados)
+
+        return dados
+
+    def _registrar(self):
+        metrics.incr("compressao.respostas", codificacao=self.codificacao)
+        metrics.incr("compressao.bytes_originais", self.originais, codificacao=self.codificacao)
+        metrics.incr("compressao.bytes_enviados", self.enviados, codificacao=self.codificacao)
+        metrics.incr("compressao.bytes_economizados", self.originais - self.enviados, codificacao=self.codificacao)
+        metrics.observe("compressao.cpu_segundos", self.cpu, codificacao=self.codificacao)
+
+class CompressaoMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.COMPRESSAO_ENABLED or scope["method"] == "HEAD":
+            return await self.app(scope, receive, send)
+
+        codificacao = escolher_codificacao(Headers(scope=scope).get("accept-encoding"), codificacoes_disponiveis())
+        resposta = RespostaComprimida(scope, send, codificacao)
+
+        await self.app(scope, receive, resposta.enviar)
@@ -1,7 +1,24 @@
 from fastapi import FastAPI, Depends
 
+from app.infrastructure.api.ciclo_de_vida import lifespan
+from app.infrastructure.api.compressao import CompressaoMiddleware
+from app.infrastructure.api.idempotencia import IdempotenciaMiddleware
+from app.infrastructure.api.leitura_propria import LeituraPropriaMiddleware
+from app.infrastructure.api.limite_concorrencia import LimiteConcorrenciaMiddleware
+from app.infrastructure.api.prazo import PrazoMiddleware
+
 app = FastAPI(
     title="Sistema de Autoatendimento da Lanchonete",
     description="Documentacao automatica via Swagger e Redoc",
     version="1.0.0",
-)
\ No newline at end of file
+    lifespan=lifespan,
+)
+
+# o último adicionado é o mais externo: repetições idempotentes são servidas sem ocupar vaga no limite,
+# e o 504 de prazo esgotado conta como sobrecarga para o limite adaptativo; a compressão fica por fora de todos
+# para a idempotência guardar o corpo original e repeti-lo no Accept-Encoding de cada nova tentativa
+app.add_middleware(LeituraPropriaMiddleware)
+app.add_middleware(PrazoMiddleware)
+app.add_middleware(LimiteConcorrenciaMiddleware)
+app.add_middleware(IdempotenciaMiddleware)
+app.add_middleware(CompressaoMiddleware)
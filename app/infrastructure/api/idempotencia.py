@@ -0,0 +1,144 @@
+import anyio
+import hashlib
+import time
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from app.infrastructure import config
+from app.infrastructure.cache import idempotencia
+from app.infrastructure.cache.idempotencia import Registro
+from app.infrastructure.metrics import metrics
+
+HEADER = "idempotency-key"
+CHAVE_TAMANHO_MAXIMO = 255
+INTERVALO_ESPERA = 0.05
+
+# POST JSON com Idempotency-Key: a primeira resposta fica guardada e é repetida nas novas tentativas
+# do totem sem chegar às rotas/DAOs; uma duplicata simultânea espera a execução original terminar
+class IdempotenciaMiddleware:
+
+    def __init__(self, app, armazem=None, espera: float | None = None):
+        self.app = app
+        self.armazem = armazem
+        self.espera = espera
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not config.IDEMPOTENCIA_ENABLED:
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        chave = headers.get(HEADER)
+
+        # uploads (import de clientes) não são bufferizados para o hash do corpo
+        if not chave or not headers.get("content-type", "").startswith("application/json"):
+            return await self.app(scope, receive, send)
+
+        if len(chave) > CHAVE_TAMANHO_MAXIMO:
+            return await JSONResponse({"detail": "Idempotency-Key inválida"}, status_code=400)(scope, receive, send)
+
+        corpo = await self._ler_corpo(receive)
+
+        if corpo is None:
+            return
+
+        armazem = idempotencia.armazem_idempotencia if self.armazem is None else self.armazem
+        chave = f"{scope['method']} {scope['path']} {chave}"
+        impressao = hashlib.sha256(corpo).hexdigest()
+        registro = await self._reservar(armazem, chave, impressao)
+
+        if registro is None:
+            return await self._executar(armazem, chave, impressao, corpo, scope, receive, send)
+
+        if registro.impressao != impressao:
+            metrics.incr("idempotencia.conflitos", motivo="corpo")
+            resposta = JSONResponse({"detail": "Idempotency-Key já usada com outro corpo"}, status_code=422)
+        elif not registro.concluido:
+            metrics.incr("idempotencia.conflitos", motivo="em_andamento")
+            resposta = JSONResponse({"detail": "Requisição com esta Idempotency-Key ainda em andamento"},
+                                    status_code=409, headers={"Retry-After": "1"})
+        else:
+            metrics.incr("idempotencia.replays")
+
+            return await self._repetir(registro, send)
+
+        await resposta(scope, receive, send)
+
+    @staticmethod
+    async def _ler_corpo(receive) -> bytes | None:
+        partes = []
+
+        while True:
+            message = await receive()
+
+            if message["type"] == "http.disconnect":
+                return None
+
+            partes.append(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                return b"".join(partes)
+
+    async def _reservar(self, armazem, chave: str, impressao: str) -> Registro | None:
+        prazo = time.monotonic() + (config.IDEMPOTENCIA_ESPERA if self.espera is None else self.espera)
+        esperou = False
+
+        while True:
+            registro = await armazem.reservar(chave, impressao)
+
+            if registro is None or registro.concluido or registro.impressao != impressao or time.monotonic() >= prazo:
+                return registro
+
+            # a original ainda está executando; se ela falhar a chave é liberada e esta assume
+            if not esperou:
+                metrics.incr("idempotencia.esperas")
+                esperou = True
+
+            await anyio.sleep(INTERVALO_ESPERA)
+
+    async def _executar(self, armazem, chave: str, impressao: str, corpo: bytes, scope, receive, send):
+        entregue = False
+        inicio = {}
+        partes = []
+
+        async def receber():
+            nonlocal entregue
+
+            if not entregue:
+                entregue = True
+
+                return {"type": "http.request", "body": corpo, "more_body": False}
+
+            return await receive()
+
+        async def enviar(message):
+            if message["type"] == "http.response.start":
+                inicio.update(message)
+            elif message["type"] == "http.response.body":
+                partes.append(message.get("body", b""))
+
+            await send(message)
+
+        try:
+            await self.app(scope, receber, enviar)
+        except BaseException:
+            await armazem.liberar(chave)
+
+            raise
+
+        # 5xx não é guardado: a próxima tentativa executa de novo
+        if inicio.get("status", 500) >= 500:
+            await armazem.liberar(chave)
+
+            return
+
+        await armazem.concluir(chave, Registro(impressao, inicio["status"], list(inicio.get("headers", [])), b"".join(partes)))
+
+    @staticmethod
+    async def _repetir(registro: Registro, send):
+        await send({
+            "type": "http.response.start",
+            "status": registro.status_code,
+            "headers": registro.headers + [(b"idempotent-replayed", b"true")],
+        })
+        await send({"type": "http.response.body", "body": registro.corpo})
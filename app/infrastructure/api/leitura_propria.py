@@ -0,0 +1,25 @@
+from app.infrastructure import config
+from app.infrastructure.db.replica import COOKIE_LEITURA_PRIMARIO
+
+ESCRITAS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# read-your-writes com réplica: a escrita bem-sucedida devolve um cookie curto que manda as próximas
+# leituras desse cliente para o primário até a réplica ter tido tempo de alcançar
+class LeituraPropriaMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.DATABASE_REPLICA_URL or scope["method"] not in ESCRITAS:
+            return await self.app(scope, receive, send)
+
+        async def enviar(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                janela = max(1, int(config.REPLICA_JANELA_LEITURA_PROPRIA))
+                cookie = f"{COOKIE_LEITURA_PRIMARIO}=1; Max-Age={janela}; Path=/; HttpOnly; SameSite=Lax"
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+
+            await send(message)
+
+        await self.app(scope, receive, enviar)
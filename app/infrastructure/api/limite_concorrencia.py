@@ -0,0 +1,137 @@
+import re
+import threading
+import time
+
+from starlette.responses import JSONResponse
+
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+CRITICA = "critica"
+NORMAL = "normal"
+BAIXA = "baixa"
+
+# primeira regra que casar define a prioridade; o que não casar (escritas administrativas) é "baixa"
+REGRAS_PRIORIDADE = [
+    ("GET", re.compile(r"/export$"), BAIXA),
+    ("GET", re.compile(r"^/clientes/cpf/"), CRITICA),
+    ("GET", re.compile(r"^/produtos(/|$)"), CRITICA),
+    ("POST", re.compile(r"^/clientes/?$"), NORMAL),
+    ("GET", re.compile(r"^/"), NORMAL),
+]
+
+# health checks nunca são descartados: o orquestrador não pode achar que o pod morreu por estar ocupado
+ISENTOS = re.compile(r"^/health(/|$)")
+
+def prioridade(metodo: str, caminho: str) -> str | None:
+    if ISENTOS.match(caminho):
+        return None
+
+    for metodo_regra, padrao, classe in REGRAS_PRIORIDADE:
+        if metodo == metodo_regra and padrao.search(caminho):
+            return classe
+
+    return BAIXA
+
+def fracoes() -> dict[str, float]:
+
+    return {CRITICA: 1.0, NORMAL: config.CONCORRENCIA_FRACAO_NORMAL, BAIXA: config.CONCORRENCIA_FRACAO_BAIXA}
+
+# AIMD: +1/limite por request rápida com o limite em uso (≈ +1 por janela), ×fator quando a
+# latência passa do alvo; a redução acontece no máximo uma vez por alvo para uma rajada não zerar o limite
+class LimiteAdaptativo:
+
+    def __init__(self, inicial: int, minimo: int, maximo: int, latencia_alvo: float,
+                 fator_reducao: float = 0.9, clock=time.monotonic):
+        self.minimo = minimo
+        self.maximo = maximo
+        self.latencia_alvo = latencia_alvo
+        self.fator_reducao = fator_reducao
+        self.limite = float(min(max(inicial, minimo), maximo))
+        self.em_andamento = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._ultima_reducao = float("-inf")
+
+    def entrar(self, fracao: float = 1.0) -> bool:
+        with self._lock:
+            if self.em_andamento >= max(1, int(self.limite * fracao)):
+                return False
+
+            self.em_andamento += 1
+
+            return True
+
+    def sair(self, latencia: float, sobrecarga: bool = False, amostra: bool = True):
+        with self._lock:
+            em_uso = self.em_andamento
+            self.em_andamento -= 1
+
+            if not amostra:
+                return
+
+            if sobrecarga or latencia > self.latencia_alvo:
+                agora = self._clock()
+
+                if agora - self._ultima_reducao >= self.latencia_alvo:
+                    self.limite = max(self.minimo, self.limite * self.fator_reducao)
+                    self._ultima_reducao = agora
+            elif em_uso >= self.limite / 2:
+                # sem uso perto do limite não há evidência de que ele comporta mais
+                self.limite = min(self.maximo, self.limite + 1 / self.limite)
+
+class LimiteConcorrenciaMiddleware:
+
+    def __init__(self, app, limite: LimiteAdaptativo | None = None):
+        self.app = app
+        self.limite = limite or LimiteAdaptativo(
+            inicial=config.CONCORRENCIA_LIMITE_INICIAL,
+            minimo=config.CONCORRENCIA_LIMITE_MINIMO,
+            maximo=config.CONCORRENCIA_LIMITE_MAXIMO,
+            latencia_alvo=config.CONCORRENCIA_LATENCIA_ALVO,
+            fator_reducao=config.CONCORRENCIA_FATOR_REDUCAO,
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.CONCORRENCIA_ENABLED:
+            return await self.app(scope, receive, send)
+
+        classe = prioridade(scope["method"], scope["path"])
+
+        if classe is None:
+            return await self.app(scope, receive, send)
+
+        if not self.limite.entrar(fracoes()[classe]):
+            metrics.incr("concorrencia.rejeitadas", prioridade=classe)
+            resposta = JSONResponse(
+                {"detail": "Serviço sobrecarregado, tente novamente"},
+                status_code=503,
+                headers={"Retry-After": str(config.CONCORRENCIA_RETRY_AFTER)},
+            )
+
+            return await resposta(scope, receive, send)
+
+        inicio = time.perf_counter()
+        # latência até o início da resposta: exports em streaming não contam o tempo de transferência
+        latencia = None
+        status_code = 500
+
+        async def enviar(message):
+            nonlocal latencia, status_code
+
+            if message["type"] == "http.response.start":
+                latencia = time.perf_counter() - inicio
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            latencia = time.perf_counter() - inicio if latencia is None else latencia
+            # o alvo de latência é o das rotas críticas: exports e escritas administrativas lentas
+            # ocupam vaga mas não ajustam o limite que as leituras do cardápio/CPF enxergam
+            self.limite.sair(latencia, sobrecarga=status_code >= 500, amostra=classe != BAIXA)
+            metrics.observe("concorrencia.latencia", latencia, prioridade=classe)
+            metrics.set("concorrencia.limite", self.limite.limite)
+            metrics.set("concorrencia.em_andamento", self.limite.em_andamento)
@@ -0,0 +1,114 @@
+import re
+import time
+
+import anyio
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse
+
+from app.infrastructure import config
+from app.infrastructure.db.statement_timeout import prazo_request, sessoes_request
+from app.infrastructure.metrics import metrics
+
+# primeira regra que casar define o prazo; o que não casar usa PRAZO_PADRAO
+def regras_prazo() -> list[tuple[str, re.Pattern, float]]:
+
+    return [
+        ("GET", re.compile(r"/export$"), config.PRAZO_EXPORT),
+        ("POST", re.compile(r"^/clientes/import$"), config.PRAZO_IMPORTACAO),
+        ("GET", re.compile(r"^/clientes/cpf/"), config.PRAZO_LEITURA_TOTEM),
+    ]
+
+ISENTOS = re.compile(r"^/health(/|$)")
+
+def prazo(metodo: str, caminho: str) -> float:
+    if ISENTOS.match(caminho):
+        return 0
+
+    for metodo_regra, padrao, segundos in regras_prazo():
+        if metodo == metodo_regra and padrao.search(caminho):
+            return segundos
+
+    return config.PRAZO_PADRAO
+
+def rota(scope) -> str:
+    # o template da rota (ex.: /produtos/{id}) mantém a métrica com poucas séries
+    caminho = getattr(scope.get("route"), "path", None) or scope["path"]
+
+    return f"{scope['method']} {caminho}"
+
+# o cancelamento pula o finally das dependências com yield (Cancelled não é Exception), então as sessions
+# delas são fechadas aqui. Uma rota "def" não é interrompida: o cancelamento só chega quando a thread dela
+# termina (o que o conferir_prazo das engines apressa), então quando isto roda ninguém mais usa a session
+async def fechar_sessoes(sessoes):
+    with anyio.CancelScope(shield=True):
+        for db in sessoes:
+            if isinstance(db, AsyncSession):
+                await db.close()
+            else:
+                await anyio.to_thread.run_sync(db.close)
+
+class PrazoMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not config.PRAZO_ENABLED:
+            return await self.app(scope, receive, send)
+
+        segundos = prazo(scope["method"], scope["path"])
+
+        if segundos <= 0:
+            return await self.app(scope, receive, send)
+
+        limite = time.monotonic() + segundos
+        iniciada = False
+
+        def esgotado() -> bool:
+
+            return time.monotonic() >= limite
+
+        async def enviar(message):
+            nonlocal iniciada
+
+            if message["type"] == "http.response.start":
+                # o cancelamento pelo statement_timeout chega às rotas como exceção genérica e vira 400/500;
+                # depois do prazo qualquer erro é tratado como o 504 que de fato é
+                if message["status"] >= 400 and esgotado():
+                    return
+
+                iniciada = True
+            elif not iniciada:
+                return
+
+            await send(message)
+
+        token = prazo_request.set(limite)
+        sessoes = []
+        token_sessoes = sessoes_request.set(sessoes)
+
+        try:
+            with anyio.move_on_after(segundos) as escopo:
+                await self.app(scope, receive, enviar)
+        except Exception:
+            if iniciada or not esgotado():
+                raise
+        finally:
+            prazo_request.reset(token)
+            sessoes_request.reset(token_sessoes)
+
+            if escopo.cancelled_caught:
+                await fechar_sessoes(sessoes)
+
+        if iniciada:
+            # streaming cortado no meio: não há mais como trocar o status
+            if escopo.cancelled_caught:
+                metrics.incr("prazo.esgotados", rota=rota(scope))
+
+            return
+
+        metrics.incr("prazo.esgotados", rota=rota(scope))
+        resposta = JSONResponse({"detail": "Tempo limite da requisição esgotado"}, status_code=504)
+
+        await resposta(scope, receive, send)
@@ -0,0 +1,175 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from app.adapters.utils.busca import palavras
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+def _remover_ordenado(lista: list, item):
+    posicao = bisect_left(lista, item)
+
+    if posicao < len(lista) and lista[posicao] == item:
+        del lista[posicao]
+
+# nomes normalizados em listas ordenadas: um prefixo é um bisect seguido de uma varredura que para
+# assim que o limite é atingido, sem ir ao banco e sem ordenar todos os candidatos a cada tecla
+class IndiceAutocomplete:
+
+    def __init__(self, ttl: float, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._geracao = 0
+        self.limpar()
+
+    def limpar(self):
+        with self._lock:
+            # (nome normalizado, id): nomes que começam com o texto digitado
+            self._inicios: list[tuple[str, int]] = []
+            # palavras distintas, e para cada uma os produtos em ordem de (tamanho, nome, id)
+            self._palavras: list[str] = []
+            self._postings: dict[str, list[tuple[int, str, int]]] = {}
+            self._nomes: dict[int, tuple[str, str, frozenset[str]]] = {}
+            self._carregado_em = None
+            self._geracao += 1
+
+    @property
+    def geracao(self) -> int:
+
+        return self._geracao
+
+    def precisa_carregar(self) -> bool:
+        carregado_em = self._carregado_em
+
+        return carregado_em is None or self._clock() - carregado_em >= self.ttl
+
+    # geracao lida antes da consulta: se houve escrita no meio o índice é usado, mas recarregado na próxima vez
+    def carregar(self, linhas, geracao: int):
+        nomes = {}
+        postings = defaultdict(list)
+
+        for id, nome in linhas:
+            normalizado = " ".join(palavras(nome))
+            nomes[id] = (nome, normalizado, frozenset(normalizado.split()))
+
+            for palavra in nomes[id][2]:
+                postings[palavra].append((len(normalizado), normalizado, id))
+
+        for lista in postings.values():
+            lista.sort()
+
+        with self._lock:
+            self._inicios = sorted((normalizado, id) for id, (_, normalizado, _) in nomes.items())
+            self._palavras = sorted(postings)
+            self._postings = dict(postings)
+            self._nomes = nomes
+            self._carregado_em = self._clock() if geracao == self._geracao else None
+
+        metrics.incr("autocomplete.recargas")
+
+    def registrar(self, id: int, nome: str):
+        normalizado = " ".join(palavras(nome))
+
+        with self._lock:
+            self._remover(id)
+            self._nomes[id] = (nome, normalizado, frozenset(normalizado.split()))
+            insort(self._inicios, (normalizado, id))
+
+            for palavra in self._nomes[id][2]:
+                if palavra not in self._postings:
+                    self._postings[palavra] = []
+                    insort(self._palavras, palavra)
+
+                insort(self._postings[palavra], (len(normalizado), normalizado, id))
+
+            self._geracao += 1
+
+    def registrar_produtos(self, produtos):
+        for produto in produtos:
+            self.registrar(produto.id, produto.nome)
+
+    def remover(self, id: int):
+        with self._lock:
+            self._remover(id)
+            self._geracao += 1
+
+    def _remover(self, id: int):
+        anterior = self._nomes.pop(id, None)
+
+        if anterior is None:
+            return
+
+        _, normalizado, conjunto = anterior
+        _remover_ordenado(self._inicios, (normalizado, id))
+
+        for palavra in conjunto:
+            lista = self._postings[palavra]
+            _remover_ordenado(lista, (len(normalizado), normalizado, id))
+
+            if not lista:
+                del self._postings[palavra]
+                _remover_ordenado(self._palavras, palavra)
+
+    def _palavras_com_prefixo(self, parte: str) -> list[str]:
+        posicao = bisect_left(self._palavras, parte)
+        encontradas = []
+
+        while posicao < len(self._palavras) and self._palavras[posicao].startswith(parte):
+            encontradas.append(self._palavras[posicao])
+            posicao += 1
+
+        return encontradas
+
+    # nomes que começam com o texto digitado vêm primeiro (em ordem alfabética); depois os que têm
+    # cada palavra digitada como prefixo de alguma palavra do nome, dos mais curtos para os mais longos
+    def sugerir(self, prefixo: str, limite: int) -> list[tuple[int, str]]:
+        partes = palavras(prefixo)
+
+        if not partes:
+            return []
+
+        inicio = " ".join(partes)
+
+        with self._lock:
+            ids = []
+            posicao = bisect_left(self._inicios, (inicio,))
+
+            while len(ids) < limite and posicao < len(self._inicios) and self._inicios[posicao][0].startswith(inicio):
+                ids.append(self._inicios[posicao][1])
+                posicao += 1
+
+            if len(ids) < limite:
+                # a parte com menos candidatos conduz a varredura; as outras só filtram
+                candidatas = {parte: self._palavras_com_prefixo(parte) for parte in set(partes)}
+                guia = min(candidatas, key=lambda parte: sum(len(self._postings[palavra]) for palavra in candidatas[parte]))
+                vistos = set(ids)
+
+                for _, _, id in heapq.merge(*(self._postings[palavra] for palavra in candidatas[guia])):
+                    if id in vistos:
+                        continue
+
+                    vistos.add(id)
+                    conjunto = self._nomes[id][2]
+
+                    if all(any(palavra.startswith(parte) for palavra in conjunto) for parte in candidatas if parte != guia):
+                        ids.append(id)
+
+                        if len(ids) == limite:
+                            break
+
+            return [(id, self._nomes[id][0]) for id in ids]
+
+    def stats(self) -> dict:
+        carregado_em = self._carregado_em
+
+        return {
+            "cache": "autocomplete",
+            "size": len(self._nomes),
+            "age": None if carregado_em is None else round(self._clock() - carregado_em, 3),
+            "ttl": self.ttl,
+        }
+
+indice_autocomplete = IndiceAutocomplete(ttl=config.AUTOCOMPLETE_TTL)
@@ -0,0 +1,121 @@
+import hashlib
+import math
+import threading
+
+from app.infrastructure import config
+
+# conjunto aproximado: "ausente" é definitivo, "presente" pode ser falso positivo
+class BloomFilter:
+
+    def __init__(self, capacidade: int, taxa_fp: float):
+        capacidade = max(1, capacidade)
+        self.bits = max(8, math.ceil(-capacidade * math.log(taxa_fp) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacidade * math.log(2)))
+        self.tamanho = 0
+        self._array = bytearray((self.bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _posicoes(self, valor: str):
+        # double hashing (Kirsch-Mitzenmacher): k posições a partir de dois hashes de 64 bits
+        digest = hashlib.blake2b(valor.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, valor: str):
+        posicoes = self._posicoes(valor)
+
+        with self._lock:
+            for posicao in posicoes:
+                self._array[posicao >> 3] |= 1 << (posicao & 7)
+
+            self.tamanho += 1
+
+    def __contains__(self, valor: str) -> bool:
+
+        return all(self._array[posicao >> 3] & (1 << (posicao & 7)) for posicao in self._posicoes(valor))
+
+# cpfs e emails de clientes já cadastrados, por processo; filtros não suportam remoção,
+# então exclusões só aumentam os falsos positivos, que a consulta de existência resolve
+class FiltrosClientes:
+
+    CAMPOS = ("cpf", "email")
+
+    def __init__(self, capacidade: int, taxa_fp: float, enabled: bool = True):
+        self.capacidade = capacidade
+        self.taxa_fp = taxa_fp
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._filtros = None
+        self._em_carga = None
+
+    def _novos(self) -> dict:
+
+        return {campo: BloomFilter(self.capacidade, self.taxa_fp) for campo in self.CAMPOS}
+
+    @property
+    def carregado(self) -> bool:
+
+        return self._filtros is not None
+
+    def carregar(self, chaves):
+        filtros = self._novos()
+
+        # escritas durante a carga entram nos filtros novos também
+        with self._lock:
+            self._em_carga = filtros
+
+        try:
+            for cpf, email in chaves:
+                self._adicionar(filtros, cpf=cpf, email=email)
+
+            with self._lock:
+                self._filtros = filtros
+        finally:
+            with self._lock:
+                self._em_carga = None
+
+    @staticmethod
+    def _adicionar(filtros: dict, **valores):
+        for campo, valor in valores.items():
+            if valor is not None:
+                filtros[campo].add(valor)
+
+    def adicionar(self, cpf: str | None = None, email: str | None = None):
+        with self._lock:
+            alvos = [filtros for filtros in (self._filtros, self._em_carga) if filtros is not None]
+
+        for filtros in alvos:
+            self._adicionar(filtros, cpf=cpf, email=email)
+
+    def suspeitos(self, **valores) -> set[str] | None:
+        # None: sem filtros carregados não há como afirmar ausência
+        filtros = self._filtros
+
+        if not self.enabled or filtros is None:
+            return None
+
+        return {campo for campo, valor in valores.items() if valor is not None and valor in filtros[campo]}
+
+    def limpar(self):
+        with self._lock:
+            self._filtros = None
+
+    def stats(self) -> dict:
+        filtros = self._filtros
+
+        return {
+            "cache": "clientes_bloom",
+            "enabled": self.enabled,
+            "loaded": filtros is not None,
+            "size": {campo: filtro.tamanho for campo, filtro in filtros.items()} if filtros else {},
+            "capacity": self.capacidade,
+            "false_positive_rate": self.taxa_fp,
+        }
+
+filtros_clientes = FiltrosClientes(
+    capacidade=config.CLIENTE_BLOOM_CAPACIDADE,
+    taxa_fp=config.CLIENTE_BLOOM_TAXA_FP,
+    enabled=config.CLIENTE_BLOOM_ENABLED,
+)
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import defaultdict
+
+from app.adapters.utils.busca import termos, trigramas, similaridade
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+PESO_NOME = 2.0
+PESO_DESCRICAO = 1.0
+PESO_PREFIXO = 0.8
+
+# índice invertido em memória usado quando o banco não é Postgres (SQLite nos testes/CI):
+# termo exato, prefixo (busca enquanto digita) e trigramas para erros de digitação, com nome pesando mais
+class IndiceBuscaProdutos:
+
+    def __init__(self, ttl: float, similaridade_minima: float, clock=time.monotonic):
+        self.ttl = ttl
+        self.similaridade_minima = similaridade_minima
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.limpar()
+
+    def limpar(self):
+        self._postings: dict[str, dict[int, float]] = {}
+        self._trigramas: dict[str, frozenset[str]] = {}
+        self._versao = None
+        self._carregado_em = None
+
+    # a versão do catálogo muda a cada escrita neste processo; o TTL cobre as escritas de outros workers
+    def precisa_carregar(self, versao) -> bool:
+        carregado_em = self._carregado_em
+
+        return carregado_em is None or versao != self._versao or self._clock() - carregado_em >= self.ttl
+
+    def carregar(self, linhas, versao):
+        postings = defaultdict(dict)
+
+        for id, nome, descricao in linhas:
+            for termo in termos(descricao or ""):
+                postings[termo][id] = max(postings[termo].get(id, 0.0), PESO_DESCRICAO)
+
+            for termo in termos(nome or ""):
+                postings[termo][id] = PESO_NOME
+
+        with self._lock:
+            self._postings = dict(postings)
+            self._trigramas = {termo: trigramas(termo) for termo in postings}
+            self._versao = versao
+            self._carregado_em = self._clock()
+
+        metrics.incr("busca.indice.recargas")
+
+    def buscar(self, texto: str) -> list[int]:
+        postings, grams = self._postings, self._trigramas
+        pontos = defaultdict(float)
+
+        for termo in termos(texto):
+            grams_termo = trigramas(termo)
+
+            for candidato, ids in postings.items():
+                if candidato == termo:
+                    fator = 1.0
+                elif candidato.startswith(termo):
+                    fator = PESO_PREFIXO
+                else:
+                    fator = similaridade(grams_termo, grams[candidato])
+
+                    if fator < self.similaridade_minima:
+                        continue
+
+                    fator *= PESO_PREFIXO
+
+                for id, peso in ids.items():
+                    pontos[id] += peso * fator
+
+        return sorted(pontos, key=lambda id: (-pontos[id], id))
+
+    def stats(self) -> dict:
+        carregado_em = self._carregado_em
+
+        return {
+            "cache": "busca_produtos",
+            "size": len(self._postings),
+            "age": None if carregado_em is None else round(self._clock() - carregado_em, 3),
+            "ttl": self.ttl,
+        }
+
+indice_produtos = IndiceBuscaProdutos(ttl=config.BUSCA_INDICE_TTL, similaridade_minima=config.BUSCA_SIMILARIDADE_MINIMA)
@@ -0,0 +1,91 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.adapters.utils.compressao import IDENTIDADE, brotli, comprimir_gzip, comprimir_brotli
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+@dataclass(frozen=True)
+class SnapshotCardapio:
+    versao: int
+    etag: str
+    # codificação -> corpo pronto; a ordem é a preferência do servidor na negociação
+    variantes: dict[str, bytes]
+    criado_em: float = field(compare=False)
+
+# o snapshot publicado nunca é alterado: cada reconstrução monta um novo e troca a referência,
+# então quem lê (request) só faz a leitura de um ponteiro e não precisa de lock
+class CardapioCache:
+
+    def __init__(self, ttl: float, gzip_nivel: int, brotli_qualidade: int, clock=time.monotonic):
+        self.ttl = ttl
+        self.gzip_nivel = gzip_nivel
+        self.brotli_qualidade = brotli_qualidade
+        self._clock = clock
+        self._reconstruindo = threading.Lock()
+        self._atual: SnapshotCardapio | None = None
+
+    @property
+    def atual(self) -> SnapshotCardapio | None:
+
+        return self._atual
+
+    def precisa_reconstruir(self, versao: int) -> bool:
+        atual = self._atual
+
+        return atual is None or atual.versao != versao or self._clock() - atual.criado_em >= self.ttl
+
+    # só uma reconstrução por vez; as requests que chegam durante ela servem o snapshot anterior
+    def iniciar_reconstrucao(self) -> bool:
+
+        return self._reconstruindo.acquire(blocking=False)
+
+    def concluir_reconstrucao(self):
+        self._reconstruindo.release()
+
+    def publicar(self, corpo: bytes, versao: int) -> SnapshotCardapio:
+        inicio = time.perf_counter()
+        variantes = {}
+
+        if brotli is not None:
+            variantes["br"] = comprimir_brotli(corpo, self.brotli_qualidade)
+
+        variantes["gzip"] = comprimir_gzip(corpo, self.gzip_nivel)
+        variantes[IDENTIDADE] = corpo
+
+        snapshot = SnapshotCardapio(
+            versao=versao,
+            etag='"' + hashlib.sha256(corpo).hexdigest()[:32] + '"',
+            variantes=variantes,
+            criado_em=self._clock(),
+        )
+        self._atual = snapshot
+
+        metrics.incr("cardapio.reconstrucoes")
+        metrics.observe("cardapio.reconstrucao_segundos", time.perf_counter() - inicio)
+
+        for codificacao, dados in variantes.items():
+            metrics.set("cardapio.bytes", len(dados), codificacao=codificacao)
+
+        return snapshot
+
+    def limpar(self):
+        self._atual = None
+
+    def stats(self) -> dict:
+        atual = self._atual
+
+        return {
+            "cache": "cardapio",
+            "size": 0 if atual is None else len(atual.variantes[IDENTIDADE]),
+            "age": None if atual is None else round(self._clock() - atual.criado_em, 3),
+            "ttl": self.ttl,
+        }
+
+cardapio_cache = CardapioCache(
+    ttl=config.CARDAPIO_TTL,
+    gzip_nivel=config.CARDAPIO_GZIP_NIVEL,
+    brotli_qualidade=config.CARDAPIO_BROTLI_QUALIDADE,
+)
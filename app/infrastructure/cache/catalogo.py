@@ -0,0 +1,101 @@
+from sqlalchemy import inspect
+
+from app.infrastructure import config
+from app.infrastructure.cache.ttl_cache import TTLCache, MISSING
+
+catalogo_cache = TTLCache(
+    nome="catalogo",
+    maxsize=config.CATALOGO_CACHE_MAXSIZE,
+    ttl=config.CATALOGO_CACHE_TTL,
+    enabled=config.CATALOGO_CACHE_ENABLED,
+)
+
+LISTA_TODOS = "todos"
+
+def lista_categoria(categoria) -> str:
+
+    return f"categoria:{int(categoria)}"
+
+def _tag_produto(id) -> str:
+
+    return f"produto:{int(id)}"
+
+def _tag_lista(lista: str) -> str:
+
+    return f"lista:{lista}"
+
+def _desanexar(produto):
+    # objetos compartilhados entre requests não podem continuar presos à Session que os carregou:
+    # um commit posterior nela os expiraria e o próximo acesso tentaria ir ao banco
+    estado = inspect(produto, raiseerr=False)
+
+    if estado is None or estado.session is None:
+        return
+
+    session = estado.session
+    categoria = produto.__dict__.get("categoria_rel")
+
+    session.expunge(produto)
+
+    if categoria is not None and categoria in session:
+        session.expunge(categoria)
+
+def buscar_lista(lista: str, pagina: tuple = ()):
+
+    return catalogo_cache.get(("lista", lista, pagina), MISSING)
+
+def geracao() -> int:
+
+    return catalogo_cache.geracao
+
+# logo após uma escrita deste processo a réplica pode ainda não tê-la: o que vier dela nesse intervalo
+# não entra no cache (que também atende quem lê do primário) nem sai com o ETag da versão nova
+def replica_pode_estar_atrasada() -> bool:
+
+    return catalogo_cache.ttl_apos_invalidacao(config.REPLICA_JANELA_LEITURA_PROPRIA) is not None
+
+def etag_confiavel(da_replica: bool) -> bool:
+
+    return not da_replica or not replica_pode_estar_atrasada()
+
+def guardar_lista(lista: str, produtos, geracao: int, pagina: tuple = (), da_replica: bool = False):
+    if not catalogo_cache.enabled or (da_replica and replica_pode_estar_atrasada()):
+        return
+
+    for produto in produtos:
+        _desanexar(produto)
+
+    tags = {_tag_lista(lista)} | {_tag_produto(produto.id) for produto in produtos}
+    # todas as páginas de uma lista compartilham a tag da lista
+    catalogo_cache.set(("lista", lista, pagina), produtos, tags=tags, geracao=geracao)
+
+def buscar_produto(id: int):
+
+    return catalogo_cache.get(("produto", int(id)), MISSING)
+
+def guardar_produto(id: int, produto, geracao: int, da_replica: bool = False):
+    if not catalogo_cache.enabled or (da_replica and replica_pode_estar_atrasada()):
+        return
+
+    if produto is not None:
+        _desanexar(produto)
+
+    # produto inexistente também é guardado (None); a criação invalida a tag do novo id
+    catalogo_cache.set(("produto", int(id)), produto, tags={_tag_produto(id)}, geracao=geracao)
+
+def invalidar_criacao(produto):
+    catalogo_cache.invalidate_tag(_tag_produto(produto.id))
+    catalogo_cache.invalidate_tag(_tag_lista(LISTA_TODOS))
+
+    if produto.categoria is not None:
+        catalogo_cache.invalidate_tag(_tag_lista(lista_categoria(produto.categoria)))
+
+def invalidar_atualizacao(id: int, categoria=None):
+    # listas que já continham o produto (inclusive a da categoria antiga) carregam a tag do id
+    catalogo_cache.invalidate_tag(_tag_produto(id))
+
+    if categoria is not None:
+        catalogo_cache.invalidate_tag(_tag_lista(lista_categoria(categoria)))
+
+def invalidar_remocao(id: int):
+    catalogo_cache.invalidate_tag(_tag_produto(id))
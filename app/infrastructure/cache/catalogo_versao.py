@@ -0,0 +1,33 @@
+import os
+import threading
+import time
+
+from app.infrastructure import config
+
+class CatalogoVersao:
+
+    def __init__(self, janela: float, clock=time.time):
+        self.janela = janela
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._versao = 0
+        # distingue processos (workers, restarts) que teriam o mesmo contador
+        self._epoch = os.urandom(4).hex()
+
+    @property
+    def versao(self) -> int:
+
+        return self._versao
+
+    def incrementar(self) -> int:
+        with self._lock:
+            self._versao += 1
+
+            return self._versao
+
+    def etag(self) -> str:
+        janela = int(self._clock() // self.janela) if self.janela > 0 else 0
+
+        return f'"{self._epoch}-{self._versao}-{janela}"'
+
+catalogo_versao = CatalogoVersao(janela=config.CATALOGO_ETAG_JANELA)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+# categorias de produto em memória: são poucas e quase nunca mudam
+class RegistroCategorias:
+
+    def __init__(self, ttl: float, recarga_minima: float, clock=time.monotonic):
+        self.ttl = ttl
+        self.recarga_minima = recarga_minima
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._categorias: dict[int, str] = {}
+        self._carregado_em: float | None = None
+
+    def precisa_carregar(self, ids=()) -> bool:
+        with self._lock:
+            if self._carregado_em is None:
+                return True
+
+            idade = self._clock() - self._carregado_em
+
+            if idade >= self.ttl:
+                return True
+
+            # id desconhecido pode ser categoria nova; o intervalo mínimo evita uma consulta por id inválido
+            return idade >= self.recarga_minima and any(id not in self._categorias for id in ids)
+
+    def substituir(self, categorias: dict[int, str]):
+        with self._lock:
+            self._categorias = dict(categorias)
+            self._carregado_em = self._clock()
+
+        metrics.incr("categorias.recargas")
+
+    def nome(self, id) -> str | None:
+
+        return self._categorias.get(id)
+
+    def buscar(self, ids) -> dict[int, str]:
+        categorias = self._categorias
+
+        return {id: categorias[id] for id in ids if id in categorias}
+
+    def todas(self) -> dict[int, str]:
+
+        return dict(self._categorias)
+
+    def limpar(self):
+        with self._lock:
+            self._categorias = {}
+            self._carregado_em = None
+
+    def stats(self) -> dict:
+        carregado_em = self._carregado_em
+
+        return {
+            "cache": "categorias",
+            "size": len(self._categorias),
+            "age": None if carregado_em is None else round(self._clock() - carregado_em, 3),
+            "ttl": self.ttl,
+        }
+
+registro_categorias = RegistroCategorias(ttl=config.CATEGORIAS_TTL, recarga_minima=config.CATEGORIAS_RECARGA_MINIMA)
@@ -0,0 +1,68 @@
+from sqlalchemy import inspect
+
+from app.infrastructure import config
+from app.infrastructure.cache.ttl_cache import TTLCache, MISSING
+from app.infrastructure.metrics import metrics
+
+clientes_cache = TTLCache(
+    nome="clientes_cpf",
+    maxsize=config.CLIENTE_CPF_CACHE_MAXSIZE,
+    ttl=config.CLIENTE_CPF_CACHE_TTL,
+    enabled=config.CLIENTE_CPF_CACHE_ENABLED,
+)
+
+def _chave(cpf: str):
+
+    return ("cpf", cpf)
+
+def _tag_cliente(id) -> str:
+
+    return f"cliente:{int(id)}"
+
+def _desanexar(cliente):
+    estado = inspect(cliente, raiseerr=False)
+
+    if estado is None or estado.session is None:
+        return
+
+    estado.session.expunge(cliente)
+
+def buscar_por_cpf(cpf: str):
+    cliente = clientes_cache.get(_chave(cpf), MISSING)
+
+    if cliente is None:
+        metrics.incr("cache.negative_hits", cache=clientes_cache.nome)
+
+    return cliente
+
+def geracao() -> int:
+
+    return clientes_cache.geracao
+
+def guardar(cpf: str, cliente, geracao: int, da_replica: bool = False):
+    if not clientes_cache.enabled:
+        return
+
+    # leitura da réplica logo após uma escrita: pode não ter a escrita, e o cache também atende o primário
+    if da_replica and clientes_cache.ttl_apos_invalidacao(config.REPLICA_JANELA_LEITURA_PROPRIA) is not None:
+        return
+
+    if cliente is None:
+        # cpf ainda não cadastrado: o cliente costuma se cadastrar logo em seguida no mesmo totem,
+        # por isso o TTL curto além da invalidação feita na criação
+        clientes_cache.set(_chave(cpf), None, geracao=geracao, ttl=config.CLIENTE_CPF_CACHE_NEGATIVO_TTL)
+
+        return
+
+    _desanexar(cliente)
+    clientes_cache.set(_chave(cpf), cliente, tags={_tag_cliente(cliente.id)}, geracao=geracao)
+
+def invalidar_cpf(cpf: str | None):
+    if cpf is not None:
+        clientes_cache.invalidate(_chave(cpf))
+
+def invalidar_cliente(id: int):
+    clientes_cache.invalidate_tag(_tag_cliente(id))
+
+def limpar():
+    clientes_cache.clear()
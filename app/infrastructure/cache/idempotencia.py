@@ -0,0 +1,114 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import import_module
+
+from app.infrastructure import config
+
+# resposta de uma requisição com Idempotency-Key; sem status_code a primeira execução ainda está em andamento
+class Registro:
+
+    def __init__(self, impressao: str, status_code: int | None = None, headers: list | None = None, corpo: bytes = b""):
+        self.impressao = impressao
+        self.status_code = status_code
+        self.headers = headers or []
+        self.corpo = corpo
+
+    @property
+    def concluido(self) -> bool:
+
+        return self.status_code is not None
+
+# backend das chaves: o padrão é em memória (por processo); com vários workers/pods um backend
+# compartilhado (ex.: Redis) precisa de "reservar" atômico para que só uma execução aconteça
+class ArmazemIdempotencia(ABC):
+
+    @abstractmethod
+    async def reservar(self, chave: str, impressao: str) -> Registro | None:
+        # None: a chave era nova e ficou reservada para quem chamou; senão, o registro existente
+        pass
+
+    @abstractmethod
+    async def obter(self, chave: str) -> Registro | None:
+        pass
+
+    @abstractmethod
+    async def concluir(self, chave: str, registro: Registro):
+        pass
+
+    @abstractmethod
+    async def liberar(self, chave: str):
+        pass
+
+class ArmazemIdempotenciaMemoria(ArmazemIdempotencia):
+
+    def __init__(self, maxsize: int, ttl: float, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def _vivo(self, chave: str) -> Registro | None:
+        item = self._data.get(chave)
+
+        if item is None:
+            return None
+
+        registro, expira_em = item
+
+        if self._clock() >= expira_em:
+            del self._data[chave]
+
+            return None
+
+        return registro
+
+    def _guardar(self, chave: str, registro: Registro):
+        self._data[chave] = (registro, self._clock() + self.ttl)
+        self._data.move_to_end(chave)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def reservar(self, chave: str, impressao: str) -> Registro | None:
+        with self._lock:
+            registro = self._vivo(chave)
+
+            if registro is not None:
+                return registro
+
+            self._guardar(chave, Registro(impressao))
+
+            return None
+
+    async def obter(self, chave: str) -> Registro | None:
+        with self._lock:
+            return self._vivo(chave)
+
+    async def concluir(self, chave: str, registro: Registro):
+        with self._lock:
+            self._guardar(chave, registro)
+
+    async def liberar(self, chave: str):
+        with self._lock:
+            self._data.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+def criar_armazem(backend: str) -> ArmazemIdempotencia:
+    if backend == "memoria":
+        return ArmazemIdempotenciaMemoria(maxsize=config.IDEMPOTENCIA_MAXSIZE, ttl=config.IDEMPOTENCIA_TTL)
+
+    # "pacote.modulo:Classe" de um backend compartilhado, instanciado sem argumentos
+    modulo, _, classe = backend.partition(":")
+
+    return getattr(import_module(modulo), classe)()
+
+armazem_idempotencia = criar_armazem(config.IDEMPOTENCIA_BACKEND)
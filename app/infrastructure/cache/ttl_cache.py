@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict
+
+from app.infrastructure.metrics import metrics
+
+MISSING = object()
+
+# LRU limitado com expiração por TTL e invalidação por tags (ex.: "produto:1")
+class TTLCache:
+
+    def __init__(self, nome: str, maxsize: int, ttl: float, enabled: bool = True, clock=time.monotonic):
+        self.nome = nome
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self._tags = {}
+        # incrementada a cada invalidação: um valor carregado antes dela não pode ser gravado depois
+        self.geracao = 0
+        self._invalidado_em = float("-inf")
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def _count(self, evento: str, valor: int = 1):
+        self._stats[evento] += valor
+        metrics.incr(f"cache.{evento}", valor, cache=self.nome)
+
+    def _remove(self, key):
+        _, _, tags = self._data.pop(key)
+
+        for tag in tags:
+            keys = self._tags.get(tag)
+
+            if keys is not None:
+                keys.discard(key)
+
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key, default=MISSING):
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                self._count("misses")
+
+                return default
+
+            value, expira_em, _ = item
+
+            if self._clock() >= expira_em:
+                self._remove(key)
+                self._count("expirations")
+                self._count("misses")
+
+                return default
+
+            self._data.move_to_end(key)
+            self._count("hits")
+
+            return value
+
+    # ttl por entrada sobrescreve o do cache (ex.: respostas negativas que devem expirar antes)
+    def set(self, key, value, tags=(), geracao: int | None = None, ttl: float | None = None):
+        if not self.enabled or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if geracao is not None and geracao != self.geracao:
+                return
+
+            if key in self._data:
+                self._remove(key)
+
+            tags = frozenset(tags)
+            self._data[key] = (value, self._clock() + (self.ttl if ttl is None else ttl), tags)
+
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self._count("evictions")
+
+    def invalidate(self, key):
+        with self._lock:
+            self.geracao += 1
+            self._invalidado_em = self._clock()
+
+            if key in self._data:
+                self._remove(key)
+                self._count("invalidations")
+
+    def invalidate_tag(self, tag):
+        with self._lock:
+            self.geracao += 1
+            self._invalidado_em = self._clock()
+            keys = list(self._tags.get(tag, ()))
+
+            for key in keys:
+                self._remove(key)
+
+            if keys:
+                self._count("invalidations", len(keys))
+
+    # um valor lido da réplica logo depois de uma invalidação pode ainda não ter a escrita que a causou:
+    # dentro da janela ele expira junto com ela em vez de ficar o TTL inteiro
+    def ttl_apos_invalidacao(self, janela: float, ttl: float | None = None) -> float | None:
+        restante = self._invalidado_em + janela - self._clock()
+
+        if restante <= 0:
+            return ttl
+
+        return restante if ttl is None else min(ttl, restante)
+
+    def clear(self):
+        with self._lock:
+            self.geracao += 1
+            self._invalidado_em = self._clock()
+            self._data.clear()
+            self._tags.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            consultas = self._stats["hits"] + self._stats["misses"]
+
+            return {
+                "cache": self.nome,
+                "enabled": self.enabled,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                **self._stats,
+                "hit_rate": self._stats["hits"] / consultas if consultas else 0.0,
+            }
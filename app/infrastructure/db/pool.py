@@ -0,0 +1,125 @@
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+# não existe evento de "espera" no pool, então o tempo até a conexão sair é medido aqui
+class _TempoDeEsperaMixin:
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.incr("db.pool.timeouts", pool=self.logging_name)
+
+            raise
+        finally:
+            metrics.observe("db.pool.wait_seconds", time.perf_counter() - inicio, pool=self.logging_name)
+
+class InstrumentedQueuePool(_TempoDeEsperaMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_TempoDeEsperaMixin, AsyncAdaptedQueuePool):
+    pass
+
+def get_engine_kwargs(url: str, nome: str, is_async: bool = False) -> dict:
+    parsed = make_url(url)
+    kwargs = {
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "pool_logging_name": nome,
+    }
+
+    if config.DB_POOL_MODE == "null":
+        kwargs["poolclass"] = NullPool
+
+        # asyncpg prepara statements por conexão, o que quebra com PgBouncer em modo transaction
+        if is_async and parsed.get_backend_name() == "postgresql":
+            kwargs["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
+        return kwargs
+
+    # sqlite (testes / CI) fica com o pool padrão do SQLAlchemy
+    if parsed.get_backend_name() == "sqlite":
+        return kwargs
+
+    kwargs.update({
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    })
+
+    return kwargs
+
+def instrument_engine(engine, nome: str):
+    # AsyncEngine expõe os eventos de pool pela engine síncrona interna
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    # o evento de checkin dispara antes do pool devolver a conexão à fila
+    def _atualizar_gauges(devolvendo: bool = False):
+        pool = sync_engine.pool
+
+        if isinstance(pool, QueuePool):
+            checked_out = max(pool.checkedout() - int(devolvendo), 0)
+
+            metrics.set("db.pool.checked_out", checked_out, pool=nome)
+            metrics.set("db.pool.overflow", max(pool.overflow(), 0), pool=nome)
+
+            if checked_out > metrics.get("db.pool.checked_out_peak", pool=nome):
+                metrics.set("db.pool.checked_out_peak", checked_out, pool=nome)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.incr("db.pool.connections_opened", pool=nome)
+
+    @event.listens_for(sync_engine, "close")
+    def _on_close(dbapi_connection, connection_record):
+        metrics.incr("db.pool.connections_closed", pool=nome)
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("db.pool.invalidations", pool=nome)
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.incr("db.pool.checkouts", pool=nome)
+        _atualizar_gauges()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.incr("db.pool.checkins", pool=nome)
+        _atualizar_gauges(devolvendo=True)
+
+    return engine
+
+def pool_status(engine, nome: str) -> dict:
+    pool = getattr(engine, "sync_engine", engine).pool
+    status = {
+        "pool": nome,
+        "class": type(pool).__name__,
+        "pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": config.DB_MAX_OVERFLOW,
+            "timeout": pool.timeout(),
+            "recycle": config.DB_POOL_RECYCLE,
+        })
+
+    wait = metrics.timing("db.pool.wait_seconds", pool=nome)
+
+    if wait:
+        status["wait_seconds"] = wait
+
+    return status
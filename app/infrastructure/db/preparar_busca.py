@@ -0,0 +1,28 @@
+import logging
+import sys
+
+from app.dao import produto_busca
+from app.infrastructure.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+# comando único do deploy (python -m app.infrastructure.db.preparar_busca): cria extensões, configuração
+# e índices da busca de produtos e refaz os que ficaram INVALID; os workers só conferem se estão prontos
+def main() -> int:
+    if engine.dialect.name != "postgresql":
+        logger.info("Banco %s sem índices de busca, nada a preparar", engine.dialect.name)
+
+        return 0
+
+    if not produto_busca.preparar(engine):
+        logger.error("Índices de busca de produtos não ficaram válidos")
+
+        return 1
+
+    logger.info("Índices de busca de produtos prontos")
+
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
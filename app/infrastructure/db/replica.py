@@ -0,0 +1,117 @@
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.infrastructure import config
+from app.infrastructure.metrics import metrics
+
+# cookie curto devolvido nas escritas: enquanto ele existir o cliente lê o que acabou de escrever no primário
+COOKIE_LEITURA_PRIMARIO = "ler_primario"
+
+# com o WAL todo reaplicado a réplica está em dia, mesmo que a última transação seja antiga
+CONSULTA_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+class EstadoReplica:
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.limpar()
+
+    def limpar(self):
+        self._indisponivel_ate = float("-inf")
+        self._proxima_verificacao = float("-inf")
+        self.lag = 0.0
+
+    def disponivel(self) -> bool:
+        agora = self._clock()
+
+        with self._lock:
+            return agora >= self._indisponivel_ate and self.lag <= config.REPLICA_LAG_MAXIMO
+
+    def precisa_verificar(self) -> bool:
+        agora = self._clock()
+
+        with self._lock:
+            if agora < self._proxima_verificacao:
+                return False
+
+            # só uma request por intervalo mede o atraso; as demais seguem com a última medida
+            self._proxima_verificacao = agora + config.REPLICA_VERIFICACAO
+
+            return True
+
+    def registrar_lag(self, segundos: float):
+        with self._lock:
+            self.lag = float(segundos or 0)
+
+        metrics.set("db.replica.lag", self.lag)
+
+    def registrar_falha(self):
+        with self._lock:
+            self._indisponivel_ate = self._clock() + config.REPLICA_PAUSA_FALHA
+
+        metrics.incr("db.replica.falhas")
+
+estado_replica = EstadoReplica()
+
+def usar_replica(cookies) -> bool:
+
+    return COOKIE_LEITURA_PRIMARIO not in cookies and estado_replica.disponivel()
+
+def verificar(db) -> bool:
+    # o atraso só é medido no Postgres; nos outros bancos (testes) a réplica é considerada em dia
+    if db.get_bind().dialect.name == "postgresql" and estado_replica.precisa_verificar():
+        try:
+            estado_replica.registrar_lag(db.execute(CONSULTA_LAG).scalar())
+            db.rollback()
+        except DBAPIError:
+            estado_replica.registrar_falha()
+
+    return estado_replica.disponivel()
+
+async def verificar_async(db) -> bool:
+    if db.sync_session.get_bind().dialect.name == "postgresql" and estado_replica.precisa_verificar():
+        try:
+            estado_replica.registrar_lag(await db.scalar(CONSULTA_LAG))
+            await db.rollback()
+        except DBAPIError:
+            estado_replica.registrar_falha()
+
+    return estado_replica.disponivel()
+
+# leitura pela réplica com volta ao primário se ela cair no meio do caminho
+def ler(primario, replica, operacao):
+    if replica is not None:
+        try:
+            resultado = operacao(replica)
+            metrics.incr("db.replica.leituras", destino="replica")
+
+            return resultado
+        except DBAPIError:
+            estado_replica.registrar_falha()
+
+    if config.DATABASE_REPLICA_URL:
+        metrics.incr("db.replica.leituras", destino="primario")
+
+    return operacao(primario)
+
+async def ler_async(primario, replica, operacao):
+    if replica is not None:
+        try:
+            resultado = await operacao(replica)
+            metrics.incr("db.replica.leituras", destino="replica")
+
+            return resultado
+        except DBAPIError:
+            estado_replica.registrar_falha()
+
+    if config.DATABASE_REPLICA_URL:
+        metrics.incr("db.replica.leituras", destino="primario")
+
+    return await operacao(primario)
@@ -0,0 +1,50 @@
+import time
+from contextvars import ContextVar
+
+# instante (monotonic) em que a request atual estoura o prazo; definido pelo PrazoMiddleware
+prazo_request: ContextVar[float | None] = ContextVar("prazo_request", default=None)
+
+# sessions abertas pelas dependências da request atual; a lista é criada pelo PrazoMiddleware
+sessoes_request: ContextVar[list | None] = ContextVar("sessoes_request", default=None)
+
+class PrazoEsgotadoError(Exception):
+    pass
+
+def registrar_sessao(db):
+    sessoes = sessoes_request.get()
+
+    if sessoes is not None:
+        sessoes.append(db)
+
+    return db
+
+def restante() -> float | None:
+    prazo = prazo_request.get()
+
+    if prazo is None:
+        return None
+
+    return prazo - time.monotonic()
+
+# listener de after_begin: SET LOCAL vale só até o fim da transação, então cada transação da
+# session (inclusive as abertas depois de um commit) recebe o que sobra do prazo naquele momento
+def aplicar_statement_timeout(session, transaction, connection):
+    segundos = restante()
+
+    if segundos is None or connection.dialect.name != "postgresql":
+        return
+
+    if segundos <= 0:
+        raise PrazoEsgotadoError("Prazo da requisição esgotado")
+
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(1, int(segundos * 1000))}")
+
+# listener de before_cursor_execute nas engines: rotas "def" rodam numa thread que o cancelamento do
+# PrazoMiddleware não interrompe (o 504 só sai quando ela termina), então depois do prazo o próximo
+# statement dela falha aqui e a rota para. Limites que continuam: o statement que já está rodando vai até
+# o statement_timeout definido no início da transação, e código Python sem acesso ao banco segue até o fim
+def conferir_prazo(conn, cursor, statement, parameters, context, executemany):
+    segundos = restante()
+
+    if segundos is not None and segundos <= 0:
+        raise PrazoEsgotadoError("Prazo da requisição esgotado")
@@ -0,0 +1,68 @@
+import threading
+from collections import defaultdict
+
+# registro em memória de contadores, gauges e tempos, exposto em /health/metrics
+class Metrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._gauges = {}
+        self._timings = {}
+
+    @staticmethod
+    def _key(nome: str, labels: dict) -> str:
+        if not labels:
+            return nome
+
+        return nome + "{" + ",".join(f"{k}={v}" for k, v in sorted(labels.items())) + "}"
+
+    def incr(self, nome: str, valor: float = 1, **labels):
+        with self._lock:
+            self._counters[self._key(nome, labels)] += valor
+
+    def set(self, nome: str, valor: float, **labels):
+        with self._lock:
+            self._gauges[self._key(nome, labels)] = valor
+
+    def observe(self, nome: str, valor: float, **labels):
+        key = self._key(nome, labels)
+
+        with self._lock:
+            timing = self._timings.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            timing["count"] += 1
+            timing["sum"] += valor
+            timing["max"] = max(timing["max"], valor)
+
+    def get(self, nome: str, **labels) -> float:
+        key = self._key(nome, labels)
+
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key, 0))
+
+    def timing(self, nome: str, **labels) -> dict | None:
+        key = self._key(nome, labels)
+
+        with self._lock:
+            timing = self._timings.get(key)
+
+            return dict(timing) if timing else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": {
+                    key: {**timing, "avg": timing["sum"] / timing["count"] if timing["count"] else 0.0}
+                    for key, timing in self._timings.items()
+                },
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+metrics = Metrics()
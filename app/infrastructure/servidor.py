@@ -0,0 +1,110 @@
+import logging
+import math
+import os
+from importlib.util import find_spec
+from pathlib import Path
+
+from app.infrastructure import config
+
+logger = logging.getLogger(__name__)
+
+APP = "app.main:app"
+CGROUP = Path("/sys/fs/cgroup")
+
+def cota_cpu(raiz: Path = CGROUP) -> float | None:
+    # cgroup v2: "cpu.max" = "<quota> <período>" ou "max <período>"
+    try:
+        quota, periodo = (raiz / "cpu.max").read_text().split()
+
+        return None if quota == "max" else int(quota) / int(periodo)
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1: quota -1 = sem limite
+    try:
+        quota = int((raiz / "cpu" / "cpu.cfs_quota_us").read_text())
+        periodo = int((raiz / "cpu" / "cpu.cfs_period_us").read_text())
+
+        return None if quota <= 0 else quota / periodo
+    except (OSError, ValueError):
+        return None
+
+def cpus_disponiveis(raiz: Path = CGROUP) -> float:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    cota = cota_cpu(raiz)
+
+    return min(cpus, cota) if cota else cpus
+
+def numero_workers(raiz: Path = CGROUP) -> int:
+    if config.SERVIDOR_WORKERS > 0:
+        return config.SERVIDOR_WORKERS
+
+    # cota fracionária (ex.: 300m) arredonda para cima: 1 worker, nunca 0
+    return max(1, math.ceil(cpus_disponiveis(raiz) * config.SERVIDOR_WORKERS_POR_CPU))
+
+def loop_e_http() -> tuple[str, str]:
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+
+    return loop, http
+
+def post_fork(server, worker):
+    from app.infrastructure.db.database import descartar_pools_herdados
+
+    descartar_pools_herdados()
+
+def opcoes_gunicorn(workers: int) -> dict:
+
+    return {
+        "bind": f"{config.SERVIDOR_HOST}:{config.SERVIDOR_PORTA}",
+        "workers": workers,
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+        "keepalive": config.SERVIDOR_KEEPALIVE,
+        "graceful_timeout": config.SERVIDOR_TIMEOUT_GRACEFUL,
+        "post_fork": post_fork,
+    }
+
+def _executar_gunicorn(workers: int):
+    from gunicorn.app.base import BaseApplication
+
+    class Servidor(BaseApplication):
+
+        def load_config(self):
+            for chave, valor in opcoes_gunicorn(workers).items():
+                self.cfg.set(chave, valor)
+
+        def load(self):
+            from app.main import app
+
+            return app
+
+    Servidor().run()
+
+def _executar_uvicorn(workers: int):
+    import uvicorn
+
+    loop, http = loop_e_http()
+    # com mais de um worker o uvicorn usa spawn: cada processo importa o app e cria seus próprios pools
+    uvicorn.run(
+        APP,
+        host=config.SERVIDOR_HOST,
+        port=config.SERVIDOR_PORTA,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=config.SERVIDOR_KEEPALIVE,
+        timeout_graceful_shutdown=config.SERVIDOR_TIMEOUT_GRACEFUL,
+    )
+
+def executar():
+    workers = numero_workers()
+    loop, http = loop_e_http()
+    preload = config.SERVIDOR_PRELOAD and find_spec("gunicorn") is not None
+
+    logger.info("Iniciando %d worker(s), loop=%s, http=%s, preload=%s", workers, loop, http, preload)
+
+    if preload:
+        _executar_gunicorn(workers)
+    else:
+        _executar_uvicorn(workers)
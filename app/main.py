@@ -1,10 +1,18 @@
 from app.infrastructure.api.fastapi import app, Depends
+from app.infrastructure.config import DB_MODE
 
 from app.api import check
 from app.api import cliente
 from app.api import produto
+from app.api import async_cliente
+from app.api import async_produto
 
 # declare
 app.include_router(check.router)
-app.include_router(cliente.router)
-app.include_router(produto.router)
\ No newline at end of file
+
+if DB_MODE == "async":
+    app.include_router(async_cliente.router)
+    app.include_router(async_produto.router)
+else:
+    app.include_router(cliente.router)
+    app.include_router(produto.router)
\ No newline at end of file
@@ -0,0 +1,76 @@
+from typing import AsyncIterator
+
+from app.use_cases.cliente_use_case import ClienteUseCase, ClienteDuplicadoError
+from app.entities.cliente.models import Cliente
+from app.adapters.schemas.cliente import ClienteResponseSchema, ClienteImportacaoSchema
+from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+from app.adapters.utils.paginacao import decode_cursor
+
+class AsyncClienteUseCase(ClienteUseCase):
+
+    async def criar_cliente(self, clienteRequest: ClienteCreateSchema) -> ClienteResponseSchema:
+        conflitos = await self.cliente_entities.conflitos(cpf=clienteRequest.cpf, email=clienteRequest.email)
+
+        if conflitos:
+            raise ClienteDuplicadoError(conflitos)
+
+        clienteCriado: Cliente = await self.cliente_entities.criar_cliente(cliente=clienteRequest)
+
+        return self._apresentar(clienteCriado)
+
+    async def buscar_cliente_por_cpf(self, cpf_cliente: str) -> ClienteResponseSchema:
+        clienteBusca: Cliente = await self.cliente_entities.buscar_por_cpf(cpf_cliente=self._normalizar_cpf(cpf_cliente))
+
+        if not clienteBusca :
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteBusca)
+
+    async def buscar_cliente_por_id(self, id: int) -> ClienteResponseSchema:
+        clienteBusca: Cliente = await self.cliente_entities.buscar_por_id(id=id)
+
+        if not clienteBusca :
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteBusca)
+
+    async def listar_clientes(self) -> list[ClienteResponseSchema]:
+        clientesBusca: list[Cliente] = await self.cliente_entities.listar_todos()
+
+        return [self._apresentar(row) for row in clientesBusca]
+
+    async def listar_pagina(self, limite: int, cursor: str | None = None) -> tuple[list[ClienteResponseSchema], str | None]:
+        clientesBusca: list[Cliente] = await self.cliente_entities.listar_todos(limite=limite + 1, apos_id=decode_cursor(cursor))
+
+        return self._create_pagina(clientesBusca, limite)
+
+    async def exportar(self) -> AsyncIterator[str]:
+        async for cliente in self.cliente_entities.exportar():
+            yield self._create_response_schema(cliente).model_dump_json() + "\n"
+
+    async def importar(self, registros) -> ClienteImportacaoSchema:
+        rejeitados = []
+        resultado = await self.cliente_entities.importar(self._validar_importacao(registros, rejeitados))
+
+        return self._create_importacao(resultado, rejeitados)
+
+    async def atualizar_cliente(self, id: int,  clienteRequest: ClienteUpdateSchema) -> ClienteResponseSchema:
+        # o DAO relê a linha no primário antes de alterar; None quando não existe
+        clienteAtualizado: Cliente = await self.cliente_entities.atualizar_cliente(id=id,cliente=clienteRequest)
+
+        if not clienteAtualizado:
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteAtualizado)
+
+    async def atualizar_parcial(self, id: int, clienteRequest: ClienteUpdateSchema) -> ClienteResponseSchema:
+        clienteAtualizado: Cliente = await self.cliente_entities.atualizar_parcial(id=id, campos=clienteRequest.model_dump(exclude_unset=True))
+
+        if not clienteAtualizado:
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteAtualizado)
+
+    async def deletar_cliente(self, id: int) -> None:
+
+        await self.cliente_entities.deletar_cliente(id=id)
@@ -0,0 +1,110 @@
+from typing import AsyncIterator, List
+
+import anyio.to_thread
+
+from app.use_cases.produto_use_case import ProdutoUseCase, LoteInvalidoError
+from app.adapters.schemas.produto import ProdutoResponseSchema
+from app.adapters.dto.produto_dto import ProdutoCreateSchema
+from app.adapters.utils.paginacao import decode_cursor
+from app.infrastructure.cache.cardapio import cardapio_cache, SnapshotCardapio
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+from app.use_cases.produto_use_case import logger
+
+class AsyncProdutoUseCase(ProdutoUseCase):
+
+    async def criar_produto(self, produto):
+        produto = await self.produto_entity.criar_produto(produto)
+
+        return self._apresentar(produto)
+
+    async def criar_lote(self, itens: list, parcial: bool = False) -> tuple[List[ProdutoResponseSchema], list[dict]]:
+        validos, erros = self._validar_lote(itens)
+        categorias = await self.produto_entity.categorias({produto.categoria for _, produto in validos})
+        validos = self._conferir_categorias(validos, erros, categorias)
+
+        if erros and not parcial:
+            raise LoteInvalidoError(erros)
+
+        produtos = await self.produto_entity.criar_produtos([produto for _, produto in validos]) if validos else []
+
+        return [self._create_response_schema(produto) for produto in produtos], erros
+
+    async def listar_todos(self) -> List[ProdutoResponseSchema]:
+        produtos = await self.produto_entity.listar_todos()
+
+        return [self._apresentar(produto) for produto in produtos]
+
+    async def listar_pagina(self, limite: int, cursor: str | None = None) -> tuple[List[ProdutoResponseSchema], str | None]:
+        produtos = await self.produto_entity.listar_todos(limite=limite + 1, apos_id=decode_cursor(cursor))
+
+        return self._create_pagina(produtos, limite)
+
+    async def buscar(self, termo: str, limite: int, cursor: str | None = None) -> tuple[List[ProdutoResponseSchema], str | None]:
+        posicao, limite = self._janela_busca(limite, cursor)
+
+        if limite <= 0:
+            return [], None
+
+        produtos = await self.produto_entity.buscar_por_termo(termo.strip(), limite + 1, posicao)
+
+        return self._create_pagina_busca(produtos, posicao, limite)
+
+    async def autocompletar(self, prefixo: str, limite: int) -> list[dict]:
+
+        return [{"id": id, "nome": nome} for id, nome in await self.produto_entity.autocompletar(prefixo, limite)]
+
+    async def exportar(self) -> AsyncIterator[str]:
+        async for produto in self.produto_entity.exportar():
+            yield self._create_response_schema(produto).model_dump_json() + "\n"
+
+    async def listar_por_categoria(self, categoria: str) -> List[ProdutoResponseSchema]:
+        produtos = await self.produto_entity.listar_por_categoria(categoria)
+
+        return [self._apresentar(produto) for produto in produtos]
+
+    async def buscar_por_id(self, id: int) -> ProdutoResponseSchema:
+        produto = await self.produto_entity.buscar_por_id(id)
+
+        if not produto:
+            raise ValueError("Produto não encontrado")
+
+        return self._apresentar(produto)
+
+    async def atualizar_produto(self, id: int, produto_data: ProdutoCreateSchema) -> ProdutoResponseSchema:
+        produto = await self.produto_entity.atualizar_produto(id, produto_data)
+
+        if not produto:
+            raise ValueError("Produto não encontrado")
+
+        return self._apresentar(produto)
+
+    async def deletar_produto(self, id: int):
+
+        return await self.produto_entity.deletar_produto(id)
+
+    async def cardapio(self) -> SnapshotCardapio:
+        if cardapio_cache.precisa_reconstruir(catalogo_versao.versao):
+            try:
+                await self._reconstruir_cardapio()
+            except Exception:
+                if cardapio_cache.atual is None:
+                    raise
+
+                logger.exception("Falha ao reconstruir o cardápio")
+
+        return cardapio_cache.atual
+
+    async def _reconstruir_cardapio(self):
+        travado = cardapio_cache.iniciar_reconstrucao()
+
+        if not travado and cardapio_cache.atual is not None:
+            return
+
+        try:
+            versao = catalogo_versao.versao
+            corpo = self._render_cardapio(await self.produto_entity.listar_cardapio())
+            # gzip/brotli no nível máximo não podem segurar o event loop
+            await anyio.to_thread.run_sync(cardapio_cache.publicar, corpo, versao)
+        finally:
+            if travado:
+                cardapio_cache.concluir_reconstrucao()
@@ -1,24 +1,43 @@
+from typing import Iterator
+from pydantic import ValidationError
+
 from app.entities.cliente.entities import ClienteEntities
 from app.entities.cliente.models import Cliente
-from app.adapters.schemas.cliente import ClienteResponseSchema
+from app.adapters.schemas.cliente import ClienteResponseSchema, ClienteImportacaoSchema, ClienteImportacaoErroSchema
 from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+from app.adapters.utils.paginacao import encode_cursor, decode_cursor
+from app.adapters.utils.validacao import mensagem_validacao
+from app.adapters.utils.cpf import normalizar_cpf, cpf_valido
+from app.infrastructure import config
+from app.adapters.utils.resposta import resposta_rapida
+from app.adapters.presenters.cliente_presenter import serializar_cliente
+
+class ClienteDuplicadoError(Exception):
+    def __init__(self, campos: set[str]):
+        self.campos = sorted(campos)
+        super().__init__(f"Já existe cliente cadastrado com este {' e '.join(self.campos)}")
 
 class ClienteUseCase:
     def __init__(self, entity: ClienteEntities):
         self.cliente_entities = entity
 
     def criar_cliente(self, clienteRequest: ClienteCreateSchema) -> ClienteResponseSchema:       
+        conflitos = self.cliente_entities.conflitos(cpf=clienteRequest.cpf, email=clienteRequest.email)
+
+        if conflitos:
+            raise ClienteDuplicadoError(conflitos)
+
         clienteCriado: Cliente = self.cliente_entities.criar_cliente(cliente=clienteRequest)
         
-        return self._create_response_schema(clienteCriado)
+        return self._apresentar(clienteCriado)
     
     def buscar_cliente_por_cpf(self, cpf_cliente: str) -> ClienteResponseSchema:
-        clienteBusca: Cliente = self.cliente_entities.buscar_por_cpf(cpf_cliente=cpf_cliente)
+        clienteBusca: Cliente = self.cliente_entities.buscar_por_cpf(cpf_cliente=self._normalizar_cpf(cpf_cliente))
         
         if not clienteBusca :
             raise ValueError("Cliente não encontrado")
             
-        return self._create_response_schema(clienteBusca)
+        return self._apresentar(clienteBusca)
     
     def buscar_cliente_por_id(self, id: int) -> ClienteResponseSchema:
         clienteBusca: Cliente = self.cliente_entities.buscar_por_id(id=id)
@@ -26,7 +45,7 @@ class ClienteUseCase:
         if not clienteBusca :
             raise ValueError("Cliente não encontrado")
         
-        return self._create_response_schema(clienteBusca)
+        return self._apresentar(clienteBusca)
     
     def listar_clientes(self) -> list[ClienteResponseSchema]:
         clientesBusca: list[Cliente] = self.cliente_entities.listar_todos()
@@ -34,25 +53,93 @@ class ClienteUseCase:
         
         for row in clientesBusca:
             clienteResponse.append(
-                self._create_response_schema(row)
+                self._apresentar(row)
             )
         
         return clienteResponse
 
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> tuple[list[ClienteResponseSchema], str | None]:
+        # um item a mais que o limite indica se existe próxima página
+        clientesBusca: list[Cliente] = self.cliente_entities.listar_todos(limite=limite + 1, apos_id=decode_cursor(cursor))
+
+        return self._create_pagina(clientesBusca, limite)
+
+    def exportar(self) -> Iterator[str]:
+        for cliente in self.cliente_entities.exportar():
+            yield self._create_response_schema(cliente).model_dump_json() + "\n"
+
+    def importar(self, registros) -> ClienteImportacaoSchema:
+        rejeitados = []
+        resultado = self.cliente_entities.importar(self._validar_importacao(registros, rejeitados))
+
+        return self._create_importacao(resultado, rejeitados)
+
     def atualizar_cliente(self, id: int,  clienteRequest: ClienteUpdateSchema) -> ClienteResponseSchema:
-        clienteEntity: Cliente = self.buscar_cliente_por_id(id=id)
-        
-        if not clienteEntity :
-            raise ValueError("Cliente não encontrado")
-        
+        # o DAO relê a linha no primário antes de alterar; None quando não existe
         clienteAtualizado: Cliente = self.cliente_entities.atualizar_cliente(id=id,cliente=clienteRequest)
 
-        return self._create_response_schema(clienteAtualizado)
+        if not clienteAtualizado:
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteAtualizado)
+
+    def atualizar_parcial(self, id: int, clienteRequest: ClienteUpdateSchema) -> ClienteResponseSchema:
+        # PATCH: só o que o cliente enviou; null explícito limpa o campo
+        clienteAtualizado: Cliente = self.cliente_entities.atualizar_parcial(id=id, campos=clienteRequest.model_dump(exclude_unset=True))
+
+        if not clienteAtualizado:
+            raise ValueError("Cliente não encontrado")
+
+        return self._apresentar(clienteAtualizado)
 
     def deletar_cliente(self, id: int) -> None:
         
         self.cliente_entities.deletar_cliente(id=id)
 
+    def _normalizar_cpf(self, cpf_cliente: str) -> str:
+        cpf = normalizar_cpf(cpf_cliente)
+
+        # cpf malformado nunca está cadastrado, não vale a consulta nem uma entrada no cache
+        if not cpf_valido(cpf):
+            raise ValueError("Cliente não encontrado")
+
+        return cpf
+
+    def _validar_importacao(self, registros, rejeitados: list):
+        # gerador: a validação acontece enquanto o DAO consome as linhas para a staging
+        for linha, registro, erro in registros:
+            if erro is None:
+                try:
+                    cliente = ClienteCreateSchema.model_validate(registro)
+                except ValidationError as e:
+                    erro = mensagem_validacao(e)
+                else:
+                    yield {"linha": linha, **cliente.model_dump()}
+                    continue
+
+            rejeitados.append((linha, erro))
+
+    def _create_importacao(self, resultado: dict, rejeitados: list) -> ClienteImportacaoSchema:
+        rejeitados = sorted(rejeitados + resultado["rejeitados"])
+
+        return (ClienteImportacaoSchema(
+                inserted=resultado["inseridos"],
+                updated=resultado["atualizados"],
+                rejected=len(rejeitados),
+                errors=[ClienteImportacaoErroSchema(line=linha, message=motivo)
+                        for linha, motivo in rejeitados[:config.IMPORT_ERROS_MAXIMO]]))
+
+    def _create_pagina(self, clientes, limite: int):
+        proximo_cursor = encode_cursor(clientes[limite - 1].id) if len(clientes) > limite else None
+
+        return [self._apresentar(cliente) for cliente in clientes[:limite]], proximo_cursor
+
+    def _apresentar(self, cliente):
+        if resposta_rapida():
+            return serializar_cliente(cliente)
+
+        return self._create_response_schema(cliente)
+
     def _create_response_schema(self, cliente) :
         
         return (ClienteResponseSchema(
@@ -1,10 +1,27 @@
-from typing import List
+import logging
+from typing import Iterator, List
+from pydantic import ValidationError
 
 from app.entities.produto.entities import ProdutoEntities
 from app.models.produto import Produto
 from app.adapters.schemas.produto import ProdutoResponseSchema
 from app.adapters.dto.produto_dto import ProdutoCreateSchema
 from app.adapters.schemas.categoria_produto import CategoriaProdutoResponseSchema
+from app.adapters.utils.paginacao import encode_cursor, decode_cursor, encode_cursor_posicao, decode_cursor_posicao
+from app.adapters.utils.validacao import mensagem_validacao
+from app.infrastructure import config
+from app.infrastructure.cache.categorias import registro_categorias
+from app.adapters.utils.resposta import resposta_rapida, json_bytes
+from app.adapters.presenters.produto_presenter import serializar_produto, serializar_cardapio
+from app.infrastructure.cache.cardapio import cardapio_cache, SnapshotCardapio
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+
+logger = logging.getLogger(__name__)
+
+class LoteInvalidoError(Exception):
+    def __init__(self, erros: list[dict]):
+        super().__init__("Lote contém produtos inválidos")
+        self.erros = erros
 
 class ProdutoUseCase:
     def __init__(self, entity: ProdutoEntities):
@@ -13,24 +30,60 @@ class ProdutoUseCase:
     def criar_produto(self, produto):
         produto = self.produto_entity.criar_produto(produto)
         
-        return self._create_response_schema(produto)       
+        return self._apresentar(produto)       
+
+    def criar_lote(self, itens: list, parcial: bool = False) -> tuple[List[ProdutoResponseSchema], list[dict]]:
+        validos, erros = self._validar_lote(itens)
+        categorias = self.produto_entity.categorias({produto.categoria for _, produto in validos})
+        validos = self._conferir_categorias(validos, erros, categorias)
+
+        if erros and not parcial:
+            raise LoteInvalidoError(erros)
+
+        produtos = self.produto_entity.criar_produtos([produto for _, produto in validos]) if validos else []
+
+        return [self._create_response_schema(produto) for produto in produtos], erros
    
     def listar_todos(self) -> List[ProdutoResponseSchema]:
         produtos = self.produto_entity.listar_todos()
         produtos_response = []
         
         for produto in produtos:
-            produto = self._create_response_schema(produto)
+            produto = self._apresentar(produto)
             produtos_response.append(produto)
             
         return produtos_response
     
+    def listar_pagina(self, limite: int, cursor: str | None = None) -> tuple[List[ProdutoResponseSchema], str | None]:
+        # um item a mais que o limite indica se existe próxima página
+        produtos = self.produto_entity.listar_todos(limite=limite + 1, apos_id=decode_cursor(cursor))
+
+        return self._create_pagina(produtos, limite)
+
+    def buscar(self, termo: str, limite: int, cursor: str | None = None) -> tuple[List[ProdutoResponseSchema], str | None]:
+        posicao, limite = self._janela_busca(limite, cursor)
+
+        if limite <= 0:
+            return [], None
+
+        produtos = self.produto_entity.buscar_por_termo(termo.strip(), limite + 1, posicao)
+
+        return self._create_pagina_busca(produtos, posicao, limite)
+
+    def autocompletar(self, prefixo: str, limite: int) -> list[dict]:
+
+        return [{"id": id, "nome": nome} for id, nome in self.produto_entity.autocompletar(prefixo, limite)]
+
+    def exportar(self) -> Iterator[str]:
+        for produto in self.produto_entity.exportar():
+            yield self._create_response_schema(produto).model_dump_json() + "\n"
+
     def listar_por_categoria(self, categoria: str) -> List[ProdutoResponseSchema]:
         produtos = self.produto_entity.listar_por_categoria(categoria)
         produtos_response = []
 
         for produto in produtos:
-            produto = self._create_response_schema(produto)
+            produto = self._apresentar(produto)
             produtos_response.append(produto)
 
         return produtos_response
@@ -41,7 +94,7 @@ class ProdutoUseCase:
         if not produto:
             raise ValueError("Produto não encontrado")
 
-        return self._create_response_schema(produto)
+        return self._apresentar(produto)
     
     def atualizar_produto(self, id: int, produto_data: ProdutoCreateSchema) -> ProdutoResponseSchema:
         produto = self.produto_entity.atualizar_produto(id, produto_data)
@@ -49,16 +102,116 @@ class ProdutoUseCase:
         if not produto:
             raise ValueError("Produto não encontrado")
 
-        return self._create_response_schema(produto)
+        return self._apresentar(produto)
     
     def deletar_produto(self, id: int):
 
         return self.produto_entity.deletar_produto(id)
+
+    def cardapio(self) -> SnapshotCardapio:
+        if cardapio_cache.precisa_reconstruir(catalogo_versao.versao):
+            try:
+                self._reconstruir_cardapio()
+            except Exception:
+                # com um snapshot anterior (TTL vencido) segue servindo ele
+                if cardapio_cache.atual is None:
+                    raise
+
+                logger.exception("Falha ao reconstruir o cardápio")
+
+        return cardapio_cache.atual
+
+    def _reconstruir_cardapio(self):
+        travado = cardapio_cache.iniciar_reconstrucao()
+
+        # outra request já está reconstruindo; sem snapshot nenhum (startup) esta também reconstrói
+        if not travado and cardapio_cache.atual is not None:
+            return
+
+        try:
+            # versão lida antes da consulta: uma escrita no meio deixa o snapshot já desatualizado
+            versao = catalogo_versao.versao
+            cardapio_cache.publicar(self._render_cardapio(self.produto_entity.listar_cardapio()), versao)
+        finally:
+            if travado:
+                cardapio_cache.concluir_reconstrucao()
+
+    def _render_cardapio(self, produtos) -> bytes:
+        grupos = {}
+
+        for produto in sorted(produtos, key=lambda produto: produto.id):
+            categoria = self._categoria(produto)
+            grupos.setdefault(categoria, []).append(serializar_produto(produto, *categoria))
+
+        return json_bytes(serializar_cardapio(sorted(grupos.items())))
     
+    def _validar_lote(self, itens: list) -> tuple[list, list[dict]]:
+        if not itens:
+            raise Exception("Lote vazio")
+
+        if len(itens) > config.PRODUTO_LOTE_MAXIMO:
+            raise Exception(f"Lote excede o máximo de {config.PRODUTO_LOTE_MAXIMO} produtos")
+
+        validos, erros = [], []
+
+        for index, item in enumerate(itens):
+            try:
+                validos.append((index, ProdutoCreateSchema.model_validate(item)))
+            except ValidationError as e:
+                erros.append({"index": index, "message": mensagem_validacao(e)})
+
+        return validos, erros
+
+    def _conferir_categorias(self, validos: list, erros: list[dict], categorias: dict[int, str]) -> list:
+        conferidos = []
+
+        for index, produto in validos:
+            if produto.categoria in categorias:
+                conferidos.append((index, produto))
+            else:
+                erros.append({"index": index, "message": f"categoria: Categoria {produto.categoria} não encontrada"})
+
+        erros.sort(key=lambda erro: erro["index"])
+
+        return conferidos
+
+    def _create_pagina(self, produtos, limite: int):
+        proximo_cursor = encode_cursor(produtos[limite - 1].id) if len(produtos) > limite else None
+
+        return [self._apresentar(produto) for produto in produtos[:limite]], proximo_cursor
+
+    def _janela_busca(self, limite: int, cursor: str | None) -> tuple[int, int]:
+        posicao = decode_cursor_posicao(cursor)
+
+        # além de BUSCA_RESULTADOS_MAXIMO a relevância já não ajuda: o termo precisa ser refinado
+        return posicao, min(limite, config.BUSCA_RESULTADOS_MAXIMO - posicao)
+
+    def _create_pagina_busca(self, produtos, posicao: int, limite: int):
+        fim = posicao + limite
+        proximo_cursor = encode_cursor_posicao(fim) if len(produtos) > limite and fim < config.BUSCA_RESULTADOS_MAXIMO else None
+
+        return [self._apresentar(produto) for produto in produtos[:limite]], proximo_cursor
+
+    def _apresentar(self, produto):
+        if resposta_rapida():
+            return serializar_produto(produto, *self._categoria(produto))
+
+        return self._create_response_schema(produto)
+
+    def _categoria(self, produto) -> tuple[int, str]:
+        nome = registro_categorias.nome(produto.categoria)
+
+        # fora do registro (ex.: objetos montados à mão) a relação do ORM ainda vale
+        if nome is None:
+            return produto.categoria_rel.id, produto.categoria_rel.nome
+
+        return produto.categoria, nome
+
     def _create_response_schema(self, produto) :
+        categoria_id, categoria_nome = self._categoria(produto)
         categoriaProduto: CategoriaProdutoResponseSchema = (CategoriaProdutoResponseSchema(
-            id=produto.categoria_rel.id, 
-            nome=produto.categoria_rel.nome
+            id=categoria_id, 
+            nome=categoria_nome
         ))
 
         return (ProdutoResponseSchema(
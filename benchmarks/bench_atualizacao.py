@@ -0,0 +1,95 @@
+# PUT /produtos/{id}: caminho anterior (SELECT + commit + refresh + lazy load da categoria)
+# contra o UPDATE ... RETURNING do ProdutoDAO. Em SQLite em memória a diferença é só de CPU;
+# apontando para um Postgres (--database-url) aparece o custo de cada ida e volta ao banco.
+# Uso: python -m benchmarks.bench_atualizacao [--repeticoes 2000] [--database-url postgresql://...]
+import argparse
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.db.database import Base
+from app.models import Produto, CategoriaProduto
+from app.dao.produto_dao import ProdutoDAO
+from tests.query_counter import contar_queries
+
+TOTAL_PRODUTOS = 1_000
+
+def preparar(database_url: str):
+    kwargs = {"connect_args": {"check_same_thread": False}, "poolclass": StaticPool} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, **kwargs)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        if not db.get(CategoriaProduto, 1):
+            db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=2, nome="Bebida")])
+            db.flush()
+
+        if not db.query(Produto).count():
+            db.add_all([
+                Produto(nome=f"Produto {i}", descricao="desc", preco=Decimal("10.00"), categoria=1)
+                for i in range(TOTAL_PRODUTOS)
+            ])
+
+        db.commit()
+        ids = [id for (id,) in db.query(Produto.id).order_by(Produto.id).limit(TOTAL_PRODUTOS)]
+
+    return engine, ids
+
+def atualizar_anterior(db, id: int, dados):
+    produto = db.query(Produto).filter(Produto.id == id).first()
+
+    if produto:
+        produto.nome = dados.nome
+        produto.descricao = dados.descricao
+        produto.preco = Decimal(dados.preco)
+        produto.categoria = dados.categoria
+        db.commit()
+        db.refresh(produto)
+        produto.categoria_rel.nome
+
+    return produto
+
+def atualizar_returning(db, id: int, dados):
+
+    return ProdutoDAO(db).atualizar_produto(id, dados)
+
+def medir(engine, ids, funcao, repeticoes: int) -> tuple[float, float]:
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with contar_queries(engine) as queries:
+        inicio = time.perf_counter()
+
+        for i in range(repeticoes):
+            dados = SimpleNamespace(nome=f"Produto {i}", descricao="desc", preco="12.50", categoria=1 + i % 2)
+
+            with session_local() as db:
+                funcao(db, ids[i % len(ids)], dados)
+
+        duracao = time.perf_counter() - inicio
+
+    return duracao / repeticoes, queries.count / repeticoes
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeticoes", type=int, default=2000)
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+
+    engine, ids = preparar(args.database_url)
+
+    print(f"{'caminho':>10} {'us/update':>10} {'statements/update':>18}")
+
+    for nome, funcao in (("anterior", atualizar_anterior), ("returning", atualizar_returning)):
+        medir(engine, ids, funcao, min(100, args.repeticoes))
+        tempo, statements = medir(engine, ids, funcao, args.repeticoes)
+
+        print(f"{nome:>10} {tempo * 1e6:>10.1f} {statements:>18.1f}")
+
+    engine.dispose()
+
+if __name__ == "__main__":
+    main()
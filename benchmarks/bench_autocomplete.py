@@ -0,0 +1,45 @@
+# GET /produtos/autocomplete: tempo de IndiceAutocomplete.sugerir por tecla digitada, com o catálogo inteiro em memória.
+# Uso: python -m benchmarks.bench_autocomplete [--produtos 10000] [--repeticoes 20000]
+import argparse
+import random
+import time
+
+from app.infrastructure.cache.autocomplete import IndiceAutocomplete
+
+PALAVRAS = ["X-Burger", "Salada", "Bacon", "Pão", "Queijo", "Frango", "Açaí", "Suco", "Laranja", "Batata",
+            "Frita", "Milk", "Shake", "Chocolate", "Morango", "Combo", "Duplo", "Vegano", "Picanha", "Cebola"]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--produtos", type=int, default=10_000)
+    parser.add_argument("--repeticoes", type=int, default=20_000)
+    args = parser.parse_args()
+
+    aleatorio = random.Random(42)
+    nomes = [(id, " ".join(aleatorio.sample(PALAVRAS, 3)) + f" {id}") for id in range(args.produtos)]
+    indice = IndiceAutocomplete(ttl=300)
+
+    inicio = time.perf_counter()
+    indice.carregar(nomes, indice.geracao)
+    print(f"carga de {args.produtos} produtos: {(time.perf_counter() - inicio) * 1e3:.1f} ms")
+
+    # cada nome digitado letra a letra, como no totem
+    digitados = [nome[:tamanho] for _, nome in aleatorio.sample(nomes, 200) for tamanho in range(1, 12)]
+    tempos = []
+
+    for i in range(args.repeticoes):
+        prefixo = digitados[i % len(digitados)]
+        inicio = time.perf_counter()
+        indice.sugerir(prefixo, 8)
+        tempos.append(time.perf_counter() - inicio)
+
+    tempos.sort()
+    print(f"{'p50':>6} {tempos[len(tempos) // 2] * 1e6:>8.1f} us")
+    print(f"{'p99':>6} {tempos[int(len(tempos) * 0.99)] * 1e6:>8.1f} us")
+
+    inicio = time.perf_counter()
+    indice.registrar(args.produtos, "Produto Novo")
+    print(f"escrita incremental: {(time.perf_counter() - inicio) * 1e6:.1f} us")
+
+if __name__ == "__main__":
+    main()
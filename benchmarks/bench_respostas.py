@@ -0,0 +1,76 @@
+# Custo por item da listagem de produtos nos dois modos de resposta (RESPONSE_MODE).
+# Uso: python -m benchmarks.bench_respostas [--repeticoes 5]
+import argparse
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import produto as produto_api
+from app.infrastructure import config
+from app.infrastructure.cache.catalogo import catalogo_cache
+from app.infrastructure.cache.categorias import registro_categorias
+from app.controllers.produto_controller import ProdutoController
+
+TAMANHOS = (1_000, 10_000)
+MODOS = ("validated", "fast")
+
+class GatewayEmMemoria:
+    def __init__(self, produtos):
+        self.produtos = produtos
+
+    def listar_todos(self, limite=None, apos_id=None):
+
+        return self.produtos[:limite]
+
+CATEGORIA = SimpleNamespace(id=1, nome="Lanche")
+
+def gerar_produtos(quantidade: int):
+
+    return [
+        SimpleNamespace(id=i, nome=f"Produto {i}", descricao="Pão, carne e queijo", preco=Decimal("25.90"),
+                        categoria=CATEGORIA.id, categoria_rel=CATEGORIA)
+        for i in range(1, quantidade + 1)
+    ]
+
+def medir(funcao, repeticoes: int) -> float:
+    funcao()
+    inicio = time.perf_counter()
+
+    for _ in range(repeticoes):
+        funcao()
+
+    return (time.perf_counter() - inicio) / repeticoes
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    config.PAGINACAO_LIMITE_MAXIMO = max(TAMANHOS)
+    catalogo_cache.enabled = False
+    # como no startup: o nome da categoria vem do registro em memória, não do relacionamento
+    registro_categorias.substituir([(CATEGORIA.id, CATEGORIA.nome)])
+    client = TestClient(app)
+
+    print(f"{'itens':>8} {'modo':>10} {'controller us/item':>20} {'HTTP us/item':>14} {'bytes':>10}")
+
+    for tamanho in TAMANHOS:
+        gateway = GatewayEmMemoria(gerar_produtos(tamanho))
+        app.dependency_overrides[produto_api.get_produto_gateway] = lambda: gateway
+
+        for modo in MODOS:
+            config.RESPONSE_MODE = modo
+
+            controller = medir(lambda: ProdutoController(db_session=gateway).listar_pagina(tamanho), args.repeticoes)
+            http = medir(lambda: client.get("/produtos/", params={"limit": tamanho}), args.repeticoes)
+            corpo = client.get("/produtos/", params={"limit": tamanho}).content
+
+            print(f"{tamanho:>8} {modo:>10} {controller / tamanho * 1e6:>20.2f} {http / tamanho * 1e6:>14.2f} {len(corpo):>10}")
+
+    app.dependency_overrides.clear()
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,32 @@
 import sys, os
+import pytest
 from pathlib import Path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
\ No newline at end of file
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from app.infrastructure.cache.catalogo import catalogo_cache
+from app.infrastructure.cache.categorias import registro_categorias
+from app.infrastructure.cache.clientes import clientes_cache
+from app.infrastructure.cache.bloom import filtros_clientes
+from app.infrastructure.cache.busca_produtos import indice_produtos
+from app.infrastructure.cache.autocomplete import indice_autocomplete
+from app.infrastructure.cache.cardapio import cardapio_cache
+
+
+@pytest.fixture(autouse=True)
+def limpar_catalogo_cache():
+    # o cache do catálogo é global ao processo, cada teste começa com ele vazio
+    catalogo_cache.clear()
+    clientes_cache.clear()
+    filtros_clientes.limpar()
+    registro_categorias.limpar()
+    indice_produtos.limpar()
+    indice_autocomplete.limpar()
+    cardapio_cache.limpar()
+    yield
+    catalogo_cache.clear()
+    clientes_cache.clear()
+    filtros_clientes.limpar()
+    registro_categorias.limpar()
+    indice_produtos.limpar()
+    indice_autocomplete.limpar()
+    cardapio_cache.limpar()
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+from decimal import Decimal
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import async_cliente, async_produto
+
+
+class MockAsyncProdutoGateway:
+    def __init__(self):
+        categoria = SimpleNamespace(id=1, nome="Lanches")
+        self.obj = SimpleNamespace(id=1, nome="X-Burger", descricao="Delicioso", preco=Decimal("12.50"), categoria=1, categoria_rel=categoria)
+
+    async def criar_produto(self, produto):
+        return self.obj
+
+    async def listar_todos(self, limite=None, apos_id=None):
+        return [self.obj]
+
+    async def exportar(self):
+        yield self.obj
+
+    async def listar_por_categoria(self, categoria):
+        return [self.obj] if int(categoria) == self.obj.categoria_rel.id else []
+
+    async def buscar_por_id(self, id: int):
+        return self.obj if id == self.obj.id else None
+
+    async def atualizar_produto(self, id: int, produto_data):
+        return self.obj if id == self.obj.id else None
+
+    async def deletar_produto(self, id: int):
+        return None
+
+
+class MockAsyncClienteGateway:
+    def __init__(self):
+        self.obj = SimpleNamespace(id=1, nome="João Silva", email="joao@example.com", telefone="11999999999", cpf="12345678901")
+
+    async def criar_cliente(self, cliente):
+        return self.obj
+
+    async def conflitos(self, cpf=None, email=None):
+        return set()
+
+    async def buscar_por_cpf(self, cpf_cliente: str):
+        return self.obj if cpf_cliente == self.obj.cpf else None
+
+    async def buscar_por_id(self, id: int):
+        return self.obj if id == self.obj.id else None
+
+    async def listar_todos(self, limite=None, apos_id=None):
+        return [self.obj]
+
+    async def exportar(self):
+        for _ in range(3):
+            yield self.obj
+
+    async def atualizar_cliente(self, id: int, cliente):
+        return self.obj
+
+    async def deletar_cliente(self, id: int):
+        return None
+
+
+app = FastAPI()
+app.include_router(async_cliente.router)
+app.include_router(async_produto.router)
+app.dependency_overrides[async_produto.get_produto_gateway] = lambda: MockAsyncProdutoGateway()
+app.dependency_overrides[async_cliente.get_cliente_gateway] = lambda: MockAsyncClienteGateway()
+app.dependency_overrides[async_produto.get_produto_gateway_primario] = lambda: MockAsyncProdutoGateway()
+app.dependency_overrides[async_cliente.get_cliente_gateway_primario] = lambda: MockAsyncClienteGateway()
+
+client = TestClient(app)
+
+
+def test_rotas_async_de_produto():
+    payload = {"nome": "X-Burger", "descricao": "Delicioso", "preco": 12.5, "categoria": 1}
+
+    r = client.post("/produtos/", json=payload)
+    assert r.status_code == 201
+    assert r.json()["data"]["nome"] == "X-Burger"
+
+    r2 = client.get("/produtos/")
+    assert r2.status_code == 200
+    assert len(r2.json()["data"]) == 1
+
+    r3 = client.get("/produtos/categoria/1")
+    assert r3.status_code == 200
+    assert r3.json()["data"][0]["categoria"]["nome"] == "Lanches"
+
+    r4 = client.get("/produtos/1")
+    assert r4.status_code == 200
+
+    r5 = client.delete("/produtos/1")
+    assert r5.status_code == 204
+
+
+def test_rotas_async_de_cliente():
+    r = client.get("/clientes/cpf/12345678901")
+    assert r.status_code == 200
+    assert r.json()["data"]["email"] == "joao@example.com"
+
+    r2 = client.get("/clientes/")
+    assert r2.status_code == 200
+    assert isinstance(r2.json()["data"], list)
+
+    r3 = client.put("/clientes/1", json={"nome": "João Atualizado"})
+    assert r3.status_code == 200
+
+    r4 = client.delete("/clientes/1")
+    assert r4.status_code == 204
+
+
+def test_exportar_async_em_ndjson():
+    r = client.get("/clientes/export")
+
+    assert r.status_code == 200
+    assert len(r.text.splitlines()) == 3
+
+    r2 = client.get("/produtos/export")
+
+    assert r2.status_code == 200
+    assert r2.text.count("X-Burger") == 1
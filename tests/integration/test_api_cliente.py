@@ -1,7 +1,7 @@
 from types import SimpleNamespace
 from fastapi.testclient import TestClient
 from app.main import app
-from app.api.cliente import get_cliente_gateway
+from app.api.cliente import get_cliente_gateway, get_cliente_gateway_primario
 from decimal import Decimal
 
 
@@ -12,13 +12,16 @@ class MockClienteGateway:
     def criar_cliente(self, cliente):
         return self.obj
 
+    def conflitos(self, cpf=None, email=None):
+        return set()
+
     def buscar_por_cpf(self, cpf_cliente: str):
         return self.obj if cpf_cliente == self.obj.cpf else None
 
     def buscar_por_id(self, id: int):
         return self.obj if id == self.obj.id else None
 
-    def listar_todos(self):
+    def listar_todos(self, limite=None, apos_id=None):
         return [self.obj]
 
     def atualizar_cliente(self, id: int, cliente):
@@ -41,6 +44,7 @@ class MockClienteGateway:
 
 def setup_module(module):
     app.dependency_overrides[get_cliente_gateway] = lambda: MockClienteGateway()
+    app.dependency_overrides[get_cliente_gateway_primario] = lambda: MockClienteGateway()
 
 
 def teardown_module(module):
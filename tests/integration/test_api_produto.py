@@ -1,19 +1,19 @@
 from types import SimpleNamespace
 from fastapi.testclient import TestClient
 from app.main import app
-from app.api.produto import get_produto_gateway
+from app.api.produto import get_produto_gateway, get_produto_gateway_primario
 from decimal import Decimal
 
 
 class MockProdutoGateway:
     def __init__(self):
         categoria = SimpleNamespace(id=1, nome="Lanches")
-        self.obj = SimpleNamespace(id=1, nome="X-Burger", descricao="Delicioso", preco=Decimal("12.50"), categoria_rel=categoria)
+        self.obj = SimpleNamespace(id=1, nome="X-Burger", descricao="Delicioso", preco=Decimal("12.50"), categoria=1, categoria_rel=categoria)
 
     def criar_produto(self, produto):
         return self.obj
 
-    def listar_todos(self):
+    def listar_todos(self, limite=None, apos_id=None):
         return [self.obj]
 
     def listar_por_categoria(self, categoria):
@@ -40,7 +40,7 @@ class MockProdutoGateway:
         except Exception:
             preco_decimal = self.obj.preco
 
-        return SimpleNamespace(id=id, nome=data.get("nome", self.obj.nome), descricao=data.get("descricao", self.obj.descricao), preco=preco_decimal, categoria_rel=self.obj.categoria_rel)
+        return SimpleNamespace(id=id, nome=data.get("nome", self.obj.nome), descricao=data.get("descricao", self.obj.descricao), preco=preco_decimal, categoria=self.obj.categoria, categoria_rel=self.obj.categoria_rel)
 
     def deletar_produto(self, id: int):
         return None
@@ -48,6 +48,7 @@ class MockProdutoGateway:
 
 def setup_module(module):
     app.dependency_overrides[get_produto_gateway] = lambda: MockProdutoGateway()
+    app.dependency_overrides[get_produto_gateway_primario] = lambda: MockProdutoGateway()
 
 
 def teardown_module(module):
@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.infrastructure.cache.bloom import filtros_clientes
+from app.dao.cliente_dao import ClienteDAO
+from app.models import Cliente
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(Cliente(nome="Cliente", email="cliente@example.com", telefone=None, cpf="12345678901"))
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # como no startup: filtros montados a partir da tabela
+    with session_local() as db:
+        filtros_clientes.carregar(ClienteDAO(db).chaves())
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_cpf_duplicado_retorna_409_sem_tentar_o_insert(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.post("/clientes/", json={"nome": "Outro", "email": "outro@example.com", "cpf": "12345678901"})
+
+    assert r.status_code == 409
+    assert r.json()["detail"]["fields"] == ["cpf"]
+    assert not any(sql.lstrip().upper().startswith("INSERT") for sql in queries.statements)
+
+
+def test_email_duplicado_retorna_409(client):
+    r = client.post("/clientes/", json={"nome": "Outro", "email": "cliente@example.com", "cpf": "10987654321"})
+
+    assert r.status_code == 409
+    assert r.json()["detail"]["fields"] == ["email"]
+
+
+def test_cliente_novo_dispensa_a_consulta_de_existencia(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.post("/clientes/", json={"nome": "Novo cliente", "email": "novo@example.com", "cpf": "10987654321"})
+
+    assert r.status_code == 201
+    # só o INSERT ... RETURNING, nenhuma consulta de existência antes
+    assert queries.count == 1, queries.statements
+    assert queries.statements[0].lstrip().upper().startswith("INSERT")
+
+
+def test_cliente_criado_entra_nos_filtros(client):
+    assert client.post("/clientes/", json={"nome": "Novo cliente", "email": "novo@example.com", "cpf": "10987654321"}).status_code == 201
+
+    r = client.post("/clientes/", json={"nome": "Novo cliente", "email": "novo@example.com", "cpf": "10987654321"})
+
+    assert r.status_code == 409
+    assert r.json()["detail"]["fields"] == ["cpf", "email"]
+
+
+def test_deletar_cliente_em_uma_unica_query(client, engine):
+    id = client.post("/clientes/", json={"nome": "Novo cliente", "email": "novo@example.com", "cpf": "10987654321"}).json()["data"]["id"]
+
+    with contar_queries(engine) as queries:
+        r = client.delete(f"/clientes/{id}")
+
+    assert r.status_code == 204
+    assert queries.count == 1, queries.statements
+
+    assert client.delete(f"/clientes/{id}").status_code == 404
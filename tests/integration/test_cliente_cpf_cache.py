@@ -0,0 +1,106 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.infrastructure.metrics import metrics
+from app.infrastructure.cache.clientes import clientes_cache
+from app.models import Cliente
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(Cliente(nome="Cliente", email="cliente@example.com", telefone=None, cpf="12345678901"))
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_busca_repetida_por_cpf_consulta_o_banco_uma_vez(client, engine):
+    with contar_queries(engine) as queries:
+        for _ in range(3):
+            r = client.get("/clientes/cpf/12345678901")
+
+            assert r.status_code == 200
+            assert r.json()["data"]["cpf"] == "12345678901"
+
+    assert queries.count == 1, queries.statements
+    assert clientes_cache.stats()["hits"] == 2
+
+
+def test_cpf_mascarado_usa_a_mesma_entrada(client, engine):
+    client.get("/clientes/cpf/12345678901")
+
+    with contar_queries(engine) as queries:
+        r = client.get("/clientes/cpf/123.456.789-01")
+
+    assert r.status_code == 200
+    assert queries.count == 0, queries.statements
+
+
+def test_cpf_malformado_nao_consulta_o_banco(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.get("/clientes/cpf/123")
+
+    assert r.status_code == 404
+    assert queries.count == 0, queries.statements
+
+
+def test_cpf_inexistente_fica_no_cache_negativo(client, engine):
+    negativos = metrics.get("cache.negative_hits", cache="clientes_cpf")
+
+    with contar_queries(engine) as queries:
+        assert client.get("/clientes/cpf/99999999999").status_code == 404
+        assert client.get("/clientes/cpf/99999999999").status_code == 404
+
+    assert queries.count == 1, queries.statements
+    assert metrics.get("cache.negative_hits", cache="clientes_cpf") == negativos + 1
+
+
+def test_cadastro_invalida_o_cache_negativo(client):
+    assert client.get("/clientes/cpf/99999999999").status_code == 404
+
+    r = client.post("/clientes/", json={"nome": "Novo cliente", "email": "novo@example.com", "cpf": "999.999.999-99"})
+
+    assert r.status_code == 201
+    assert r.json()["data"]["cpf"] == "99999999999"
+    assert client.get("/clientes/cpf/99999999999").status_code == 200
+
+
+def test_atualizacao_e_remocao_invalidam_o_cpf(client):
+    id = client.get("/clientes/cpf/12345678901").json()["data"]["id"]
+
+    r = client.put(f"/clientes/{id}", json={"nome": "Cliente", "email": "cliente@example.com", "cpf": "10987654321"})
+
+    assert r.status_code == 200
+    assert client.get("/clientes/cpf/12345678901").status_code == 404
+    assert client.get("/clientes/cpf/10987654321").status_code == 200
+
+    assert client.delete(f"/clientes/{id}").status_code == 204
+    assert client.get("/clientes/cpf/10987654321").status_code == 404
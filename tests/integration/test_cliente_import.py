@@ -0,0 +1,114 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.cli import importar_clientes
+from app.infrastructure.db.database import Base, get_db
+from app.models import Cliente
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(Cliente(nome="Maria Antiga", email="maria@example.com", telefone=None, cpf="11111111111"))
+        db.add(Cliente(nome="José", email="jose@example.com", telefone=None, cpf="22222222222"))
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def session_local(engine):
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def client(session_local):
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def clientes_por_cpf(engine):
+    with engine.connect() as conn:
+        return {c.cpf: c for c in conn.execute(select(Cliente.__table__))}
+
+
+CSV = """nome,email,telefone,cpf
+Maria Nova,maria@example.com,11912345678,11111111111
+Ana,ana@example.com,,33333333333
+Bruno,jose@example.com,,44444444444
+Carla,<sem email>,,55555555555
+Duda,duda@example.com,,66666666666
+Duda Corrigida,duda2@example.com,,66666666666
+"""
+
+
+def test_importar_csv_faz_upsert_por_cpf(client, engine):
+    r = client.post("/clientes/import", content=CSV, headers={"Content-Type": "text/csv"})
+
+    assert r.status_code == 200
+    data = r.json()["data"]
+    assert (data["inserted"], data["updated"], data["rejected"]) == (2, 1, 3)
+    assert [erro["line"] for erro in data["errors"]] == [4, 5, 6]
+    assert data["errors"][0]["message"] == "email já cadastrado para outro cliente"
+    assert data["errors"][1]["message"].startswith("email:")
+    assert data["errors"][2]["message"] == "cpf repetido em linha posterior do arquivo"
+
+    clientes = clientes_por_cpf(engine)
+    assert clientes["11111111111"].nome == "Maria Nova"
+    assert clientes["11111111111"].telefone == "11912345678"
+    assert clientes["33333333333"].telefone is None
+    assert clientes["66666666666"].email == "duda2@example.com"
+    assert "44444444444" not in clientes
+    assert len(clientes) == 4
+
+
+def test_importar_ndjson(client, engine):
+    linhas = [
+        json.dumps({"nome": "Ana", "email": "ana@example.com", "cpf": "33333333333"}),
+        "{quebrado",
+        json.dumps({"nome": "José Silva", "email": "jose@example.com", "cpf": "22222222222"}),
+    ]
+
+    r = client.post("/clientes/import", content="\n".join(linhas), headers={"Content-Type": "application/x-ndjson"})
+
+    assert r.status_code == 200
+    data = r.json()["data"]
+    assert (data["inserted"], data["updated"], data["rejected"]) == (1, 1, 1)
+    assert data["errors"] == [{"line": 2, "message": "JSON inválido"}]
+    assert clientes_por_cpf(engine)["22222222222"].nome == "José Silva"
+
+
+def test_importar_formato_nao_suportado(client):
+    r = client.post("/clientes/import", content="<xml/>", headers={"Content-Type": "application/xml"})
+
+    assert r.status_code == 415
+
+
+def test_importar_pela_linha_de_comando(engine, session_local, tmp_path, monkeypatch, capsys):
+    arquivo = tmp_path / "clientes.csv"
+    arquivo.write_text("nome,email,telefone,cpf\nAna,ana@example.com,,33333333333\n", encoding="utf-8")
+    monkeypatch.setattr(importar_clientes, "SessionLocal", session_local)
+
+    assert importar_clientes.main([str(arquivo)]) == 0
+
+    assert json.loads(capsys.readouterr().out)["inserted"] == 1
+    assert "33333333333" in clientes_por_cpf(engine)
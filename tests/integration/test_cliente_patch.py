@@ -0,0 +1,94 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Cliente
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(Cliente(nome="Cliente", email="cliente@example.com", telefone="11999999999", cpf="12345678901"))
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_patch_altera_somente_os_campos_enviados(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.patch("/clientes/1", json={"nome": "Cliente Renomeado"})
+
+    assert r.status_code == 200
+    assert r.json()["data"] == {
+        "id": 1, "nome": "Cliente Renomeado", "email": "cliente@example.com", "telefone": "11999999999", "cpf": "12345678901"
+    }
+    assert queries.count == 1, queries.statements
+    assert queries.statements[0].lstrip().upper().startswith("UPDATE")
+
+
+def test_patch_com_null_explicito_limpa_o_campo(client):
+    r = client.patch("/clientes/1", json={"telefone": None})
+
+    assert r.status_code == 200
+    assert r.json()["data"]["telefone"] is None
+    assert r.json()["data"]["nome"] == "Cliente"
+
+
+def test_patch_sem_mudanca_nao_escreve(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.patch("/clientes/1", json={"nome": "Cliente", "email": "cliente@example.com"})
+
+    assert r.status_code == 200
+    assert r.json()["data"]["nome"] == "Cliente"
+    # o UPDATE não casa nenhuma linha (valores iguais) e a leitura devolve o registro atual
+    assert queries.count == 2, queries.statements
+
+
+def test_patch_vazio_apenas_le(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.patch("/clientes/1", json={})
+
+    assert r.status_code == 200
+    assert queries.count == 1, queries.statements
+    assert queries.statements[0].lstrip().upper().startswith("SELECT")
+
+
+def test_patch_cliente_inexistente_retorna_404(client):
+    assert client.patch("/clientes/999", json={"nome": "Ninguém"}).status_code == 404
+    assert client.patch("/clientes/999", json={}).status_code == 404
+
+
+def test_patch_do_cpf_invalida_o_cache_de_busca(client):
+    assert client.get("/clientes/cpf/10987654321").status_code == 404
+
+    r = client.patch("/clientes/1", json={"cpf": "109.876.543-21"})
+
+    assert r.status_code == 200
+    assert client.get("/clientes/cpf/10987654321").status_code == 200
+    assert client.get("/clientes/cpf/12345678901").status_code == 404
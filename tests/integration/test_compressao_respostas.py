@@ -0,0 +1,72 @@
+import gzip
+import json
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
+
+TOTAL_PRODUTOS = 100
+
+
+@pytest.fixture
+def client():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_local() as db:
+        db.add(CategoriaProduto(id=1, nome="Lanche"))
+        db.add_all([
+            Produto(nome=f"Produto {i}", descricao="desc", preco=Decimal("10.00"), categoria=1)
+            for i in range(TOTAL_PRODUTOS)
+        ])
+        db.commit()
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    engine.dispose()
+
+
+def bruto(client, caminho):
+    with client.stream("GET", caminho, headers={"Accept-Encoding": "gzip"}) as r:
+        return r, b"".join(r.iter_raw())
+
+
+def test_listagem_comprimida(client):
+    r, corpo = bruto(client, "/produtos/")
+
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(corpo))["data"]) == TOTAL_PRODUTOS
+
+
+def test_export_ndjson_comprimido(client):
+    r, corpo = bruto(client, "/produtos/export")
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert len(gzip.decompress(corpo).splitlines()) == TOTAL_PRODUTOS
+
+
+def test_cardapio_pre_comprimido_nao_e_comprimido_de_novo(client):
+    r, corpo = bruto(client, "/produtos/menu")
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert len(json.loads(gzip.decompress(corpo))["data"][0]["produtos"]) == TOTAL_PRODUTOS
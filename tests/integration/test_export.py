@@ -0,0 +1,69 @@
+import json
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Cliente, Produto, CategoriaProduto
+
+TOTAL = 1200
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(CategoriaProduto(id=1, nome="Lanche"))
+        db.add_all([Cliente(nome=f"Cliente {i}", email=f"c{i}@example.com", telefone=None, cpf=f"{i:011d}") for i in range(TOTAL)])
+        db.add_all([Produto(nome=f"Produto {i}", descricao="desc", preco=Decimal("9.90"), categoria=1) for i in range(10)])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_exportar_clientes_em_ndjson(client):
+    with client.stream("GET", "/clientes/export") as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+
+        linhas = [json.loads(linha) for linha in r.iter_lines() if linha]
+
+    assert len(linhas) == TOTAL
+    assert [linha["id"] for linha in linhas] == sorted(linha["id"] for linha in linhas)
+    assert linhas[0]["cpf"] == "00000000000"
+
+
+def test_exportar_produtos_em_ndjson(client):
+    r = client.get("/produtos/export")
+
+    assert r.status_code == 200
+
+    linhas = [json.loads(linha) for linha in r.text.splitlines()]
+
+    assert len(linhas) == 10
+    assert linhas[0]["categoria"] == {"id": 1, "nome": "Lanche"}
+    assert linhas[0]["preco"] == "9.90"
@@ -0,0 +1,146 @@
+import time
+import uuid
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import cliente as cliente_api
+from app.infrastructure.api.idempotencia import IdempotenciaMiddleware
+from app.infrastructure.cache.idempotencia import ArmazemIdempotenciaMemoria
+
+PAYLOAD = {"nome": "João Silva", "email": "joao@example.com", "cpf": "12345678901"}
+
+
+class GatewayLento:
+    def __init__(self, atraso=0.0, falhar=False):
+        self.atraso = atraso
+        self.falhar = falhar
+        self.criados = 0
+
+    def conflitos(self, cpf=None, email=None):
+        return set()
+
+    def criar_cliente(self, cliente):
+        time.sleep(self.atraso)
+
+        if self.falhar:
+            raise RuntimeError("banco indisponível")
+
+        self.criados += 1
+
+        return SimpleNamespace(id=self.criados, nome=cliente.nome, email=cliente.email, telefone=cliente.telefone, cpf=cliente.cpf)
+
+
+@pytest.fixture
+def anyio_backend():
+    # o servidor roda em asyncio (uvicorn); a rota síncrona usa o threadpool do anyio
+    return "asyncio"
+
+
+@pytest.fixture
+def gateway():
+    gateway = GatewayLento()
+    app.dependency_overrides[cliente_api.get_cliente_gateway] = lambda: gateway
+    app.dependency_overrides[cliente_api.get_cliente_gateway_primario] = lambda: gateway
+    yield gateway
+    app.dependency_overrides.pop(cliente_api.get_cliente_gateway, None)
+    app.dependency_overrides.pop(cliente_api.get_cliente_gateway_primario, None)
+
+
+@pytest.fixture
+def chave():
+    return str(uuid.uuid4())
+
+
+def test_repeticao_devolve_a_primeira_resposta_sem_executar(gateway, chave):
+    client = TestClient(app)
+
+    r1 = client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave})
+    r2 = client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave})
+
+    assert r1.status_code == r2.status_code == 201
+    assert r1.json() == r2.json()
+    assert r2.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in r1.headers
+    assert gateway.criados == 1
+
+
+def test_sem_chave_executa_sempre(gateway):
+    client = TestClient(app)
+
+    client.post("/clientes/", json=PAYLOAD)
+    client.post("/clientes/", json=PAYLOAD)
+
+    assert gateway.criados == 2
+
+
+def test_mesma_chave_com_outro_corpo_e_recusada(gateway, chave):
+    client = TestClient(app)
+
+    client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave})
+    r = client.post("/clientes/", json={**PAYLOAD, "nome": "Outro Nome"}, headers={"Idempotency-Key": chave})
+
+    assert r.status_code == 422
+    assert gateway.criados == 1
+
+
+def test_erro_5xx_nao_e_guardado(chave):
+    armazem = ArmazemIdempotenciaMemoria(maxsize=10, ttl=60)
+    middleware = IdempotenciaMiddleware(app, armazem=armazem)
+
+    async def erro(scope, receive, send):
+        await send({"type": "http.response.start", "status": 503, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware.app = erro
+    client = TestClient(middleware)
+
+    assert client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave}).status_code == 503
+    assert len(armazem) == 0
+
+
+@pytest.mark.anyio
+async def test_duplicatas_simultaneas_esperam_a_original(gateway, chave):
+    gateway.atraso = 0.3
+    respostas = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        async def enviar():
+            respostas.append(await client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave}))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(enviar)
+
+    assert [r.status_code for r in respostas] == [201, 201, 201]
+    assert len({r.content for r in respostas}) == 1
+    assert gateway.criados == 1
+    assert sum(r.headers.get("idempotent-replayed") == "true" for r in respostas) == 2
+
+
+@pytest.mark.anyio
+async def test_espera_esgotada_retorna_409(gateway, chave):
+    gateway.atraso = 0.5
+    armazem = ArmazemIdempotenciaMemoria(maxsize=10, ttl=60)
+    original = {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=IdempotenciaMiddleware(app, armazem=armazem, espera=0.05)),
+                                 base_url="http://test") as client:
+        async def enviar_original():
+            original["resposta"] = await client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave})
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(enviar_original)
+
+            while not len(armazem):
+                await anyio.sleep(0.01)
+
+            duplicada = await client.post("/clientes/", json=PAYLOAD, headers={"Idempotency-Key": chave})
+
+    assert original["resposta"].status_code == 201
+    assert duplicada.status_code == 409
+    assert duplicada.headers["retry-after"] == "1"
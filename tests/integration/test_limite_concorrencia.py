@@ -0,0 +1,85 @@
+import anyio
+import httpx
+import pytest
+from starlette.responses import PlainTextResponse
+
+from app.infrastructure.api.limite_concorrencia import LimiteAdaptativo, LimiteConcorrenciaMiddleware
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class AppBloqueado:
+    def __init__(self):
+        self.liberar = anyio.Event()
+        self.entraram = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["path"].startswith("/health"):
+            return await PlainTextResponse("ok")(scope, receive, send)
+
+        self.entraram += 1
+        await self.liberar.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+
+@pytest.mark.anyio
+async def test_sobrecarga_descarta_baixa_prioridade_antes_das_leituras_do_totem():
+    interno = AppBloqueado()
+    limite = LimiteAdaptativo(inicial=4, minimo=1, maximo=8, latencia_alvo=10)
+    transport = httpx.ASGITransport(app=LimiteConcorrenciaMiddleware(interno, limite=limite))
+    respostas = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def enviar(nome, metodo, caminho):
+            respostas[nome] = await client.request(metodo, caminho)
+
+        async with anyio.create_task_group() as tg:
+            # fração baixa = 0.5: duas escritas administrativas ocupam o que cabe a elas
+            tg.start_soon(enviar, "escrita1", "PUT", "/produtos/1")
+            tg.start_soon(enviar, "escrita2", "PUT", "/produtos/2")
+
+            while interno.entraram < 2:
+                await anyio.sleep(0.01)
+
+            await enviar("escrita3", "DELETE", "/produtos/3")
+
+            tg.start_soon(enviar, "cardapio", "GET", "/produtos/")
+            tg.start_soon(enviar, "totem", "GET", "/clientes/cpf/12345678901")
+
+            while interno.entraram < 4:
+                await anyio.sleep(0.01)
+
+            await enviar("excedente", "GET", "/produtos/")
+            await enviar("health", "GET", "/health/pool")
+
+            interno.liberar.set()
+
+    assert respostas["escrita3"].status_code == 503
+    assert respostas["escrita3"].headers["retry-after"] == "1"
+    assert respostas["excedente"].status_code == 503
+    assert {nome: r.status_code for nome, r in respostas.items() if nome not in ("escrita3", "excedente")} == {
+        "escrita1": 200, "escrita2": 200, "cardapio": 200, "totem": 200, "health": 200
+    }
+    assert limite.em_andamento == 0
+
+
+@pytest.mark.anyio
+async def test_export_lento_nao_reduz_o_limite_das_leituras_criticas():
+    async def lento(scope, receive, send):
+        await anyio.sleep(0.05)
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    limite = LimiteAdaptativo(inicial=4, minimo=1, maximo=8, latencia_alvo=0.01, fator_reducao=0.5)
+    transport = httpx.ASGITransport(app=LimiteConcorrenciaMiddleware(lento, limite=limite))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/produtos/export")).status_code == 200
+        assert limite.limite == 4
+        assert limite.em_andamento == 0
+
+        assert (await client.get("/produtos/")).status_code == 200
+
+    assert limite.limite == 2
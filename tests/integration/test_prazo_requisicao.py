@@ -0,0 +1,157 @@
+import time
+
+import anyio
+import httpx
+import pytest
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from app.infrastructure import config
+from app.infrastructure.api.prazo import PrazoMiddleware
+from app.infrastructure.db.statement_timeout import restante
+from app.infrastructure.metrics import metrics
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def prazos_curtos(monkeypatch):
+    monkeypatch.setattr(config, "PRAZO_PADRAO", 0.2)
+    monkeypatch.setattr(config, "PRAZO_LEITURA_TOTEM", 0.1)
+    metrics.reset()
+
+
+async def app_lento(scope, receive, send):
+    await anyio.sleep(5)
+    await PlainTextResponse("tarde demais")(scope, receive, send)
+
+
+def cliente(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=PrazoMiddleware(app)), base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_request_que_passa_do_prazo_e_cancelada_com_504():
+    async with cliente(app_lento) as client:
+        with anyio.fail_after(2):
+            resposta = await client.get("/clientes/cpf/12345678901")
+
+    assert resposta.status_code == 504
+    assert metrics.get("prazo.esgotados", rota="GET /clientes/cpf/12345678901") == 1
+
+
+@pytest.mark.anyio
+async def test_erro_depois_do_prazo_vira_504():
+    # o statement_timeout cancela a query e a rota responde com o erro genérico dela
+    async def app_cancelado_pelo_banco(scope, receive, send):
+        while restante() > 0:
+            await anyio.sleep(0.01)
+
+        await JSONResponse({"detail": "canceling statement due to statement timeout"}, status_code=400)(scope, receive, send)
+
+    async with cliente(app_cancelado_pelo_banco) as client:
+        resposta = await client.get("/clientes/cpf/12345678901")
+
+    assert resposta.status_code == 504
+    assert resposta.json() == {"detail": "Tempo limite da requisição esgotado"}
+
+
+@pytest.mark.anyio
+async def test_request_dentro_do_prazo_ve_o_restante_e_passa_intacta():
+    vistos = []
+
+    async def app_rapido(scope, receive, send):
+        vistos.append(restante())
+        await JSONResponse({"detail": "nao encontrado"}, status_code=404)(scope, receive, send)
+
+    async with cliente(app_rapido) as client:
+        resposta = await client.get("/produtos/1")
+
+    assert resposta.status_code == 404
+    assert 0 < vistos[0] <= 0.2
+    assert restante() is None
+    assert metrics.snapshot()["counters"] == {}
+
+
+@pytest.mark.anyio
+async def test_health_nao_tem_prazo():
+    async def app_health(scope, receive, send):
+        await anyio.sleep(0.3)
+        await PlainTextResponse(str(restante()))(scope, receive, send)
+
+    async with cliente(app_health) as client:
+        resposta = await client.get("/health/pool")
+
+    assert resposta.status_code == 200
+    assert resposta.text == "None"
+
+
+@pytest.mark.anyio
+async def test_metrica_usa_o_template_da_rota():
+    async def app_roteado(scope, receive, send):
+        scope["route"] = type("Rota", (), {"path": "/produtos/{id}"})()
+        await app_lento(scope, receive, send)
+
+    async with cliente(app_roteado) as client:
+        await client.get("/produtos/1")
+        await client.get("/produtos/2")
+
+    assert metrics.get("prazo.esgotados", rota="GET /produtos/{id}") == 2
+
+
+@pytest.mark.anyio
+async def test_rota_sincrona_para_no_proximo_statement_e_so_entao_libera_a_session():
+    from fastapi import Depends, FastAPI, HTTPException
+    from sqlalchemy import create_engine, event, text
+    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.infrastructure.db.statement_timeout import conferir_prazo, registrar_sessao
+
+    eventos = []
+
+    class SessionObservada(Session):
+        def close(self):
+            eventos.append("session fechada")
+            super().close()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    event.listen(engine, "before_cursor_execute", conferir_prazo)
+    session_local = sessionmaker(bind=engine, class_=SessionObservada)
+
+    # como o get_db da aplicação
+    def get_db():
+        db = registrar_sessao(session_local())
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/clientes/cpf/{cpf}")
+    def rota_sincrona(cpf: str, db=Depends(get_db)):
+        try:
+            for _ in range(40):
+                db.execute(text("SELECT 1"))
+                eventos.append("statement")
+                time.sleep(0.05)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        finally:
+            eventos.append("rota terminou")
+
+    async with cliente(app) as client:
+        with anyio.fail_after(2):
+            resposta = await client.get("/clientes/cpf/12345678901")
+
+    assert resposta.status_code == 504
+    # prazo de 0.1s: a thread parou no primeiro statement depois dele, não nos 40
+    assert eventos.count("statement") < 10
+    # a session é fechada (mesmo com o finally do get_db pulado pelo cancelamento) e só depois da rota
+    assert "session fechada" in eventos
+    assert eventos.index("rota terminou") < eventos.index("session fechada")
+
+    engine.dispose()
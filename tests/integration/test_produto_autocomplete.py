@@ -0,0 +1,91 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(CategoriaProduto(id=1, nome="Lanche"))
+        db.add_all([
+            Produto(nome=nome, descricao="desc", preco=Decimal("10.00"), categoria=1)
+            for nome in ("X-Burger", "X-Salada", "Pão de Queijo", "Açaí")
+        ])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with session_local() as db:
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def sugestoes(client, prefixo, **params):
+    r = client.get("/produtos/autocomplete", params={"prefix": prefixo, **params})
+
+    assert r.status_code == 200
+
+    return [sugestao["nome"] for sugestao in r.json()["data"]]
+
+
+def test_autocomplete_nao_consulta_o_banco_por_tecla(client, engine):
+    # a primeira chamada carrega o índice (no servidor isso acontece no startup)
+    assert sugestoes(client, "x") == ["X-Burger", "X-Salada"]
+
+    with contar_queries(engine) as queries:
+        assert sugestoes(client, "x-") == ["X-Burger", "X-Salada"]
+        assert sugestoes(client, "x-s") == ["X-Salada"]
+        assert sugestoes(client, "acai") == ["Açaí"]
+
+    assert queries.count == 0, queries.statements
+
+
+def test_escritas_do_dao_atualizam_o_indice(client, engine):
+    sugestoes(client, "x")
+
+    r = client.post("/produtos/", json={"nome": "X-Tudo", "descricao": "desc", "preco": 20, "categoria": 1})
+    assert r.status_code == 201
+    novo_id = r.json()["data"]["id"]
+
+    assert client.put(f"/produtos/{novo_id}", json={"nome": "X-Tudo Duplo", "descricao": "desc", "preco": 25, "categoria": "1"}).status_code == 200
+    assert client.delete("/produtos/2").status_code in (200, 204)
+
+    with contar_queries(engine) as queries:
+        assert sugestoes(client, "x") == ["X-Burger", "X-Tudo Duplo"]
+
+    assert queries.count == 0, queries.statements
+
+
+def test_limite_e_prefixo_obrigatorio(client):
+    assert len(sugestoes(client, "x", limit=1)) == 1
+    assert client.get("/produtos/autocomplete").status_code == 422
@@ -0,0 +1,108 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=3, nome="Bebida")])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def total_produtos(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(Produto)).scalar()
+
+
+def produto(i, categoria=1, preco="10.50"):
+
+    return {"nome": f"Produto {i}", "descricao": "desc", "preco": preco, "categoria": categoria}
+
+
+def test_criar_lote_em_um_unico_insert(client, engine):
+    itens = [produto(i, categoria=1 + 2 * (i % 2)) for i in range(200)]
+
+    with contar_queries(engine) as queries:
+        r = client.post("/produtos/batch", json=itens)
+
+    assert r.status_code == 201
+    body = r.json()
+    assert body["errors"] == []
+    assert [p["nome"] for p in body["data"]] == [item["nome"] for item in itens]
+    assert body["data"][1]["categoria"] == {"id": 3, "nome": "Bebida"}
+    assert body["data"][0]["preco"] == "10.50"
+    assert total_produtos(engine) == 200
+
+    inserts = [s for s in queries.statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+    assert queries.count == 2, queries.statements
+
+
+def test_lote_com_item_invalido_nao_grava_nada(client, engine):
+    itens = [produto(0), produto(1, preco="-1"), produto(2, categoria=99)]
+
+    r = client.post("/produtos/batch", json=itens)
+
+    assert r.status_code == 422
+    erros = r.json()["detail"]["errors"]
+    assert [erro["index"] for erro in erros] == [1, 2]
+    assert erros[0]["message"].startswith("preco:")
+    assert "Categoria 99" in erros[1]["message"]
+    assert total_produtos(engine) == 0
+
+
+def test_lote_parcial_grava_itens_validos(client, engine):
+    itens = [produto(0), {"nome": "X"}, produto(2)]
+
+    r = client.post("/produtos/batch", params={"partial": "true"}, json=itens)
+
+    assert r.status_code == 207
+    body = r.json()
+    assert [p["nome"] for p in body["data"]] == ["Produto 0", "Produto 2"]
+    assert [erro["index"] for erro in body["errors"]] == [1]
+    assert total_produtos(engine) == 2
+
+
+def test_lote_vazio_e_rejeitado(client, engine):
+    r = client.post("/produtos/batch", json=[])
+
+    assert r.status_code == 400
+
+
+def test_lote_invalida_cache_do_catalogo(client, engine):
+    assert client.get("/produtos/").json()["data"] == []
+
+    client.post("/produtos/batch", json=[produto(0)])
+
+    assert len(client.get("/produtos/").json()["data"]) == 1
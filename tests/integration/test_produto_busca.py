@@ -0,0 +1,134 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure import config
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
+from tests.query_counter import contar_queries
+
+PRODUTOS = [
+    ("X-Burger", "Hambúrguer com queijo e pão brioche", 1),
+    ("Pão de Queijo", "Porção com 10 unidades", 1),
+    ("Suco de Laranja", "Natural, 500ml", 2),
+    ("Refrigerante", "Lata 350ml", 2),
+    ("X-Salada", "Hambúrguer com alface e tomate", 1),
+]
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=2, nome="Bebida")])
+        db.add_all([
+            Produto(nome=nome, descricao=descricao, preco=Decimal("10.00"), categoria=categoria)
+            for nome, descricao, categoria in PRODUTOS
+        ])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with session_local() as db:
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def nomes(resposta):
+    return [produto["nome"] for produto in resposta.json()["data"]]
+
+
+def test_busca_ordena_nome_antes_de_descricao(client):
+    r = client.get("/produtos/search", params={"q": "queijo"})
+
+    assert r.status_code == 200
+    assert nomes(r) == ["Pão de Queijo", "X-Burger"]
+    assert r.json()["data"][0]["categoria"] == {"id": 1, "nome": "Lanche"}
+
+
+def test_busca_ignora_acentos_e_maiusculas(client):
+    assert nomes(client.get("/produtos/search", params={"q": "PAO"})) == ["Pão de Queijo", "X-Burger"]
+    assert nomes(client.get("/produtos/search", params={"q": "hamburguer"})) == ["X-Burger", "X-Salada"]
+
+
+def test_busca_tolera_erro_de_digitacao_e_prefixo(client):
+    assert nomes(client.get("/produtos/search", params={"q": "refrigerant"})) == ["Refrigerante"]
+    assert nomes(client.get("/produtos/search", params={"q": "laranaj"})) == ["Suco de Laranja"]
+
+
+def test_busca_sem_resultado(client):
+    r = client.get("/produtos/search", params={"q": "pizza"})
+
+    assert r.status_code == 200
+    assert r.json()["data"] == []
+    assert r.json()["next_cursor"] is None
+
+
+def test_busca_paginada(client):
+    primeira = client.get("/produtos/search", params={"q": "x", "limit": 1})
+    segunda = client.get("/produtos/search", params={"q": "x", "limit": 1, "cursor": primeira.json()["next_cursor"]})
+
+    assert len(primeira.json()["data"]) == 1
+    assert primeira.json()["next_cursor"]
+    assert nomes(primeira) + nomes(segunda) == ["X-Burger", "X-Salada"]
+    assert segunda.json()["next_cursor"] is None
+
+
+def test_busca_limita_o_total_de_resultados(client, monkeypatch):
+    monkeypatch.setattr(config, "BUSCA_RESULTADOS_MAXIMO", 1)
+
+    r = client.get("/produtos/search", params={"q": "hamburguer"})
+
+    assert nomes(r) == ["X-Burger"]
+    assert r.json()["next_cursor"] is None
+
+
+def test_busca_exige_termo(client):
+    assert client.get("/produtos/search").status_code == 422
+    assert client.get("/produtos/search", params={"q": ""}).status_code == 422
+
+
+def test_cursor_invalido(client):
+    r = client.get("/produtos/search", params={"q": "queijo", "cursor": "???"})
+
+    assert r.status_code == 400
+
+
+def test_indice_carregado_uma_vez_e_recarregado_apos_escrita(client, engine):
+    client.get("/produtos/search", params={"q": "queijo"})
+
+    with contar_queries(engine) as queries:
+        client.get("/produtos/search", params={"q": "queijo"})
+
+    # só a busca dos produtos encontrados pelo id
+    assert queries.count == 1, queries.statements
+
+    r = client.put("/produtos/4", json={"nome": "Refrigerante de Guaraná", "descricao": "Lata 350ml", "preco": 6.5, "categoria": "2"})
+    assert r.status_code == 200
+
+    assert nomes(client.get("/produtos/search", params={"q": "guarana"})) == ["Refrigerante de Guaraná"]
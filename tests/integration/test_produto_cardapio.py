@@ -0,0 +1,125 @@
+import gzip
+import json
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
+from tests.query_counter import contar_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=2, nome="Bebida")])
+        db.add_all([
+            Produto(nome="X-Burger", descricao="desc", preco=Decimal("20.00"), categoria=1),
+            Produto(nome="Refrigerante", descricao="desc", preco=Decimal("6.50"), categoria=2),
+            Produto(nome="X-Salada", descricao="desc", preco=Decimal("22.00"), categoria=1),
+        ])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with session_local() as db:
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def cardapio(client, accept_encoding="identity", **headers):
+
+    return client.get("/produtos/menu", headers={"Accept-Encoding": accept_encoding, **headers})
+
+
+def test_cardapio_agrupado_por_categoria(client):
+    r = cardapio(client)
+
+    assert r.status_code == 200
+    assert "content-encoding" not in r.headers
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert [grupo["categoria"] for grupo in r.json()["data"]] == [{"id": 1, "nome": "Lanche"}, {"id": 2, "nome": "Bebida"}]
+    assert [produto["nome"] for produto in r.json()["data"][0]["produtos"]] == ["X-Burger", "X-Salada"]
+    assert r.json()["data"][1]["produtos"][0]["preco"] == "6.50"
+
+
+def test_cardapio_gzip_tem_o_mesmo_conteudo(client):
+    identidade = cardapio(client)
+    comprimido = client.stream("GET", "/produtos/menu", headers={"Accept-Encoding": "gzip"})
+
+    with comprimido as r:
+        corpo = r.read()
+        # o cliente descomprime em r.content; o corpo cru é o gzip pré-renderizado
+        assert r.headers["content-encoding"] == "gzip"
+        assert r.headers["etag"] == identidade.headers["etag"]
+
+    assert json.loads(corpo) == identidade.json()
+
+
+def test_cardapio_repetido_nao_consulta_o_banco(client, engine):
+    cardapio(client)
+
+    with contar_queries(engine) as queries:
+        assert cardapio(client, "gzip").status_code == 200
+        assert cardapio(client).status_code == 200
+
+    assert queries.count == 0, queries.statements
+
+
+def test_cardapio_304_com_o_mesmo_etag(client):
+    etag = cardapio(client).headers["etag"]
+
+    r = cardapio(client, **{"If-None-Match": etag})
+
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+
+
+def test_cardapio_reconstruido_apos_escrita(client):
+    antes = cardapio(client)
+
+    r = client.post("/produtos/", json={"nome": "Suco", "descricao": "desc", "preco": 8.0, "categoria": 2})
+    assert r.status_code == 201
+
+    depois = cardapio(client)
+
+    assert depois.headers["etag"] != antes.headers["etag"]
+    assert [produto["nome"] for produto in depois.json()["data"][1]["produtos"]] == ["Refrigerante", "Suco"]
+
+    assert client.delete("/produtos/3").status_code == 204
+    assert [produto["nome"] for produto in cardapio(client).json()["data"][0]["produtos"]] == ["X-Burger"]
+
+
+def test_variante_gzip_descomprime_para_o_json(client):
+    from app.infrastructure.cache.cardapio import cardapio_cache
+
+    r = cardapio(client)
+    snapshot = cardapio_cache.atual
+
+    assert gzip.decompress(snapshot.variantes["gzip"]) == r.content
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from decimal import Decimal
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.produto import get_produto_gateway
+from app.infrastructure.cache.catalogo_versao import catalogo_versao
+
+
+class ContadorProdutoGateway:
+    def __init__(self):
+        self.chamadas = 0
+        categoria = SimpleNamespace(id=1, nome="Lanches")
+        self.obj = SimpleNamespace(id=1, nome="X-Burger", descricao="Delicioso", preco=Decimal("12.50"), categoria=1, categoria_rel=categoria)
+
+    def listar_todos(self, limite=None, apos_id=None):
+        self.chamadas += 1
+        return [self.obj]
+
+    def listar_por_categoria(self, categoria):
+        self.chamadas += 1
+        return [self.obj]
+
+    def buscar_por_id(self, id: int):
+        self.chamadas += 1
+        return self.obj
+
+
+gateway = ContadorProdutoGateway()
+
+
+def setup_module(module):
+    app.dependency_overrides[get_produto_gateway] = lambda: gateway
+
+
+def teardown_module(module):
+    app.dependency_overrides.clear()
+
+
+client = TestClient(app)
+
+
+def test_responde_304_sem_consultar_o_gateway():
+    for url in ("/produtos/", "/produtos/categoria/1", "/produtos/1"):
+        gateway.chamadas = 0
+
+        r = client.get(url)
+        etag = r.headers["etag"]
+
+        assert r.status_code == 200
+        assert gateway.chamadas == 1
+
+        r2 = client.get(url, headers={"If-None-Match": etag})
+
+        assert r2.status_code == 304
+        assert r2.headers["etag"] == etag
+        assert r2.content == b""
+        assert gateway.chamadas == 1
+
+
+def test_escrita_no_catalogo_muda_o_etag():
+    etag = client.get("/produtos/").headers["etag"]
+
+    catalogo_versao.incrementar()
+
+    r = client.get("/produtos/", headers={"If-None-Match": etag})
+
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+
+
+def test_if_none_match_com_lista_e_etag_fraco():
+    etag = client.get("/produtos/").headers["etag"]
+
+    r = client.get("/produtos/", headers={"If-None-Match": f'"outro", W/{etag}'})
+
+    assert r.status_code == 304
@@ -0,0 +1,173 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure.db.database import Base, get_db
+from app.models import Produto, CategoriaProduto
+from app.dao.categoria_produto_dao import CategoriaProdutoDAO
+from app.infrastructure.cache.categorias import registro_categorias
+from tests.query_counter import contar_queries
+
+TOTAL_PRODUTOS = 300
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=2, nome="Bebida")])
+        db.add_all([
+            Produto(nome=f"Produto {i}", descricao="desc", preco=Decimal("10.00"), categoria=1 + i % 2)
+            for i in range(TOTAL_PRODUTOS)
+        ])
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # como no startup: as categorias já estão em memória antes da primeira request
+    with session_local() as db:
+        registro_categorias.substituir(CategoriaProdutoDAO(db).listar_todas())
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_listar_produtos_em_uma_unica_query(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.get("/produtos/", params={"limit": 500})
+
+    assert r.status_code == 200
+    assert len(r.json()["data"]) == TOTAL_PRODUTOS
+    assert queries.count == 1, queries.statements
+
+
+def test_listar_por_categoria_em_uma_unica_query(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.get("/produtos/categoria/2")
+
+    assert r.status_code == 200
+    assert {p["categoria"]["nome"] for p in r.json()["data"]} == {"Bebida"}
+    assert queries.count == 1, queries.statements
+
+
+def test_buscar_produto_em_uma_unica_query(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.get("/produtos/1")
+
+    assert r.status_code == 200
+    assert r.json()["data"]["categoria"]["id"] in (1, 2)
+    assert queries.count == 1, queries.statements
+
+
+def test_segunda_listagem_e_servida_pelo_cache(client, engine):
+    client.get("/produtos/", params={"limit": 500})
+
+    with contar_queries(engine) as queries:
+        r = client.get("/produtos/", params={"limit": 500})
+
+    assert r.status_code == 200
+    assert len(r.json()["data"]) == TOTAL_PRODUTOS
+    assert queries.count == 0, queries.statements
+
+
+def test_paginacao_por_cursor_usa_keyset(client, engine):
+    ids = []
+    cursor = None
+
+    with contar_queries(engine) as queries:
+        while True:
+            params = {"limit": 120, **({"cursor": cursor} if cursor else {})}
+            body = client.get("/produtos/", params=params).json()
+            ids += [p["id"] for p in body["data"]]
+            cursor = body["next_cursor"]
+
+            if not cursor:
+                break
+
+    assert ids == sorted(ids)
+    assert len(ids) == len(set(ids)) == TOTAL_PRODUTOS
+    assert queries.count == 3
+    # páginas seguintes partem do último id (range scan na PK), não de um OFFSET crescente
+    assert all("produto.id > ?" in sql for sql in queries.statements[1:])
+
+
+def test_categoria_inexistente_e_recusada_sem_insert(client, engine):
+    with contar_queries(engine) as queries:
+        r = client.post("/produtos/", json={"nome": "Produto X", "descricao": "desc", "preco": "5.00", "categoria": 99})
+
+    assert r.status_code == 400
+    assert "Categoria 99 não encontrada" in r.json()["detail"]
+    assert queries.count == 0, queries.statements
+
+
+def test_atualizar_produto_em_uma_unica_query(client, engine):
+    payload = {"nome": "Produto atualizado", "descricao": "nova", "preco": "12.50", "categoria": "2"}
+
+    with contar_queries(engine) as queries:
+        r = client.put(f"/produtos/{TOTAL_PRODUTOS}", json=payload)
+
+    assert r.status_code == 200
+    assert r.json()["data"]["nome"] == "Produto atualizado"
+    assert r.json()["data"]["preco"] == "12.50"
+    assert r.json()["data"]["categoria"] == {"id": 2, "nome": "Bebida"}
+    assert queries.count == 1, queries.statements
+    assert queries.statements[0].lstrip().upper().startswith("UPDATE")
+
+
+def test_atualizar_produto_inexistente_retorna_404(client, engine):
+    payload = {"nome": "Produto X", "descricao": "desc", "preco": "5.00", "categoria": "1"}
+
+    with contar_queries(engine) as queries:
+        r = client.put("/produtos/99999", json=payload)
+
+    assert r.status_code == 404
+    assert queries.count == 1, queries.statements
+
+
+def test_criar_produto_em_uma_unica_query(client, engine):
+    payload = {"nome": "Produto novo", "descricao": "desc", "preco": "7.00", "categoria": 1}
+
+    with contar_queries(engine) as queries:
+        r = client.post("/produtos/", json=payload)
+
+    assert r.status_code == 201
+    assert r.json()["data"]["categoria"] == {"id": 1, "nome": "Lanche"}
+    assert queries.count == 1, queries.statements
+    assert queries.statements[0].lstrip().upper().startswith("INSERT")
+
+
+def test_deletar_produto_em_uma_unica_query(client, engine):
+    id = client.post("/produtos/", json={"nome": "Produto descartável", "descricao": "desc", "preco": "7.00", "categoria": 1}).json()["data"]["id"]
+
+    with contar_queries(engine) as queries:
+        r = client.delete(f"/produtos/{id}")
+
+    assert r.status_code == 204
+    assert queries.count == 1, queries.statements
+
+    with contar_queries(engine) as queries:
+        r = client.delete(f"/produtos/{id}")
+
+    assert r.status_code == 404
+    assert queries.count == 1, queries.statements
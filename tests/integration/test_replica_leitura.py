@@ -0,0 +1,142 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure import config
+from app.infrastructure.db import database
+from app.infrastructure.db.database import Base, get_db
+from app.infrastructure.db.replica import COOKIE_LEITURA_PRIMARIO, estado_replica
+from app.infrastructure.metrics import metrics
+from app.models import Cliente
+
+
+def criar_banco(nome_cliente, tabelas=True):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+    if tabelas:
+        Base.metadata.create_all(engine)
+
+        with sessionmaker(bind=engine)() as db:
+            db.add(Cliente(nome=nome_cliente, email="cliente@example.com", telefone=None, cpf="12345678901"))
+            db.commit()
+
+    return engine
+
+
+@pytest.fixture
+def primario():
+    engine = criar_banco("Cliente")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica():
+    # a "réplica" ainda não recebeu o novo nome: dá para ver de onde cada leitura veio
+    engine = criar_banco("Cliente (replica)")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(primario, replica, monkeypatch):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=primario)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(config, "DATABASE_REPLICA_URL", "sqlite://")
+    monkeypatch.setattr(database, "ReplicaSessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=replica))
+    estado_replica.limpar()
+    metrics.reset()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    estado_replica.limpar()
+
+
+def test_leitura_vai_para_a_replica(client):
+    r = client.get("/clientes/1")
+
+    assert r.status_code == 200
+    assert r.json()["data"]["nome"] == "Cliente (replica)"
+    assert metrics.get("db.replica.leituras", destino="replica") == 1
+
+
+def test_escrita_vai_para_o_primario_e_o_cliente_le_o_que_escreveu(client):
+    r = client.patch("/clientes/1", json={"nome": "Cliente Renomeado"})
+
+    assert r.status_code == 200
+    assert COOKIE_LEITURA_PRIMARIO in r.cookies
+
+    assert client.get("/clientes/1").json()["data"]["nome"] == "Cliente Renomeado"
+
+    client.cookies.clear()
+
+    assert client.get("/clientes/1").json()["data"]["nome"] == "Cliente (replica)"
+
+
+def test_escrita_de_um_cliente_nao_manda_os_outros_ao_primario(client):
+    assert client.patch("/clientes/1", json={"nome": "Cliente Renomeado"}).status_code == 200
+
+    outro = TestClient(app)
+
+    assert outro.get("/clientes/1").json()["data"]["nome"] == "Cliente (replica)"
+    assert metrics.get("db.replica.leituras", destino="replica") == 1
+
+
+def test_cpf_lido_da_replica_apos_escrita_nao_fica_no_cache(client):
+    assert client.patch("/clientes/1", json={"nome": "Cliente Renomeado"}).status_code == 200
+
+    outro = TestClient(app)
+
+    assert outro.get("/clientes/cpf/12345678901").json()["data"]["nome"] == "Cliente (replica)"
+    assert client.get("/clientes/cpf/12345678901").json()["data"]["nome"] == "Cliente Renomeado"
+
+
+def test_escrita_com_erro_nao_marca_o_cliente(client):
+    r = client.patch("/clientes/99", json={"nome": "Ninguem"})
+
+    assert r.status_code == 404
+    assert COOKIE_LEITURA_PRIMARIO not in r.cookies
+
+
+def test_escritas_nao_abrem_sessao_na_replica(client, replica, monkeypatch):
+    abertas = []
+    session_replica = sessionmaker(autocommit=False, autoflush=False, bind=replica)
+
+    def abrir():
+        abertas.append(True)
+
+        return session_replica()
+
+    monkeypatch.setattr(database, "ReplicaSessionLocal", abrir)
+
+    r = client.put("/clientes/1", json={"nome": "Cliente Atualizado", "email": "cliente@example.com", "cpf": "12345678901"})
+
+    assert r.status_code == 200
+    assert r.json()["data"]["nome"] == "Cliente Atualizado"
+    assert abertas == []
+    assert metrics.get("db.replica.leituras", destino="replica") == 0
+
+
+def test_replica_fora_do_ar_cai_para_o_primario(client, monkeypatch):
+    quebrada = criar_banco(None, tabelas=False)
+    monkeypatch.setattr(database, "ReplicaSessionLocal", sessionmaker(bind=quebrada))
+
+    r = client.get("/clientes/1")
+
+    assert r.status_code == 200
+    assert r.json()["data"]["nome"] == "Cliente"
+    assert metrics.get("db.replica.falhas") == 1
+
+    # em pausa: nem tenta a réplica até REPLICA_PAUSA_FALHA
+    assert client.get("/clientes/1").json()["data"]["nome"] == "Cliente"
+    assert metrics.get("db.replica.falhas") == 1
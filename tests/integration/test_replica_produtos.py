@@ -0,0 +1,137 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure import config
+from app.infrastructure.db import database
+from app.infrastructure.db.database import Base, get_db
+from app.infrastructure.db.replica import estado_replica
+from app.infrastructure.metrics import metrics
+from app.models import Produto, CategoriaProduto
+
+
+def criar_banco(nome_produto):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add(CategoriaProduto(id=1, nome="Lanche"))
+        db.add(Produto(nome=nome_produto, descricao="desc", preco=Decimal("20.00"), categoria=1))
+        db.commit()
+
+    return engine
+
+
+@pytest.fixture
+def primario():
+    engine = criar_banco("X-Burger")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica():
+    # a réplica nunca recebe as escritas dos testes: simula um atraso maior que a janela
+    engine = criar_banco("X-Burger (replica)")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(primario, replica, monkeypatch):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=primario)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(config, "DATABASE_REPLICA_URL", "sqlite://")
+    monkeypatch.setattr(database, "ReplicaSessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=replica))
+    estado_replica.limpar()
+    metrics.reset()
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    estado_replica.limpar()
+
+
+def criar_produto(client, nome):
+    r = client.post("/produtos/", json={"nome": nome, "descricao": "desc", "preco": "22.00", "categoria": 1})
+
+    assert r.status_code == 201
+
+
+def nomes_do_cardapio(client):
+
+    return [produto["nome"] for grupo in client.get("/produtos/menu").json()["data"] for produto in grupo["produtos"]]
+
+
+@pytest.mark.parametrize("com_cookie", [True, False])
+def test_cardapio_reconstruido_apos_escrita_vem_do_primario(client, com_cookie):
+    assert nomes_do_cardapio(client) == ["X-Burger"]
+
+    criar_produto(client, "X-Salada")
+
+    if not com_cookie:
+        client.cookies.clear()
+
+    assert nomes_do_cardapio(client) == ["X-Burger", "X-Salada"]
+    assert metrics.get("db.replica.leituras", destino="replica") == 0
+
+
+def nomes(resposta):
+
+    return [produto["nome"] for produto in resposta.json()["data"]]
+
+
+@pytest.mark.parametrize("com_cookie", [True, False])
+def test_etag_apos_escrita_so_acompanha_leitura_do_primario(client, com_cookie):
+    criar_produto(client, "X-Salada")
+
+    if not com_cookie:
+        client.cookies.clear()
+
+    for url in ("/produtos/", "/produtos/categoria/1", "/produtos/1", "/produtos/search?q=burger"):
+        r = client.get(url)
+
+        assert r.status_code == 200
+
+        if com_cookie:
+            assert client.get(url, headers={"If-None-Match": r.headers["etag"]}).status_code == 304
+        else:
+            # corpo possivelmente anterior à escrita: um ETag da versão nova o validaria depois
+            assert "etag" not in r.headers
+
+    if com_cookie:
+        assert nomes(client.get("/produtos/")) == ["X-Burger", "X-Salada"]
+    else:
+        assert nomes(client.get("/produtos/")) == ["X-Burger (replica)"]
+
+
+def test_leitura_da_replica_apos_escrita_nao_fica_no_cache(client):
+    criar_produto(client, "X-Salada")
+    outro = TestClient(app)
+
+    assert nomes(outro.get("/produtos/")) == ["X-Burger (replica)"]
+    assert outro.get("/produtos/2").status_code != 200
+
+    assert nomes(client.get("/produtos/")) == ["X-Burger", "X-Salada"]
+    assert client.get("/produtos/2").json()["data"]["nome"] == "X-Salada"
+
+
+def test_fora_da_janela_a_replica_usa_cache_e_etag(client, monkeypatch):
+    monkeypatch.setattr(config, "REPLICA_JANELA_LEITURA_PROPRIA", 0)
+
+    r = client.get("/produtos/")
+
+    assert nomes(r) == ["X-Burger (replica)"]
+    assert client.get("/produtos/", headers={"If-None-Match": r.headers["etag"]}).status_code == 304
+    assert nomes(client.get("/produtos/")) == ["X-Burger (replica)"]
+    assert metrics.get("db.replica.leituras", destino="replica") == 1
@@ -0,0 +1,81 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.infrastructure import config
+from app.infrastructure.db.database import Base, get_db
+from app.models import Cliente, Produto, CategoriaProduto
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([CategoriaProduto(id=1, nome="Lanche"), CategoriaProduto(id=2, nome="Bebida")])
+        db.add_all([
+            Produto(nome=f"Produto {i}", descricao="Pão e café" if i == 0 else "desc", preco=Decimal("7.5"), categoria=1 + i % 2)
+            for i in range(20)
+        ])
+        db.add(Cliente(nome="Ana", email="ana@example.com", telefone=None, cpf="12345678901"))
+        db.commit()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_local()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def respostas(client, monkeypatch, metodo, url, **kwargs):
+    resultado = {}
+
+    for modo in ("validated", "fast"):
+        monkeypatch.setattr(config, "RESPONSE_MODE", modo)
+        resultado[modo] = client.request(metodo, url, **kwargs)
+
+    return resultado["validated"], resultado["fast"]
+
+
+@pytest.mark.parametrize("url", ["/produtos/?limit=5", "/produtos/categoria/2", "/produtos/1", "/clientes/", "/clientes/cpf/12345678901"])
+def test_modo_fast_devolve_o_mesmo_json(client, monkeypatch, url):
+    validado, rapido = respostas(client, monkeypatch, "GET", url)
+
+    assert rapido.status_code == validado.status_code == 200
+    assert rapido.headers["content-type"] == "application/json"
+    assert rapido.json() == validado.json()
+
+
+def test_modo_fast_preserva_etag(client, monkeypatch):
+    validado, rapido = respostas(client, monkeypatch, "GET", "/produtos/1")
+
+    assert rapido.headers["ETag"] == validado.headers["ETag"]
+
+
+def test_modo_fast_preserva_status_de_criacao(client, monkeypatch):
+    monkeypatch.setattr(config, "RESPONSE_MODE", "fast")
+
+    r = client.post("/produtos/", json={"nome": "Suco", "descricao": "Laranja", "preco": "6.00", "categoria": 2})
+
+    assert r.status_code == 201
+    assert r.json()["data"]["categoria"] == {"id": 2, "nome": "Bebida"}
+    assert r.json()["data"]["preco"] == "6.00"
@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def contar_queries(engine):
+    # conta os statements SQL enviados ao banco dentro do bloco (ex.: durante uma request)
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
@@ -0,0 +1,73 @@
+import pytest
+
+from app.infrastructure.cache.idempotencia import ArmazemIdempotenciaMemoria, Registro
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def armazem(clock):
+    return ArmazemIdempotenciaMemoria(maxsize=2, ttl=10, clock=clock)
+
+
+@pytest.mark.anyio
+async def test_reservar_so_uma_vez(armazem):
+    assert await armazem.reservar("a", "hash") is None
+
+    registro = await armazem.reservar("a", "hash")
+
+    assert registro.impressao == "hash"
+    assert not registro.concluido
+
+
+@pytest.mark.anyio
+async def test_concluir_guarda_a_resposta(armazem):
+    await armazem.reservar("a", "hash")
+    await armazem.concluir("a", Registro("hash", 201, [(b"content-type", b"application/json")], b"{}"))
+
+    registro = await armazem.reservar("a", "hash")
+
+    assert registro.concluido
+    assert (registro.status_code, registro.corpo) == (201, b"{}")
+
+
+@pytest.mark.anyio
+async def test_liberar_permite_nova_execucao(armazem):
+    await armazem.reservar("a", "hash")
+    await armazem.liberar("a")
+
+    assert await armazem.reservar("a", "hash") is None
+
+
+@pytest.mark.anyio
+async def test_expira_apos_ttl(armazem, clock):
+    await armazem.reservar("a", "hash")
+    clock.agora = 10
+
+    assert await armazem.obter("a") is None
+    assert await armazem.reservar("a", "hash") is None
+
+
+@pytest.mark.anyio
+async def test_limite_remove_a_chave_mais_antiga(armazem):
+    for chave in ("a", "b", "c"):
+        await armazem.reservar(chave, "hash")
+
+    assert await armazem.obter("a") is None
+    assert len(armazem) == 2
@@ -0,0 +1,70 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.use_cases.async_cliente_use_case import AsyncClienteUseCase
+from app.adapters.schemas.cliente import ClienteResponseSchema
+
+
+@pytest.fixture
+def mock_entity():
+
+    return AsyncMock()
+
+
+@pytest.fixture
+def use_case(mock_entity):
+
+    return AsyncClienteUseCase(entity=mock_entity)
+
+
+@pytest.fixture
+def cliente():
+
+    return SimpleNamespace(id=1, nome="João Silva", email="joao@example.com", telefone="11999999999", cpf="12345678901")
+
+
+@pytest.mark.anyio
+async def test_buscar_cliente_por_cpf(use_case, mock_entity, cliente):
+    mock_entity.buscar_por_cpf.return_value = cliente
+
+    result = await use_case.buscar_cliente_por_cpf("12345678901")
+
+    mock_entity.buscar_por_cpf.assert_awaited_once_with(cpf_cliente="12345678901")
+    assert isinstance(result, ClienteResponseSchema)
+    assert result.cpf == "12345678901"
+
+
+@pytest.mark.anyio
+async def test_buscar_cliente_por_cpf_nao_encontrado(use_case, mock_entity):
+    mock_entity.buscar_por_cpf.return_value = None
+
+    with pytest.raises(ValueError, match="Cliente não encontrado"):
+        await use_case.buscar_cliente_por_cpf("00000000000")
+
+
+@pytest.mark.anyio
+async def test_listar_clientes(use_case, mock_entity, cliente):
+    mock_entity.listar_todos.return_value = [cliente, cliente]
+
+    result = await use_case.listar_clientes()
+
+    assert len(result) == 2
+    assert all(isinstance(item, ClienteResponseSchema) for item in result)
+
+
+@pytest.mark.anyio
+async def test_atualizar_cliente_nao_encontrado(use_case, mock_entity):
+    mock_entity.atualizar_cliente.return_value = None
+
+    with pytest.raises(ValueError, match="Cliente não encontrado"):
+        await use_case.atualizar_cliente(id=99, clienteRequest=SimpleNamespace())
+
+    mock_entity.buscar_por_id.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_deletar_cliente(use_case, mock_entity):
+    await use_case.deletar_cliente(id=1)
+
+    mock_entity.deletar_cliente.assert_awaited_once_with(id=1)
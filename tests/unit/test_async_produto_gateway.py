@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.gateways.async_produto_gateway import AsyncProdutoGateway
+from app.dao.async_produto_dao import AsyncProdutoDAO
+from app.models.produto import Produto
+from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    mock_dao = AsyncMock(spec=AsyncProdutoDAO)
+
+    monkeypatch.setattr(
+        "app.gateways.async_produto_gateway.AsyncProdutoDAO",
+        lambda session: mock_dao
+    )
+
+    return AsyncProdutoGateway(db_session=AsyncMock())
+
+
+@pytest.mark.anyio
+async def test_criar_produto(gateway):
+    produto = Produto(id=1, nome="Teste", preco=10.00)
+
+    gateway.dao.criar_produto.return_value = produto
+
+    result = await gateway.criar_produto(produto)
+
+    gateway.dao.criar_produto.assert_awaited_once_with(produto)
+    assert result == produto
+
+
+@pytest.mark.anyio
+async def test_listar_todos(gateway):
+    produtos = [
+        Produto(id=1, nome="A", preco=10.00),
+        Produto(id=2, nome="B", preco=20.00),
+    ]
+
+    gateway.dao.listar_todos.return_value = produtos
+
+    result = await gateway.listar_todos()
+
+    gateway.dao.listar_todos.assert_awaited_once()
+    assert result == produtos
+
+
+@pytest.mark.anyio
+async def test_listar_por_categoria(gateway):
+    categoria = CategoriaProdutoEnum.Lanche
+    produtos = [Produto(id=1, nome="X", preco=12)]
+
+    gateway.dao.listar_por_categoria.return_value = produtos
+
+    result = await gateway.listar_por_categoria(categoria)
+
+    gateway.dao.listar_por_categoria.assert_awaited_once_with(categoria)
+    assert result == produtos
+
+
+@pytest.mark.anyio
+async def test_buscar_por_id(gateway):
+    produto = Produto(id=1, nome="Teste", preco=15)
+
+    gateway.dao.buscar_por_id.return_value = produto
+
+    result = await gateway.buscar_por_id(1)
+
+    gateway.dao.buscar_por_id.assert_awaited_once_with(1)
+    assert result == produto
+
+
+@pytest.mark.anyio
+async def test_atualizar_produto(gateway):
+    produto_atualizado = Produto(id=1, nome="Novo", preco=30)
+
+    gateway.dao.atualizar_produto.return_value = produto_atualizado
+
+    result = await gateway.atualizar_produto(1, produto_atualizado)
+
+    gateway.dao.atualizar_produto.assert_awaited_once_with(1, produto_atualizado)
+    assert result == produto_atualizado
+
+
+@pytest.mark.anyio
+async def test_deletar_produto(gateway):
+    gateway.dao.deletar_produto.return_value = None
+
+    result = await gateway.deletar_produto(1)
+
+    gateway.dao.deletar_produto.assert_awaited_once_with(1)
+    assert result is None
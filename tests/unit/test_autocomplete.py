@@ -0,0 +1,85 @@
+import pytest
+from types import SimpleNamespace
+
+from app.infrastructure.cache.autocomplete import IndiceAutocomplete
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def indice(clock):
+    indice = IndiceAutocomplete(ttl=300, clock=clock)
+    indice.carregar([
+        (1, "X-Burger"),
+        (2, "X-Bacon Burger"),
+        (3, "Pão de Queijo"),
+        (4, "Batata Frita"),
+        (5, "Burger Vegano"),
+    ], indice.geracao)
+
+    return indice
+
+
+def test_prefixo_sem_acento_e_caixa(indice):
+    assert indice.sugerir("pao", 10) == [(3, "Pão de Queijo")]
+    assert indice.sugerir("QUEI", 10) == [(3, "Pão de Queijo")]
+
+
+def test_nome_que_comeca_com_o_prefixo_vem_primeiro(indice):
+    assert indice.sugerir("bur", 10) == [(5, "Burger Vegano"), (1, "X-Burger"), (2, "X-Bacon Burger")]
+
+
+def test_todas_as_palavras_digitadas_precisam_casar(indice):
+    assert indice.sugerir("x bu", 10) == [(1, "X-Burger"), (2, "X-Bacon Burger")]
+    assert indice.sugerir("x ba", 10) == [(2, "X-Bacon Burger")]
+    assert indice.sugerir("x pizza", 10) == []
+
+
+def test_limite(indice):
+    assert len(indice.sugerir("b", 2)) == 2
+    assert indice.sugerir("  ", 10) == []
+
+
+def test_escritas_atualizam_o_indice_sem_recarga(indice):
+    indice.registrar(6, "Milk Shake")
+    indice.registrar(3, "Pão de Batata")
+    indice.remover(4)
+
+    assert indice.sugerir("milk", 10) == [(6, "Milk Shake")]
+    assert indice.sugerir("queijo", 10) == []
+    assert indice.sugerir("batata", 10) == [(3, "Pão de Batata")]
+    assert not indice.precisa_carregar()
+
+
+def test_registrar_produtos_do_returning(indice):
+    indice.registrar_produtos([SimpleNamespace(id=7, nome="Suco"), SimpleNamespace(id=8, nome="Sundae")])
+
+    assert indice.sugerir("su", 10) == [(7, "Suco"), (8, "Sundae")]
+
+
+def test_recarga_pelo_ttl(indice, clock):
+    clock.agora += 300
+
+    assert indice.precisa_carregar()
+
+
+def test_escrita_durante_a_carga_forca_nova_carga(clock):
+    indice = IndiceAutocomplete(ttl=300, clock=clock)
+    geracao = indice.geracao
+
+    # a leitura do banco começou antes desta escrita e não a contém
+    indice.registrar(1, "Produto Novo")
+    indice.carregar([], geracao)
+
+    assert indice.precisa_carregar()
@@ -0,0 +1,57 @@
+from app.infrastructure.cache.bloom import BloomFilter, FiltrosClientes
+
+
+def test_sem_falsos_negativos():
+    filtro = BloomFilter(capacidade=1000, taxa_fp=0.01)
+    valores = [f"{i:011d}" for i in range(1000)]
+
+    for valor in valores:
+        filtro.add(valor)
+
+    assert all(valor in filtro for valor in valores)
+    assert filtro.tamanho == 1000
+
+
+def test_taxa_de_falsos_positivos_proxima_da_configurada():
+    filtro = BloomFilter(capacidade=1000, taxa_fp=0.01)
+
+    for i in range(1000):
+        filtro.add(f"presente-{i}")
+
+    falsos = sum(f"ausente-{i}" in filtro for i in range(10000))
+
+    assert falsos < 300
+
+
+def test_suspeitos_sem_carga_nao_afirma_ausencia():
+    filtros = FiltrosClientes(capacidade=100, taxa_fp=0.01)
+
+    assert filtros.suspeitos(cpf="12345678901") is None
+
+
+def test_suspeitos_apos_carga():
+    filtros = FiltrosClientes(capacidade=100, taxa_fp=0.01)
+    filtros.carregar([("12345678901", "a@example.com"), ("10987654321", None)])
+
+    assert filtros.suspeitos(cpf="12345678901", email="a@example.com") == {"cpf", "email"}
+    assert filtros.suspeitos(cpf="10987654321", email="b@example.com") == {"cpf"}
+    assert filtros.suspeitos(cpf="00000000000", email=None) == set()
+
+
+def test_escrita_durante_a_carga_nao_se_perde():
+    filtros = FiltrosClientes(capacidade=100, taxa_fp=0.01)
+
+    def chaves():
+        yield ("12345678901", "a@example.com")
+        filtros.adicionar(cpf="10987654321", email="b@example.com")
+
+    filtros.carregar(chaves())
+
+    assert filtros.suspeitos(cpf="10987654321", email="b@example.com") == {"cpf", "email"}
+
+
+def test_desligado_nao_afirma_ausencia():
+    filtros = FiltrosClientes(capacidade=100, taxa_fp=0.01, enabled=False)
+    filtros.carregar([("12345678901", "a@example.com")])
+
+    assert filtros.suspeitos(cpf="12345678901") is None
@@ -0,0 +1,150 @@
+import pytest
+from types import SimpleNamespace
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.utils.busca import normalizar, termos
+from app.adapters.utils.paginacao import encode_cursor_posicao, decode_cursor_posicao
+from app.dao import produto_busca
+from app.dao.produto_busca import query_busca, IndicesBusca, busca_no_banco
+from app.infrastructure.cache.busca_produtos import IndiceBuscaProdutos
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def indice(clock):
+    indice = IndiceBuscaProdutos(ttl=60, similaridade_minima=0.3, clock=clock)
+    indice.carregar([
+        (1, "Misto Quente", "Pão de forma com presunto e queijo"),
+        (2, "Queijo Quente", "Pão com queijo derretido"),
+        (3, "Café com Leite", "Copo 300ml"),
+    ], versao=1)
+
+    return indice
+
+
+def test_normalizar_remove_acentos_e_caixa():
+    assert normalizar("Pão de Açúcar") == "pao de acucar"
+    assert termos("Café com Leite") == ["cafe", "leite"]
+
+
+def test_nome_pesa_mais_que_descricao(indice):
+    assert indice.buscar("queijo") == [2, 1]
+
+
+def test_prefixo_e_erro_de_digitacao(indice):
+    assert indice.buscar("caf") == [3]
+    assert indice.buscar("quejo") == [2, 1]
+    assert indice.buscar("pizza") == []
+
+
+def test_recarga_por_versao_e_ttl(indice, clock):
+    assert not indice.precisa_carregar(1)
+    assert indice.precisa_carregar(2)
+
+    clock.agora += 60
+
+    assert indice.precisa_carregar(1)
+
+
+def test_indice_vazio_precisa_carregar(clock):
+    assert IndiceBuscaProdutos(ttl=60, similaridade_minima=0.3, clock=clock).precisa_carregar(0)
+
+
+def test_cursor_de_posicao():
+    assert decode_cursor_posicao(encode_cursor_posicao(40)) == 40
+    assert decode_cursor_posicao(None) == 0
+
+    with pytest.raises(ValueError):
+        decode_cursor_posicao(encode_cursor_posicao(-1))
+
+
+def test_query_postgres_usa_as_expressoes_dos_indices():
+    sql = str(query_busca("pao", 10, 0).compile(dialect=postgresql.dialect()))
+
+    # a configuração é literal para casar com a expressão do índice GIN mesmo com parâmetros no servidor
+    assert "to_tsvector('portuguese_unaccent'::regconfig, produto.nome)" in sql
+    assert "websearch_to_tsquery('portuguese_unaccent'::regconfig" in sql
+    assert "<%% f_unaccent(lower(produto.nome))" in sql
+    assert "ORDER BY ts_rank_cd(" in sql
+
+
+class FakeSessionPostgres:
+    def __init__(self, prontos):
+        self.prontos = prontos
+        self.consultas = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def execute(self, consulta):
+        self.consultas += 1
+
+        return SimpleNamespace(scalar=lambda: self.prontos)
+
+
+def test_indices_reconferidos_depois_do_boot(monkeypatch, clock):
+    monkeypatch.setattr(produto_busca, "indices_busca", IndicesBusca(intervalo=60, clock=clock))
+    db = FakeSessionPostgres(prontos=False)
+
+    assert not busca_no_banco(db)
+
+    # índices criados pelo comando de deploy depois que o worker subiu
+    db.prontos = True
+
+    assert not busca_no_banco(db)
+    assert db.consultas == 1
+
+    clock.agora += 60
+
+    assert busca_no_banco(db)
+    assert db.consultas == 2
+
+
+class FakeConexao:
+    def __init__(self, invalidos):
+        self.invalidos = invalidos
+        self.ddl = []
+
+    def execute(self, consulta, parametros=None):
+        if consulta is produto_busca.CONSULTA_INDICE_INVALIDO:
+            return SimpleNamespace(scalar=lambda: parametros["nome"] in self.invalidos)
+
+        return SimpleNamespace(scalar=lambda: True)
+
+    def exec_driver_sql(self, sql):
+        self.ddl.append(sql)
+
+
+def test_preparar_refaz_indice_invalido():
+    conexao = FakeConexao(invalidos={"ix_produto_nome_trgm"})
+    class Contexto:
+        def __enter__(self):
+            return conexao
+
+        def __exit__(self, *args):
+            return False
+
+    engine = SimpleNamespace(connect=lambda: SimpleNamespace(execution_options=lambda **_: Contexto()))
+
+    assert produto_busca.preparar(engine)
+
+    drop = conexao.ddl.index("DROP INDEX CONCURRENTLY IF EXISTS ix_produto_nome_trgm")
+
+    assert conexao.ddl[drop + 1] == produto_busca.INDICES_BUSCA["ix_produto_nome_trgm"]
+    assert not any("ix_produto_busca_tsv" in ddl and ddl.startswith("DROP") for ddl in conexao.ddl)
+
+
+def test_prontidao_exige_indices_validos():
+    assert "indisvalid" in str(produto_busca.CONSULTA_INDICES)
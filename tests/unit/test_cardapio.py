@@ -0,0 +1,85 @@
+import gzip
+
+from app.adapters.utils.compressao import IDENTIDADE, brotli, codificacoes_aceitas, escolher_codificacao
+from app.infrastructure.cache.cardapio import CardapioCache
+from app.infrastructure.metrics import metrics
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_codificacoes_aceitas_le_os_pesos():
+    assert codificacoes_aceitas("gzip;q=0.5, br, identity;q=0") == {"gzip": 0.5, "br": 1.0, "identity": 0.0}
+
+
+def test_escolhe_o_maior_peso_e_desempata_pela_ordem_do_servidor():
+    disponiveis = {"br": b"", "gzip": b"", IDENTIDADE: b""}
+
+    assert escolher_codificacao("gzip;q=1, br;q=0.5", disponiveis) == "gzip"
+    assert escolher_codificacao("gzip, br", disponiveis) == "br"
+    assert escolher_codificacao("*", disponiveis) == "br"
+
+
+def test_sem_accept_encoding_ou_sem_variante_aceita_usa_identity():
+    disponiveis = {"gzip": b"", IDENTIDADE: b""}
+
+    assert escolher_codificacao(None, disponiveis) == IDENTIDADE
+    assert escolher_codificacao("br", disponiveis) == IDENTIDADE
+    assert escolher_codificacao("gzip;q=0", disponiveis) == IDENTIDADE
+
+
+def test_publicar_monta_as_variantes_do_mesmo_corpo():
+    cache = CardapioCache(ttl=60, gzip_nivel=9, brotli_qualidade=11)
+    corpo = b'{"status":"sucess","data":[]}' * 50
+
+    snapshot = cache.publicar(corpo, versao=3)
+
+    assert cache.atual is snapshot
+    assert snapshot.variantes[IDENTIDADE] == corpo
+    assert gzip.decompress(snapshot.variantes["gzip"]) == corpo
+    assert ("br" in snapshot.variantes) == (brotli is not None)
+    assert list(snapshot.variantes)[-1] == IDENTIDADE
+    assert metrics.get("cardapio.bytes", codificacao=IDENTIDADE) == len(corpo)
+
+
+def test_gzip_deterministico_e_etag_pelo_conteudo():
+    cache = CardapioCache(ttl=60, gzip_nivel=9, brotli_qualidade=11)
+
+    primeiro = cache.publicar(b'{"a":1}', versao=1)
+    segundo = cache.publicar(b'{"a":1}', versao=2)
+
+    assert primeiro.variantes["gzip"] == segundo.variantes["gzip"]
+    assert primeiro.etag == segundo.etag
+    assert cache.publicar(b'{"a":2}', versao=3).etag != primeiro.etag
+
+
+def test_precisa_reconstruir_por_versao_ou_ttl():
+    relogio = Relogio()
+    cache = CardapioCache(ttl=60, gzip_nivel=1, brotli_qualidade=1, clock=relogio)
+
+    assert cache.precisa_reconstruir(0)
+
+    cache.publicar(b"{}", versao=5)
+
+    assert not cache.precisa_reconstruir(5)
+    assert cache.precisa_reconstruir(6)
+
+    relogio.agora = 60
+
+    assert cache.precisa_reconstruir(5)
+
+
+def test_uma_reconstrucao_por_vez():
+    cache = CardapioCache(ttl=60, gzip_nivel=1, brotli_qualidade=1)
+
+    assert cache.iniciar_reconstrucao()
+    assert not cache.iniciar_reconstrucao()
+
+    cache.concluir_reconstrucao()
+
+    assert cache.iniciar_reconstrucao()
@@ -0,0 +1,50 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.dao.produto_dao import ProdutoDAO
+from app.infrastructure.cache.catalogo_versao import CatalogoVersao, catalogo_versao
+from app.infrastructure.db.database import Base
+from app.models import CategoriaProduto
+
+
+def test_etag_muda_ao_incrementar():
+    versao = CatalogoVersao(janela=0)
+    etag = versao.etag()
+
+    versao.incrementar()
+
+    assert versao.etag() != etag
+    assert versao.etag().startswith('"') and versao.etag().endswith('"')
+
+
+def test_etag_muda_ao_trocar_de_janela():
+    agora = [0.0]
+    versao = CatalogoVersao(janela=60, clock=lambda: agora[0])
+    etag = versao.etag()
+
+    agora[0] = 59
+    assert versao.etag() == etag
+
+    agora[0] = 60
+    assert versao.etag() != etag
+
+
+def test_escritas_do_dao_incrementam_a_versao():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(CategoriaProduto(id=1, nome="Lanche"))
+    db.commit()
+
+    dao = ProdutoDAO(db)
+    inicial = catalogo_versao.versao
+
+    produto = dao.criar_produto(SimpleNamespace(nome="X", descricao="d", preco="10", categoria=1))
+    dao.atualizar_produto(produto.id, SimpleNamespace(nome="Y", descricao="d", preco="11", categoria=1))
+    dao.deletar_produto(produto.id)
+
+    assert catalogo_versao.versao == inicial + 3
+
+    db.close()
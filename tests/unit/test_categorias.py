@@ -0,0 +1,42 @@
+from app.infrastructure.cache.categorias import RegistroCategorias
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_registro_vazio_precisa_carregar():
+    registro = RegistroCategorias(ttl=60, recarga_minima=5, clock=FakeClock())
+
+    assert registro.precisa_carregar()
+    assert registro.nome(1) is None
+
+
+def test_registro_expira_pelo_ttl():
+    clock = FakeClock()
+    registro = RegistroCategorias(ttl=60, recarga_minima=5, clock=clock)
+    registro.substituir({1: "Lanche", 2: "Bebida"})
+
+    assert not registro.precisa_carregar({1, 2})
+    assert registro.buscar({1, 3}) == {1: "Lanche"}
+
+    clock.agora = 60
+
+    assert registro.precisa_carregar()
+
+
+def test_id_desconhecido_recarrega_no_maximo_a_cada_intervalo():
+    clock = FakeClock()
+    registro = RegistroCategorias(ttl=60, recarga_minima=5, clock=clock)
+    registro.substituir({1: "Lanche"})
+
+    assert not registro.precisa_carregar({99})
+
+    clock.agora = 5
+
+    assert registro.precisa_carregar({99})
+    assert not registro.precisa_carregar({1})
@@ -64,6 +64,31 @@ def test_buscar_por_cpf_not_found(gateway, mock_dao):
     mock_dao.buscar_por_cpf.assert_called_once_with("12345678901")
 
 
+def test_buscar_por_cpf_usa_cache(gateway, mock_dao, cliente_model):
+    mock_dao.buscar_por_cpf.return_value = cliente_model
+
+    gateway.buscar_por_cpf("12345678901")
+    result = gateway.buscar_por_cpf("12345678901")
+
+    assert result == cliente_model
+    mock_dao.buscar_por_cpf.assert_called_once_with("12345678901")
+
+
+def test_buscar_por_cpf_cache_negativo_invalidado_na_criacao(gateway, mock_dao, cliente_model):
+    mock_dao.buscar_por_cpf.return_value = None
+    mock_dao.criar_cliente.return_value = cliente_model
+
+    assert gateway.buscar_por_cpf("12345678901") is None
+    assert gateway.buscar_por_cpf("12345678901") is None
+    assert mock_dao.buscar_por_cpf.call_count == 1
+
+    gateway.criar_cliente(cliente_model)
+    mock_dao.buscar_por_cpf.return_value = cliente_model
+
+    assert gateway.buscar_por_cpf("12345678901") == cliente_model
+    assert mock_dao.buscar_por_cpf.call_count == 2
+
+
 # --------------------------------------------------------------
 # buscar_por_id
 # --------------------------------------------------------------
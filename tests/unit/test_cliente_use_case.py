@@ -1,15 +1,18 @@
 import pytest
 from unittest.mock import Mock
 
-from app.use_cases.cliente_use_case import ClienteUseCase
+from app.use_cases.cliente_use_case import ClienteUseCase, ClienteDuplicadoError
 from app.entities.cliente.models import Cliente
 from app.adapters.schemas.cliente import ClienteResponseSchema
 from app.adapters.dto.cliente_dto import ClienteCreateSchema, ClienteUpdateSchema
+from app.adapters.utils.paginacao import encode_cursor, decode_cursor
 
 
 @pytest.fixture
 def mock_entity():
-    return Mock()
+    entity = Mock()
+    entity.conflitos.return_value = set()
+    return entity
 
 
 @pytest.fixture
@@ -50,6 +53,18 @@ def test_criar_cliente(use_case, mock_entity, cliente_model):
     mock_entity.criar_cliente.assert_called_once_with(cliente=dto)
 
 
+def test_criar_cliente_duplicado(use_case, mock_entity):
+    dto = ClienteCreateSchema(nome="João Silva", email="joao@example.com", cpf="12345678901")
+    mock_entity.conflitos.return_value = {"email", "cpf"}
+
+    with pytest.raises(ClienteDuplicadoError) as erro:
+        use_case.criar_cliente(dto)
+
+    assert erro.value.campos == ["cpf", "email"]
+    mock_entity.conflitos.assert_called_once_with(cpf="12345678901", email="joao@example.com")
+    mock_entity.criar_cliente.assert_not_called()
+
+
 # ------------------------------------------------------
 # buscar_cliente_por_cpf
 # ------------------------------------------------------
@@ -69,6 +84,21 @@ def test_buscar_cliente_por_cpf_nao_encontrado(use_case, mock_entity):
         use_case.buscar_cliente_por_cpf("12345678901")
 
 
+def test_buscar_cliente_por_cpf_normaliza_mascara(use_case, mock_entity, cliente_model):
+    mock_entity.buscar_por_cpf.return_value = cliente_model
+
+    use_case.buscar_cliente_por_cpf("123.456.789-01")
+
+    mock_entity.buscar_por_cpf.assert_called_once_with(cpf_cliente="12345678901")
+
+
+def test_buscar_cliente_por_cpf_malformado_nao_consulta(use_case, mock_entity):
+    with pytest.raises(ValueError, match="Cliente não encontrado"):
+        use_case.buscar_cliente_por_cpf("1234")
+
+    mock_entity.buscar_por_cpf.assert_not_called()
+
+
 # ------------------------------------------------------
 # buscar_cliente_por_id
 # ------------------------------------------------------
@@ -102,13 +132,46 @@ def test_listar_clientes(use_case, mock_entity, cliente_model):
     mock_entity.listar_todos.assert_called_once()
 
 
+# ------------------------------------------------------
+# listar_pagina
+# ------------------------------------------------------
+def test_listar_pagina_retorna_cursor_quando_ha_mais_itens(use_case, mock_entity):
+    clientes = []
+    for id in (1, 2, 3):
+        cliente = Cliente(nome="Cliente", email=f"c{id}@example.com", telefone=None, cpf=f"0000000000{id}")
+        cliente.id = id
+        clientes.append(cliente)
+
+    mock_entity.listar_todos.return_value = clientes
+
+    result, proximo_cursor = use_case.listar_pagina(limite=2)
+
+    mock_entity.listar_todos.assert_called_once_with(limite=3, apos_id=None)
+    assert [c.id for c in result] == [1, 2]
+    assert decode_cursor(proximo_cursor) == 2
+
+
+def test_listar_pagina_ultima_pagina_sem_cursor(use_case, mock_entity, cliente_model):
+    mock_entity.listar_todos.return_value = [cliente_model]
+
+    result, proximo_cursor = use_case.listar_pagina(limite=2, cursor=encode_cursor(0))
+
+    mock_entity.listar_todos.assert_called_once_with(limite=3, apos_id=0)
+    assert len(result) == 1
+    assert proximo_cursor is None
+
+
+def test_listar_pagina_cursor_invalido(use_case, mock_entity):
+    with pytest.raises(ValueError, match="Cursor inválido"):
+        use_case.listar_pagina(limite=2, cursor="nao-e-um-cursor")
+
+    mock_entity.listar_todos.assert_not_called()
+
+
 # ------------------------------------------------------
 # atualizar_cliente
 # ------------------------------------------------------
 def test_atualizar_cliente_sucesso(use_case, mock_entity, cliente_model):
-    # buscar_cliente_por_id first
-    mock_entity.buscar_por_id.return_value = cliente_model
-
     updated = Cliente(
         nome="João Atualizado",
         email="joao2@example.com",
@@ -124,12 +187,12 @@ def test_atualizar_cliente_sucesso(use_case, mock_entity, cliente_model):
     result = use_case.atualizar_cliente(1, dto)
 
     assert result.nome == "João Atualizado"
-    mock_entity.buscar_por_id.assert_called_once_with(id=1)
+    mock_entity.buscar_por_id.assert_not_called()
     mock_entity.atualizar_cliente.assert_called_once_with(id=1, cliente=dto)
 
 
 def test_atualizar_cliente_nao_encontrado(use_case, mock_entity):
-    mock_entity.buscar_por_id.return_value = None
+    mock_entity.atualizar_cliente.return_value = None
 
     with pytest.raises(ValueError, match="Cliente não encontrado"):
         use_case.atualizar_cliente(1, ClienteUpdateSchema(nome="Teste"))
@@ -142,3 +205,18 @@ def test_deletar_cliente(use_case, mock_entity):
     use_case.deletar_cliente(1)
 
     mock_entity.deletar_cliente.assert_called_once_with(id=1)
+
+
+def test_atualizar_parcial_envia_somente_campos_informados(use_case, mock_entity, cliente_model):
+    mock_entity.atualizar_parcial.return_value = cliente_model
+
+    use_case.atualizar_parcial(1, ClienteUpdateSchema(nome="Novo Nome", telefone=None))
+
+    mock_entity.atualizar_parcial.assert_called_once_with(id=1, campos={"nome": "Novo Nome", "telefone": None})
+
+
+def test_atualizar_parcial_nao_encontrado(use_case, mock_entity):
+    mock_entity.atualizar_parcial.return_value = None
+
+    with pytest.raises(ValueError, match="Cliente não encontrado"):
+        use_case.atualizar_parcial(999, ClienteUpdateSchema(nome="Novo Nome"))
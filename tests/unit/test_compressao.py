@@ -0,0 +1,192 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.adapters.utils.compressao import CompressorGzip, codificacoes_disponiveis
+from app.infrastructure import config
+from app.infrastructure.api.compressao import CompressaoMiddleware, ler_regras, nivel, tipo_compressivel
+from app.infrastructure.metrics import metrics
+
+GRANDE = [{"id": i, "nome": f"Produto {i}"} for i in range(200)]
+
+
+async def grande(request):
+    return JSONResponse(GRANDE, headers={"ETag": '"v1"'})
+
+
+async def pequeno(request):
+    return JSONResponse({"ok": True})
+
+
+async def imagem(request):
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def pre_comprimido(request):
+    return Response(gzip.compress(b"{}" * 1000), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+
+async def export(request):
+    async def linhas():
+        for item in GRANDE:
+            yield json.dumps(item).encode() + b"\n"
+
+    return StreamingResponse(linhas(), media_type="application/x-ndjson")
+
+
+@pytest.fixture(autouse=True)
+def limpar_metricas():
+    metrics.reset()
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[
+        Route("/grande", grande),
+        Route("/pequeno", pequeno),
+        Route("/imagem", imagem),
+        Route("/pre", pre_comprimido),
+        Route("/produtos/export", export),
+    ])
+    app.add_middleware(CompressaoMiddleware)
+
+    return TestClient(app)
+
+
+def bruto(client, caminho, accept_encoding="gzip"):
+    with client.stream("GET", caminho, headers={"Accept-Encoding": accept_encoding}) as r:
+        return r, list(r.iter_raw())
+
+
+def test_resposta_grande_comprimida(client):
+    r, partes = bruto(client, "/grande")
+    corpo = b"".join(partes)
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert int(r.headers["content-length"]) == len(corpo)
+    assert json.loads(gzip.decompress(corpo)) == GRANDE
+    assert r.headers["etag"] == 'W/"v1"'
+
+
+def test_resposta_pequena_sai_como_esta(client):
+    r = client.get("/pequeno", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in r.headers
+    assert r.json() == {"ok": True}
+    assert metrics.get("compressao.ignoradas", motivo="tamanho") == 1
+
+
+def test_tipo_fora_da_lista_nao_e_comprimido(client):
+    r = client.get("/imagem", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in r.headers
+    assert "vary" not in r.headers
+
+
+def test_resposta_ja_codificada_nao_e_tocada(client):
+    r, partes = bruto(client, "/pre")
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(b"".join(partes)) == b"{}" * 1000
+
+
+def test_sem_accept_encoding_envia_identity(client):
+    r, partes = bruto(client, "/grande", accept_encoding="identity")
+
+    assert "content-encoding" not in r.headers
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert json.loads(b"".join(partes)) == GRANDE
+
+
+def test_ndjson_comprimido_parte_a_parte(client):
+    r, partes = bruto(client, "/produtos/export")
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert "content-length" not in r.headers
+
+    # cada parte recebida já descomprime nas linhas enviadas até ali
+    descompressor = zlib.decompressobj(31)
+    linhas = b""
+
+    for parte in partes[:-1]:
+        linhas += descompressor.decompress(parte)
+        assert linhas.endswith(b"\n")
+
+    linhas += descompressor.decompress(partes[-1]) + descompressor.flush()
+
+    assert [json.loads(linha) for linha in linhas.splitlines()] == GRANDE
+
+
+def test_metricas_de_bytes_e_cpu(client):
+    r, partes = bruto(client, "/grande")
+    enviados = len(b"".join(partes))
+    originais = len(gzip.decompress(b"".join(partes)))
+
+    assert metrics.get("compressao.bytes_enviados", codificacao="gzip") == enviados
+    assert metrics.get("compressao.bytes_economizados", codificacao="gzip") == originais - enviados
+    assert metrics.timing("compressao.cpu_segundos", codificacao="gzip")["count"] == 1
+
+
+def test_nivel_por_rota():
+    assert nivel("GET", "/produtos/export", "gzip") == 1
+    assert nivel("GET", "/clientes/export", "br") == 1
+    assert nivel("GET", "/produtos/", "gzip") == config.COMPRESSAO_GZIP_NIVEL
+
+
+def test_nivel_por_rota_vem_da_configuracao(monkeypatch):
+    monkeypatch.setattr(config, "COMPRESSAO_NIVEIS_ROTAS", "GET ^/produtos/menu$=9; get /export$=2")
+
+    assert nivel("GET", "/produtos/menu", "gzip") == 9
+    assert nivel("GET", "/clientes/export", "zstd") == 2
+    assert nivel("POST", "/produtos/menu", "gzip") == config.COMPRESSAO_GZIP_NIVEL
+    assert nivel("GET", "/produtos/", "br") == config.COMPRESSAO_BROTLI_QUALIDADE
+
+
+def test_nivel_configurado_e_usado_na_resposta(client, monkeypatch):
+    from app.infrastructure.api import compressao
+
+    usados = []
+    original = compressao.compressor
+
+    def espiao(codificacao, nivel_usado):
+        usados.append((codificacao, nivel_usado))
+
+        return original(codificacao, nivel_usado)
+
+    monkeypatch.setattr(compressao, "compressor", espiao)
+    monkeypatch.setattr(config, "COMPRESSAO_NIVEIS_ROTAS", "GET ^/grande$=9")
+    r, partes = bruto(client, "/grande")
+
+    assert json.loads(gzip.decompress(b"".join(partes))) == GRANDE
+    assert usados == [("gzip", 9)]
+
+
+def test_regra_de_compressao_invalida():
+    with pytest.raises(ValueError):
+        ler_regras("/export$")
+
+    assert ler_regras("") == ()
+
+
+def test_tipo_compressivel_ignora_parametros():
+    assert tipo_compressivel("application/json; charset=utf-8")
+    assert not tipo_compressivel("image/png")
+    assert not tipo_compressivel(None)
+
+
+def test_gzip_sempre_disponivel_e_por_ultimo():
+    assert codificacoes_disponiveis()[-1] == "gzip"
+
+
+def test_compressor_gzip_incremental():
+    compressor = CompressorGzip(6)
+    dados = compressor.parte(b"a" * 100) + compressor.parte(b"b" * 100) + compressor.fim()
+
+    assert gzip.decompress(dados) == b"a" * 100 + b"b" * 100
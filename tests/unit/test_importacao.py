@@ -0,0 +1,31 @@
+import io
+import pytest
+
+from app.adapters.utils.importacao import CsvStream, detectar_formato, ler_registros
+
+
+def test_detectar_formato():
+    assert detectar_formato("text/csv; charset=utf-8") == "csv"
+    assert detectar_formato("application/x-ndjson") == "ndjson"
+    assert detectar_formato(nome_arquivo="clientes.jsonl") == "ndjson"
+
+    with pytest.raises(ValueError):
+        detectar_formato("application/xml")
+
+
+def test_ler_registros_csv_converte_vazio_em_none():
+    arquivo = io.BytesIO("\ufeffnome,telefone\nAna,\n".encode("utf-8"))
+
+    assert list(ler_registros(arquivo, "csv")) == [(2, {"nome": "Ana", "telefone": None}, None)]
+
+
+def test_csv_stream_entrega_o_csv_em_pedacos():
+    registros = [{"linha": i, "nome": f'Nome "{i}", filho'} for i in range(3)]
+    stream = CsvStream(registros, ("linha", "nome"))
+
+    pedacos = []
+    while pedaco := stream.read(7):
+        pedacos.append(pedaco)
+
+    assert all(len(pedaco) <= 7 for pedaco in pedacos)
+    assert "".join(pedacos).splitlines() == [f'{i},"Nome ""{i}"", filho"' for i in range(3)]
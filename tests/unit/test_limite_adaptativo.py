@@ -0,0 +1,99 @@
+import pytest
+
+from app.infrastructure.api.limite_concorrencia import LimiteAdaptativo, prioridade, CRITICA, NORMAL, BAIXA
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limite(clock):
+    return LimiteAdaptativo(inicial=4, minimo=2, maximo=8, latencia_alvo=0.1, fator_reducao=0.5, clock=clock)
+
+
+@pytest.mark.parametrize("metodo, caminho, esperado", [
+    ("GET", "/produtos/", CRITICA),
+    ("GET", "/produtos/categoria/1", CRITICA),
+    ("GET", "/clientes/cpf/12345678901", CRITICA),
+    ("GET", "/produtos/export", BAIXA),
+    ("POST", "/clientes/", NORMAL),
+    ("GET", "/clientes/", NORMAL),
+    ("POST", "/produtos/", BAIXA),
+    ("PUT", "/clientes/1", BAIXA),
+    ("POST", "/clientes/import", BAIXA),
+    ("GET", "/health/pool", None),
+])
+def test_prioridade(metodo, caminho, esperado):
+    assert prioridade(metodo, caminho) == esperado
+
+
+def test_recusa_acima_do_limite(limite):
+    assert all(limite.entrar() for _ in range(4))
+    assert not limite.entrar()
+
+
+def test_prioridade_baixa_usa_fracao_do_limite(limite):
+    assert limite.entrar(0.5)
+    assert limite.entrar(0.5)
+    assert not limite.entrar(0.5)
+    assert limite.entrar(1.0)
+
+
+def test_latencia_alta_reduz_uma_vez_por_janela(limite, clock):
+    for _ in range(3):
+        limite.entrar()
+
+    limite.sair(0.5)
+    limite.sair(0.5)
+
+    assert limite.limite == 2
+
+    clock.agora = 1
+    limite.sair(0.5)
+
+    assert limite.limite == 2
+
+
+def test_latencia_baixa_com_limite_em_uso_aumenta(limite):
+    for _ in range(4):
+        limite.entrar()
+
+    limite.sair(0.01)
+
+    assert limite.limite == pytest.approx(4.25)
+
+
+def test_ocioso_nao_aumenta(limite):
+    limite.entrar()
+    limite.sair(0.01)
+
+    assert limite.limite == 4
+
+
+def test_limite_nunca_passa_do_maximo(limite):
+    for _ in range(200):
+        for _ in range(4):
+            limite.entrar()
+        for _ in range(4):
+            limite.sair(0.01)
+
+    assert limite.limite == 8
+
+
+def test_saida_sem_amostra_so_libera_a_vaga(limite):
+    assert limite.entrar()
+
+    limite.sair(latencia=1.0, sobrecarga=True, amostra=False)
+
+    assert limite.limite == 4
+    assert limite.em_andamento == 0
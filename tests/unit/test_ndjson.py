@@ -0,0 +1,22 @@
+import pytest
+
+from app.adapters.utils.ndjson import ndjson_chunks, ndjson_chunks_async
+
+
+def test_ndjson_chunks_agrupa_linhas():
+    linhas = (f"{i}\n" for i in range(5))
+
+    chunks = list(ndjson_chunks(linhas, linhas_por_chunk=2))
+
+    assert chunks == [b"0\n1\n", b"2\n3\n", b"4\n"]
+
+
+@pytest.mark.anyio
+async def test_ndjson_chunks_async_agrupa_linhas():
+    async def linhas():
+        for i in range(3):
+            yield f"{i}\n"
+
+    chunks = [chunk async for chunk in ndjson_chunks_async(linhas(), linhas_por_chunk=2)]
+
+    assert chunks == [b"0\n1\n", b"2\n"]
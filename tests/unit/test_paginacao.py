@@ -0,0 +1,31 @@
+import pytest
+
+from app.infrastructure import config
+from app.adapters.utils.paginacao import encode_cursor, decode_cursor, tamanho_pagina
+
+
+def test_cursor_ida_e_volta():
+    cursor = encode_cursor(42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == 42
+
+
+def test_cursor_vazio():
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "eyJ4IjoxfQ", encode_cursor("1"), "bnVsbA"])
+def test_cursor_invalido(cursor):
+    with pytest.raises(ValueError, match="Cursor inválido"):
+        decode_cursor(cursor)
+
+
+def test_tamanho_pagina_respeita_limites(monkeypatch):
+    monkeypatch.setattr(config, "PAGINACAO_LIMITE_PADRAO", 50)
+    monkeypatch.setattr(config, "PAGINACAO_LIMITE_MAXIMO", 200)
+
+    assert tamanho_pagina(None) == 50
+    assert tamanho_pagina(10) == 10
+    assert tamanho_pagina(10_000) == 200
@@ -0,0 +1,81 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure import config
+from app.infrastructure.api.prazo import prazo
+from app.infrastructure.db.statement_timeout import prazo_request, aplicar_statement_timeout, PrazoEsgotadoError
+
+
+class FakeConnection:
+    def __init__(self, dialeto):
+        self.dialect = SimpleNamespace(name=dialeto)
+        self.executados = []
+
+    def exec_driver_sql(self, sql):
+        self.executados.append(sql)
+
+
+@pytest.fixture
+def prazo_definido():
+    tokens = []
+    yield lambda segundos: tokens.append(prazo_request.set(time.monotonic() + segundos))
+
+    for token in reversed(tokens):
+        prazo_request.reset(token)
+
+
+@pytest.mark.parametrize("metodo, caminho, esperado", [
+    ("GET", "/clientes/cpf/12345678901", config.PRAZO_LEITURA_TOTEM),
+    ("GET", "/produtos/export", config.PRAZO_EXPORT),
+    ("GET", "/clientes/export", config.PRAZO_EXPORT),
+    ("POST", "/clientes/import", config.PRAZO_IMPORTACAO),
+    ("GET", "/produtos/", config.PRAZO_PADRAO),
+    ("PUT", "/produtos/1", config.PRAZO_PADRAO),
+    ("GET", "/health/pool", 0),
+])
+def test_prazo_por_rota(metodo, caminho, esperado):
+    assert prazo(metodo, caminho) == esperado
+
+
+def test_prazo_le_a_configuracao_atual(monkeypatch):
+    monkeypatch.setattr(config, "PRAZO_LEITURA_TOTEM", 0.5)
+
+    assert prazo("GET", "/clientes/cpf/12345678901") == 0.5
+
+
+def test_statement_timeout_usa_o_restante_do_prazo(prazo_definido):
+    prazo_definido(2)
+    conexao = FakeConnection("postgresql")
+
+    aplicar_statement_timeout(None, None, conexao)
+
+    assert len(conexao.executados) == 1
+    sql = conexao.executados[0]
+    assert sql.startswith("SET LOCAL statement_timeout = ")
+    assert 1900 <= int(sql.rsplit(" ", 1)[1]) <= 2000
+
+
+def test_statement_timeout_sem_prazo_nao_executa_nada():
+    conexao = FakeConnection("postgresql")
+
+    aplicar_statement_timeout(None, None, conexao)
+
+    assert conexao.executados == []
+
+
+def test_statement_timeout_ignora_outros_bancos(prazo_definido):
+    prazo_definido(2)
+    conexao = FakeConnection("sqlite")
+
+    aplicar_statement_timeout(None, None, conexao)
+
+    assert conexao.executados == []
+
+
+def test_statement_timeout_com_prazo_esgotado_nao_abre_transacao(prazo_definido):
+    prazo_definido(-1)
+
+    with pytest.raises(PrazoEsgotadoError):
+        aplicar_statement_timeout(None, None, FakeConnection("postgresql"))
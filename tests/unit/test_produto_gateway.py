@@ -5,6 +5,7 @@ from app.gateways.produto_gateway import ProdutoGateway
 from app.dao.produto_dao import ProdutoDAO
 from app.models.produto import Produto
 from app.adapters.enums.categoria_produto import CategoriaProdutoEnum
+from app.infrastructure.cache.categorias import registro_categorias
 
 
 @pytest.fixture
@@ -24,6 +25,8 @@ def gateway(mock_db, monkeypatch):
 
     gateway = ProdutoGateway(db_session=mock_db)
     gateway.dao = mock_dao
+    # equivalente à carga feita no startup
+    registro_categorias.substituir({int(c.value): c.name for c in CategoriaProdutoEnum})
 
     return gateway
 
@@ -95,3 +98,85 @@ def test_deletar_produto(gateway):
 
     gateway.dao.deletar_produto.assert_called_once_with(1)
     assert result is None
+
+
+def test_listar_todos_usa_cache_do_catalogo(gateway):
+    produtos = [Produto(id=1, nome="A", preco=10.00, categoria=1)]
+
+    gateway.dao.listar_todos.return_value = produtos
+
+    assert gateway.listar_todos() == produtos
+    assert gateway.listar_todos() == produtos
+
+    gateway.dao.listar_todos.assert_called_once()
+
+
+def test_buscar_por_id_usa_cache_do_catalogo(gateway):
+    produto = Produto(id=1, nome="Teste", preco=15, categoria=1)
+
+    gateway.dao.buscar_por_id.return_value = produto
+
+    gateway.buscar_por_id(1)
+    result = gateway.buscar_por_id(1)
+
+    gateway.dao.buscar_por_id.assert_called_once_with(1)
+    assert result == produto
+
+
+def test_criar_produto_invalida_listas_do_catalogo(gateway):
+    gateway.dao.listar_todos.return_value = []
+    gateway.dao.listar_por_categoria.return_value = []
+    gateway.dao.criar_produto.return_value = Produto(id=2, nome="Novo", preco=10, categoria=1)
+
+    gateway.listar_todos()
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Lanche)
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Bebida)
+    gateway.criar_produto(Produto(nome="Novo", preco=10, categoria=1))
+    gateway.listar_todos()
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Lanche)
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Bebida)
+
+    assert gateway.dao.listar_todos.call_count == 2
+    # só a categoria do produto criado é recarregada
+    assert [c.args[0] for c in gateway.dao.listar_por_categoria.call_args_list] == [
+        CategoriaProdutoEnum.Lanche, CategoriaProdutoEnum.Bebida, CategoriaProdutoEnum.Lanche
+    ]
+
+
+def test_atualizar_produto_invalida_entradas_que_contem_o_produto(gateway):
+    produto = Produto(id=1, nome="A", preco=10, categoria=1)
+
+    gateway.dao.buscar_por_id.return_value = produto
+    gateway.dao.listar_por_categoria.return_value = [produto]
+    gateway.dao.atualizar_produto.return_value = produto
+
+    gateway.buscar_por_id(1)
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Lanche)
+    gateway.atualizar_produto(1, Produto(nome="B", preco=12, categoria=3))
+    gateway.buscar_por_id(1)
+    gateway.listar_por_categoria(CategoriaProdutoEnum.Lanche)
+
+    assert gateway.dao.buscar_por_id.call_count == 2
+    assert gateway.dao.listar_por_categoria.call_count == 2
+
+
+def test_deletar_produto_invalida_cache(gateway):
+    gateway.dao.buscar_por_id.return_value = Produto(id=1, nome="A", preco=10, categoria=1)
+
+    gateway.buscar_por_id(1)
+    gateway.deletar_produto(1)
+    gateway.dao.buscar_por_id.return_value = None
+
+    assert gateway.buscar_por_id(1) is None
+
+
+def test_cache_desligado_vai_sempre_ao_dao(gateway, monkeypatch):
+    from app.infrastructure.cache.catalogo import catalogo_cache
+
+    monkeypatch.setattr(catalogo_cache, "enabled", False)
+    gateway.dao.listar_todos.return_value = []
+
+    gateway.listar_todos()
+    gateway.listar_todos()
+
+    assert gateway.dao.listar_todos.call_count == 2
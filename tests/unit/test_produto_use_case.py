@@ -429,4 +429,36 @@ class TestProdutoUseCaseIntegration:
         # Delete
         mock_entity.deletar_produto.return_value = None
         result_delete = use_case.deletar_produto(1)
-        assert result_delete is None
\ No newline at end of file
+        assert result_delete is None
+
+class TestCriarLote:
+
+    def test_criar_lote_consulta_categorias_uma_vez(self, use_case, mock_entity, mock_produto_model):
+        mock_entity.categorias.return_value = {1: "Lanche"}
+        mock_entity.criar_produtos.return_value = [mock_produto_model]
+
+        result, erros = use_case.criar_lote([{"nome": "Hamburguer", "preco": "1.00", "categoria": 1}])
+
+        assert erros == []
+        assert result[0].id == 5
+        mock_entity.categorias.assert_called_once_with({1})
+        assert mock_entity.criar_produtos.call_args[0][0][0].nome == "Hamburguer"
+
+    def test_criar_lote_sem_parcial_rejeita_o_lote_inteiro(self, use_case, mock_entity):
+        from app.use_cases.produto_use_case import LoteInvalidoError
+        mock_entity.categorias.return_value = {1: "Lanche"}
+
+        with pytest.raises(LoteInvalidoError) as exc:
+            use_case.criar_lote([{"nome": "Hamburguer", "preco": "1.00", "categoria": 1}, {"nome": "X"}])
+
+        assert [erro["index"] for erro in exc.value.erros] == [1]
+        mock_entity.criar_produtos.assert_not_called()
+
+    def test_criar_lote_parcial_sem_itens_validos_nao_insere(self, use_case, mock_entity):
+        mock_entity.categorias.return_value = {}
+
+        result, erros = use_case.criar_lote([{"nome": "Hamburguer", "preco": "1.00", "categoria": 7}], parcial=True)
+
+        assert result == []
+        assert "Categoria 7" in erros[0]["message"]
+        mock_entity.criar_produtos.assert_not_called()
@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure import config
+from app.infrastructure.db.replica import EstadoReplica, COOKIE_LEITURA_PRIMARIO, ler, usar_replica, estado_replica
+from app.infrastructure.metrics import metrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 100.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def estado(clock, monkeypatch):
+    monkeypatch.setattr(config, "REPLICA_LAG_MAXIMO", 2)
+    monkeypatch.setattr(config, "REPLICA_VERIFICACAO", 5)
+    monkeypatch.setattr(config, "REPLICA_PAUSA_FALHA", 30)
+    monkeypatch.setattr(config, "REPLICA_JANELA_LEITURA_PROPRIA", 5)
+
+    return EstadoReplica(clock=clock)
+
+
+@pytest.fixture(autouse=True)
+def limpar():
+    metrics.reset()
+    estado_replica.limpar()
+    yield
+    estado_replica.limpar()
+
+
+def test_replica_com_falha_fica_fora_pela_pausa(estado, clock):
+    estado.registrar_falha()
+
+    assert not estado.disponivel()
+
+    clock.agora += 30
+
+    assert estado.disponivel()
+
+
+def test_replica_atrasada_fica_fora_ate_nova_medida(estado):
+    estado.registrar_lag(3.5)
+
+    assert not estado.disponivel()
+
+    estado.registrar_lag(0.4)
+
+    assert estado.disponivel()
+
+
+def test_escrita_de_um_cliente_nao_tira_os_outros_da_replica():
+    # read-your-writes é só do cliente que escreveu (cookie), não do processo
+    assert usar_replica({COOKIE_LEITURA_PRIMARIO: "1"}) is False
+    assert usar_replica({}) is True
+
+
+def test_atraso_e_medido_uma_vez_por_intervalo(estado, clock):
+    assert estado.precisa_verificar()
+    assert not estado.precisa_verificar()
+
+    clock.agora += 5
+
+    assert estado.precisa_verificar()
+
+
+def test_cookie_de_escrita_recente_ignora_a_replica():
+    assert usar_replica({})
+    assert not usar_replica({COOKIE_LEITURA_PRIMARIO: "1"})
+
+
+def test_ler_usa_a_replica_quando_existe(monkeypatch):
+    monkeypatch.setattr(config, "DATABASE_REPLICA_URL", "postgresql://replica/lanchonete")
+
+    assert ler("primario", "replica", lambda dao: dao) == "replica"
+    assert ler("primario", None, lambda dao: dao) == "primario"
+    assert metrics.get("db.replica.leituras", destino="replica") == 1
+    assert metrics.get("db.replica.leituras", destino="primario") == 1
+
+
+def test_ler_volta_ao_primario_se_a_replica_cair():
+    def operacao(dao):
+        if dao == "replica":
+            raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+        return dao
+
+    assert ler("primario", "replica", operacao) == "primario"
+    assert not estado_replica.disponivel()
+    assert metrics.get("db.replica.falhas") == 1
+
+
+def test_erro_que_nao_e_do_banco_nao_e_mascarado():
+    def operacao(dao):
+        raise ValueError("bug")
+
+    with pytest.raises(ValueError):
+        ler("primario", "replica", operacao)
+
+    assert estado_replica.disponivel()
@@ -0,0 +1,91 @@
+import pytest
+
+from app.infrastructure import config
+from app.infrastructure import servidor
+from app.infrastructure.servidor import cota_cpu, numero_workers, opcoes_gunicorn
+
+
+@pytest.fixture
+def cgroup(tmp_path):
+    return tmp_path
+
+
+def escrever(raiz, caminho, conteudo):
+    arquivo = raiz / caminho
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    arquivo.write_text(conteudo)
+
+
+def test_cota_cgroup_v2(cgroup):
+    escrever(cgroup, "cpu.max", "300000 100000\n")
+
+    assert cota_cpu(cgroup) == 3
+
+
+def test_cgroup_v2_sem_limite(cgroup):
+    escrever(cgroup, "cpu.max", "max 100000\n")
+
+    assert cota_cpu(cgroup) is None
+
+
+def test_cota_cgroup_v1(cgroup):
+    escrever(cgroup, "cpu/cpu.cfs_quota_us", "150000\n")
+    escrever(cgroup, "cpu/cpu.cfs_period_us", "100000\n")
+
+    assert cota_cpu(cgroup) == 1.5
+
+
+def test_cgroup_v1_sem_limite(cgroup):
+    escrever(cgroup, "cpu/cpu.cfs_quota_us", "-1\n")
+    escrever(cgroup, "cpu/cpu.cfs_period_us", "100000\n")
+
+    assert cota_cpu(cgroup) is None
+
+
+def test_sem_cgroup(cgroup):
+    assert cota_cpu(cgroup) is None
+
+
+def test_cota_fracionaria_ainda_tem_um_worker(cgroup, monkeypatch):
+    monkeypatch.setattr(config, "SERVIDOR_WORKERS", 0)
+    escrever(cgroup, "cpu.max", "30000 100000\n")
+
+    assert numero_workers(cgroup) == 1
+
+
+def test_workers_por_cpu_arredonda_para_cima(cgroup, monkeypatch):
+    monkeypatch.setattr(config, "SERVIDOR_WORKERS", 0)
+    monkeypatch.setattr(config, "SERVIDOR_WORKERS_POR_CPU", 2)
+    monkeypatch.setattr(servidor.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+    escrever(cgroup, "cpu.max", "150000 100000\n")
+
+    assert numero_workers(cgroup) == 3
+
+
+def test_sem_cota_usa_as_cpus_da_maquina(cgroup, monkeypatch):
+    monkeypatch.setattr(config, "SERVIDOR_WORKERS", 0)
+    monkeypatch.setattr(servidor.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+
+    assert numero_workers(cgroup) == 2
+
+
+def test_workers_explicitos_ignoram_o_cgroup(cgroup, monkeypatch):
+    monkeypatch.setattr(config, "SERVIDOR_WORKERS", 6)
+    escrever(cgroup, "cpu.max", "30000 100000\n")
+
+    assert numero_workers(cgroup) == 6
+
+
+def test_opcoes_gunicorn_fazem_preload_e_descartam_pools_apos_fork(monkeypatch):
+    monkeypatch.setattr(config, "SERVIDOR_KEEPALIVE", 15)
+    descartados = []
+    monkeypatch.setattr("app.infrastructure.db.database.descartar_pools_herdados", lambda: descartados.append(True))
+
+    opcoes = opcoes_gunicorn(workers=2)
+    opcoes["post_fork"](None, None)
+
+    assert opcoes["preload_app"] is True
+    assert opcoes["workers"] == 2
+    assert opcoes["worker_class"] == "uvicorn_worker.UvicornWorker"
+    assert opcoes["keepalive"] == 15
+    assert descartados == [True]
@@ -0,0 +1,123 @@
+import pytest
+
+from app.infrastructure.cache.ttl_cache import TTLCache, MISSING
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TTLCache(nome="teste", maxsize=2, ttl=10, clock=clock)
+
+
+def test_get_conta_hit_e_miss(cache):
+    assert cache.get("a") is MISSING
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_guarda_valor_none(cache):
+    cache.set("a", None)
+
+    assert cache.get("a") is None
+
+
+def test_expira_apos_ttl(cache, clock):
+    cache.set("a", 1)
+    clock.agora = 10
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_ttl_por_entrada(cache, clock):
+    cache.set("a", 1)
+    cache.set("b", None, ttl=2)
+    clock.agora = 2
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+
+
+def test_stats_hit_rate(cache):
+    assert cache.stats()["hit_rate"] == 0.0
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.get("c")
+
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_remove_o_menos_usado_ao_passar_do_limite(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_tag_remove_somente_entradas_marcadas(cache):
+    cache.set("lista", [1, 2], tags={"produto:1", "produto:2"})
+    cache.set("outro", [3], tags={"produto:3"})
+
+    cache.invalidate_tag("produto:2")
+
+    assert cache.get("lista") is MISSING
+    assert cache.get("outro") == [3]
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_set_descarta_valor_carregado_antes_de_invalidacao(cache):
+    geracao = cache.geracao
+    cache.invalidate_tag("produto:1")
+
+    cache.set("a", "obsoleto", geracao=geracao)
+
+    assert cache.get("a") is MISSING
+
+
+def test_cache_desligado_nao_guarda(clock):
+    cache = TTLCache(nome="teste", maxsize=2, ttl=10, enabled=False, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["misses"] == 0
+
+
+def test_ttl_apos_invalidacao_encurta_o_que_vem_da_replica(cache, clock):
+    assert cache.ttl_apos_invalidacao(5) is None
+
+    cache.invalidate_tag("produto:1")
+    clock.agora += 2
+
+    assert cache.ttl_apos_invalidacao(5) == 3
+    assert cache.ttl_apos_invalidacao(5, ttl=1) == 1
+
+    cache.set("a", "linha antiga", ttl=cache.ttl_apos_invalidacao(5))
+    clock.agora += 3
+
+    assert cache.get("a") is MISSING
+    assert cache.ttl_apos_invalidacao(5) is None